@@ -14,10 +14,11 @@ import numpy as np
 import numpy.linalg as la
 import numpy.typing as npt
 
-from wayland import SharedMemory
 from wayland.client import ClientConnection
-from wayland.protocol.wayland import WlBuffer, WlCompositor, WlShm, WlSurface
+from wayland.frame import FrameScheduler
+from wayland.protocol.wayland import WlCompositor, WlShm, WlSurface
 from wayland.protocol.xdg_shell import XdgSurface, XdgToplevel, XdgWmBase
+from wayland.shm import ShmSwapchain
 
 COLOR_SIZE = 4  # WlShm.Format.XRGB8888
 INT32_MAX = (1 << 31) - 1
@@ -29,9 +30,7 @@ class Window:
         "_wl_surf",
         "_xdg_surf",
         "_xdg_toplevel",
-        "_buf_mem",
-        "_buf_index",
-        "_bufs",
+        "_swapchain",
         "_width",
         "_height",
         "_is_closed",
@@ -40,7 +39,6 @@ class Window:
     def __init__(self, conn: ClientConnection) -> None:
         self._conn: ClientConnection = conn
         self._is_closed: bool = False
-        self._buf_index = 0
         wl_compositor = conn.get_global(WlCompositor)
         xdg_wm_base = conn.get_global(XdgWmBase)
 
@@ -52,11 +50,16 @@ class Window:
         self._xdg_toplevel.on_configure(self._on_tolevel_configure)
         self._wl_surf.commit()
 
-        self._width: int = 0
-        self._height: int = 0
-        self._buf_mem: SharedMemory | None = None
-        self._bufs: list[WlBuffer] = []
-        self.resize(640, 480)
+        self._width: int = 640
+        self._height: int = 480
+        self._swapchain = ShmSwapchain(
+            conn.get_global(WlShm),
+            self._width,
+            self._height,
+            WlShm.Format.XRGB8888,
+            COLOR_SIZE,
+        )
+        self.draw()
 
     def resize(self, width: int, height: int) -> bool:
         if width <= 0 or height <= 0:
@@ -65,31 +68,7 @@ class Window:
             return False
         self._width = width
         self._height = height
-
-        # free buffers
-        if self._buf_mem:
-            self._buf_mem.close()
-        for buf in self._bufs:
-            buf.destroy()
-        self._bufs.clear()
-
-        # allocate buffers
-        count = 2
-        size = self._width * self._height * COLOR_SIZE
-        self._buf_mem = SharedMemory(size * count)
-        wl_shm = self._conn.get_global(WlShm)
-        with wl_shm.create_pool(self._buf_mem, size * count) as pool:
-            for index in range(count):
-                buf = pool.create_buffer(
-                    size * index,
-                    self._width,
-                    self._height,
-                    self._width * COLOR_SIZE,
-                    WlShm.Format.XRGB8888,
-                )
-                self._bufs.append(buf)
-                buf.on_release(self._on_buf_release(index))
-        self._buf_index = 0
+        self._swapchain.resize(width, height)
         self.draw()
         return True
 
@@ -106,12 +85,11 @@ class Window:
 
     async def animate(self) -> None:
         await self._conn.sync()  # wait for first xdg_sruface.configure
-        now: int | None = None
-        while not self._is_closed and not self._conn.is_terminated:
-            frame = self._wl_surf.frame()
-            self.draw(now)
+        async for now in FrameScheduler(self._wl_surf):
+            if self._is_closed or self._conn.is_terminated:
+                break
+            self.draw(now or None)
             self._wl_surf.commit()
-            now = await frame
 
     def on_close(self, handler: Callable[[], None]) -> None:
         @self._xdg_toplevel.on_close
@@ -125,39 +103,26 @@ class Window:
         if is_closed:
             return
 
-        if self._buf_mem:
-            self._buf_mem.close()
-            self._buf_mem = None
-        for buf in self._bufs:
-            buf.destroy()
-        self._bufs.clear()
-
+        self._swapchain.close()
         self._xdg_toplevel.destroy()
         self._xdg_surf.destroy()
         self._wl_surf.destroy()
 
     def draw(self, now: int | None = None) -> None:
-        size = self._width * self._height * COLOR_SIZE
-        if self._buf_mem is None or not self._bufs:
+        if self._is_closed:
             return
-        buf = self._bufs[self._buf_index]
-        image: npt.NDArray[np.uint8] = np.ndarray(
-            shape=(self._height, self._width, COLOR_SIZE),
-            dtype=np.uint8,
-            buffer=self._buf_mem.buf,
-            offset=size * self._buf_index,
-        )
-        self._buf_index = (self._buf_index + 1) % len(self._bufs)
-        self.render(image, now)
-        self._wl_surf.attach(buf, 0, 0)
-        self._wl_surf.damage_buffer(0, 0, self._width, self._height)
-
-    def _on_buf_release(self, index: int) -> Callable[[], bool]:
-        def _on_buf_release() -> bool:
-            self._buf_index = index
-            return True
-
-        return _on_buf_release
+        buffer = self._swapchain.acquire()
+        if buffer is None:
+            return  # all buffers are still used by the compositor
+        with buffer.data as data:
+            image: npt.NDArray[np.uint8] = np.ndarray(
+                shape=(self._height, self._width, COLOR_SIZE),
+                dtype=np.uint8,
+                buffer=data,
+            )
+            self.render(image, now)
+            del image
+        self._swapchain.attach(self._wl_surf, buffer)
 
     def _on_tolevel_configure(self, width: int, height: int, _: bytes) -> bool:
         self.resize(width, height)
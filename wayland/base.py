@@ -4,21 +4,28 @@
 # pyright: reportPrivateUsage=false
 from __future__ import annotations
 
+import array
 import asyncio
+import fcntl
 import io
 import logging
 import os
 import secrets
 import socket
 import sys
+import threading
 from _posixshmem import shm_open, shm_unlink  # pyright: ignore[reportMissingModuleSource]
 from abc import ABC, abstractmethod
 from asyncio import Future
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from enum import Enum
+from importlib import import_module
+from itertools import islice
 from mmap import mmap
 from struct import Struct
+from struct import error as struct_error
 from typing import Any, ClassVar, NamedTuple, NewType, Self, cast, runtime_checkable
 from typing import Protocol as Proto
 from weakref import WeakSet
@@ -28,6 +35,11 @@ __all__ = [
     "Id",
     "OpCode",
     "Connection",
+    "ReadStats",
+    "ProxyTable",
+    "ProxyTypes",
+    "WriteBatch",
+    "EventQueue",
     "Arg",
     "ArgUInt",
     "ArgInt",
@@ -42,9 +54,13 @@ __all__ = [
     "WEvent",
     "WEnum",
     "Proxy",
+    "Subscription",
+    "EventOverflow",
+    "EventStream",
     "Protocol",
     "Fd",
     "FdFile",
+    "OwnedFd",
     "SharedMemory",
     "PROXIES",
 ]
@@ -52,34 +68,195 @@ __all__ = [
 Id = NewType("Id", int)
 OpCode = NewType("OpCode", int)
 type Fd = FdFile | int
+type Decoder = Callable[[Connection, memoryview | bytes, int, int], Sequence[Any]]
 MSG_HEADER = Struct("IHH")
-PROXIES: dict[str, type[Proxy]] = {}
+_UINT = Struct("I")
+READ_BUFF_SIZE = 4096  # initial size of the read buffer
+READ_BUFF_MAX = 1 << 20  # read buffer grows up to this size to fit bursts of events
+FDS_MAX = 28  # maximum number of descriptors per sendmsg (same as libwayland)
+READ_ANC_SIZE = socket.CMSG_SPACE(FDS_MAX * array.array("i").itemsize)
+WRITE_HIGH_WATER = 64 * 1024  # default high-water mark of the write queue in bytes
+WRITE_IOV_MAX = os.sysconf("SC_IOV_MAX") if "SC_IOV_MAX" in os.sysconf_names else 1024
+SERVER_ID_MIN = 0xFF000000  # ids allocated by the server start from this value
+HUGE_PAGE_SIZE = 2 << 20  # default huge page size on x86-64 and aarch64
+_NO_LOCK: AbstractContextManager[Any] = nullcontext()
+
+
+class ReadStats(NamedTuple):
+    """Statistics of the connection reader"""
+
+    syscalls: int  # number of recvmsg calls
+    bytes: int  # number of bytes received
+    fds: int  # number of file descriptors received
+    buffer_size: int  # current size of the read buffer
 
+    @property
+    def bytes_per_syscall(self) -> float:
+        return self.bytes / self.syscalls if self.syscalls else 0.0
+
+
+class ProxyTable:
+    """Proxies indexed by object id
+
+    Ids allocated by the client are small and dense, as freed ids are reused,
+    so they directly index a list. Ids allocated by the server are kept in a
+    dictionary. Hot paths index `_client` inline and fall back to `get` on
+    `IndexError`, which is cheaper than a dictionary lookup.
+    """
+
+    __slots__ = ["_client", "_server", "_count"]
+
+    def __init__(self) -> None:
+        self._client: list[Proxy | None] = [None]  # id 0 is the null object
+        self._server: dict[Id, Proxy] = {}
+        self._count = 0
+
+    def get(self, id: object) -> Proxy | None:
+        if not isinstance(id, int):
+            return None
+        if id < SERVER_ID_MIN:
+            client = self._client
+            return client[id] if id < len(client) else None
+        return self._server.get(Id(id))
+
+    def pop(self, id: int, default: Proxy | None = None) -> Proxy | None:
+        if id >= SERVER_ID_MIN:
+            proxy = self._server.pop(Id(id), None)
+        elif id < len(self._client):
+            proxy, self._client[id] = self._client[id], None
+        else:
+            proxy = None
+        if proxy is None:
+            return default
+        self._count -= 1
+        return proxy
+
+    def values(self) -> list[Proxy]:
+        proxies = [proxy for proxy in self._client if proxy is not None]
+        proxies.extend(self._server.values())
+        return proxies
+
+    def clear(self) -> None:
+        # list is cleared in place, as hot paths can hold a reference to it
+        self._client[:] = [None]
+        self._server.clear()
+        self._count = 0
+
+    def __getitem__(self, id: int) -> Proxy:
+        proxy = self.get(id)
+        if proxy is None:
+            raise KeyError(id)
+        return proxy
 
-class Message(NamedTuple):
-    """Wayland message"""
+    def __contains__(self, id: object) -> bool:
+        return self.get(id) is not None
+
+    def __setitem__(self, id: int, proxy: Proxy) -> None:
+        if id >= SERVER_ID_MIN:
+            if self._server.get(Id(id)) is None:
+                self._count += 1
+            self._server[Id(id)] = proxy
+            return
+        client = self._client
+        if id >= len(client):
+            client.extend([None] * (id + 1 - len(client)))
+        if client[id] is None:
+            self._count += 1
+        client[id] = proxy
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"ProxyTable(count={self._count}, capacity={len(self._client)})"
 
-    id: Id
-    opcode: OpCode
-    data: bytes
-    fds: list[Fd]
+
+class ProxyTypes:
+    """Proxy types indexed by interface name
+
+    Generated modules register proxy types when they are imported, and
+    `wayland.protocol` registers the module of every generated interface,
+    so `get` imports the module of an interface on the first lookup.
+    """
+
+    __slots__ = ["_types", "_modules"]
+
+    def __init__(self) -> None:
+        self._types: dict[str, type[Proxy]] = {}
+        self._modules: dict[str, str] = {}  # interface name to module name
+
+    def get(self, iface_name: str) -> type[Proxy] | None:
+        proxy_type = self._types.get(iface_name)
+        if proxy_type is not None:
+            return proxy_type
+        module = self._modules.get(iface_name)
+        if module is None:
+            return None
+        import_module(module)
+        return self._types.get(iface_name)
+
+    def register_modules(self, package: str, modules: dict[str, str]) -> None:
+        """Register modules relative to the package by interface name"""
+        for iface_name, module in modules.items():
+            self._modules[iface_name] = f"{package}{module}"
+
+    def __getitem__(self, iface_name: str) -> type[Proxy]:
+        proxy_type = self.get(iface_name)
+        if proxy_type is None:
+            raise KeyError(iface_name)
+        return proxy_type
+
+    def __setitem__(self, iface_name: str, proxy_type: type[Proxy]) -> None:
+        self._types[iface_name] = proxy_type
+
+    def __contains__(self, iface_name: object) -> bool:
+        if not isinstance(iface_name, str):
+            return False
+        return iface_name in self._types or iface_name in self._modules
+
+    def __repr__(self) -> str:
+        return f"ProxyTypes(loaded={len(self._types)}, known={len(self._modules)})"
+
+
+PROXIES = ProxyTypes()
 
 
 class Connection(ABC):
     """Base connection responsible for reading and writing messages"""
 
+    _loop: asyncio.AbstractEventLoop  # event loop is only known after `connect`
     __slots__ = [
         "_socket",
         "_loop",
+        "_loop_thread",
+        "_lock",
         "_is_terminated",
         "_is_server",
         "_on_terminated",
-        "_write_buff",
-        "_write_fds",
         "_write_queue",
+        "_write_lock",
+        "_write_offset",
+        "_write_fds_sent",
         "_write_done",
+        "_write_scheduled",
+        "_write_eager",
+        "_write_batch",
+        "_write_batch_local",
+        "_write_size",
+        "_write_high",
+        "_write_low",
+        "_write_drained",
         "_read_buff",
+        "_read_view",
+        "_read_start",
+        "_read_end",
         "_read_fds",
+        "_read_syscalls",
+        "_read_bytes",
+        "_read_fds_count",
+        "_read_queue",
+        "_read_paused",
+        "_queues",
         "_id_last",
         "_id_free",
         "_proxies",
@@ -87,49 +264,126 @@ class Connection(ABC):
         "_debug",
     ]
 
-    def __init__(self, debug: bool | None = None, is_server: bool = False) -> None:
+    def __init__(
+        self,
+        debug: bool | None = None,
+        is_server: bool = False,
+        eager_flush: bool = False,
+        thread_safe: bool = False,
+    ) -> None:
         self._socket: socket.socket | None = None
-        self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
         self._is_terminated: bool = False
         self._is_server: bool = is_server
         self._on_terminated: asyncio.Event = asyncio.Event()
         self._debug: bool = bool(os.getenv("WAYLAND_DEBUG")) if debug is None else debug
 
-        self._write_fds: list[Fd] = []
-        self._write_buff: bytearray = bytearray()
-        self._write_queue: deque[Message] = deque()
+        # thread-safe mode is opt-in, in default mode locks are `None` and
+        # the connection must only be used from the loop thread. `_lock` guards
+        # id allocation, proxy table and proxy handlers, `_write_lock` guards
+        # the write queue and is reentrant, so proxy creation and its request
+        # can be submitted atomically with `_request_scope`
+        self._lock: threading.Lock | None = None
+        self._write_lock: threading.RLock | None = None
+        if thread_safe:
+            self._lock = threading.Lock()
+            self._write_lock = threading.RLock()
+        self._loop_thread: int | None = None
+
+        # queue of message chunks and descriptors that must be sent along with them,
+        # first `_write_offset` bytes of the first chunk have already been sent, and
+        # descriptors of the first `_write_fds_sent` chunks have already been sent
+        self._write_queue: deque[tuple[bytes, Sequence[Fd]]] = deque()
+        self._write_offset: int = 0
+        self._write_fds_sent: int = 0
         self._write_done: asyncio.Event = asyncio.Event()
         self._write_done.set()
-
-        self._read_fds: deque[Fd] = deque()
-        self._read_buff: bytearray = bytearray()
+        # writer is either registered with the loop or scheduled with `call_soon`
+        self._write_scheduled: bool = False
+        # eager mode sends messages at the end of the current callbacks batch,
+        # and only waits for the socket to become writable on EAGAIN
+        self._write_eager: bool = eager_flush
+        # depth of nested `batch` scopes, writer is not armed inside a batch,
+        # in thread-safe mode depth is tracked per thread, so a batch only
+        # holds back the writer for requests of its own thread
+        self._write_batch: int = 0
+        self._write_batch_local: _BatchDepth | None = None
+        if thread_safe:
+            self._write_batch_local = _BatchDepth()
+        # size of the write queue in bytes, `drain` blocks producers once it goes
+        # above high-water mark until it gets back to low-water mark
+        self._write_size: int = 0
+        self._write_high: int = WRITE_HIGH_WATER
+        self._write_low: int = WRITE_HIGH_WATER // 4
+        self._write_drained: asyncio.Event = asyncio.Event()
+        self._write_drained.set()
+
+        # read buffer contains unconsumed data in `[_read_start, _read_end)` range
+        # received descriptors are wrapped with `OwnedFd` only when decoded
+        self._read_fds: deque[int] = deque()
+        self._read_buff: bytearray = bytearray(READ_BUFF_SIZE)
+        self._read_view: memoryview = memoryview(self._read_buff)
+        self._read_start: int = 0
+        self._read_end: int = 0
+        self._read_syscalls: int = 0
+        self._read_bytes: int = 0
+        self._read_fds_count: int = 0
+        # queue of the proxy whose event is being decoded, proxies created
+        # by the event are assigned to the same queue
+        self._read_queue: EventQueue | None = None
+        # number of event streams that have paused reading due to backpressure
+        self._read_paused: int = 0
+        self._queues: dict[str, EventQueue] = {}
 
         self._id_last: Id = Id(0)
         self._id_free: list[Id] = []
-        self._proxies: dict[Id, Proxy] = {}  # all known proxies
+        self._proxies: ProxyTable = ProxyTable()  # all known proxies
 
     def create_proxy[P: Proxy](self, proxy_type: type[P]) -> P:
         """Create proxy by proxy type"""
         if self._is_terminated:
             raise RuntimeError("connection has already been terminated")
-        id = self._id_alloc()
-        proxy = proxy_type(id, self)
-        self._proxies[id] = proxy
-        return proxy
+        with self._lock or _NO_LOCK:
+            id = self._id_alloc()
+            proxy = proxy_type(id, self)
+            self._proxies[id] = proxy
+            return proxy
 
     def create_proxy_by_interface(self, interface: Interface) -> Proxy:
         """Create new proxy object"""
         if self._is_terminated:
             raise RuntimeError("connection has already been terminated")
-        id = self._id_alloc()
-        proxy = Proxy(id, self, interface)
-        self._proxies[id] = proxy
-        return proxy
+        with self._lock or _NO_LOCK:
+            id = self._id_alloc()
+            proxy = Proxy(id, self, interface)
+            self._proxies[id] = proxy
+            return proxy
+
+    @property
+    def is_thread_safe(self) -> bool:
+        """Whether requests can be submitted from any thread
+
+        In thread-safe mode proxies can be created, requests submitted and
+        handlers registered from any thread, handlers are still called on
+        the thread reading the connection. Requests creating new objects
+        must be submitted within `_request_scope`, which generated methods
+        already do, as server expects new ids to arrive in order.
+        """
+        return self._lock is not None
 
     @property
     def is_terminated(self) -> bool:
         return self._is_terminated
 
+    @property
+    def read_stats(self) -> ReadStats:
+        """Statistics of the incoming data"""
+        return ReadStats(
+            syscalls=self._read_syscalls,
+            bytes=self._read_bytes,
+            fds=self._read_fds_count,
+            buffer_size=len(self._read_buff),
+        )
+
     async def on_terminated(self) -> None:
         try:
             await self._on_terminated.wait()
@@ -148,13 +402,20 @@ class Connection(ABC):
         self._reader_disable()
         if self._socket is not None:
             self._socket.close()
+        while self._read_fds:
+            os.close(self._read_fds.popleft())
 
         # detach all proxies
-        for proxy in self._proxies.values():
+        with self._lock or _NO_LOCK:
+            proxies = list(self._proxies.values())
+            self._proxies.clear()
+        for proxy in proxies:
             proxy._detach(msg if msg else "wayland connection terminated")
-        self._proxies.clear()
 
         # notify termination
+        for queue in self._queues.values():
+            queue._terminate()
+        self._write_drained.set()
         self._on_terminated.set()
 
     @abstractmethod
@@ -165,6 +426,8 @@ class Connection(ABC):
         """Start running wayland connection"""
         if self._socket is not None:
             raise RuntimeError("socket has already been set")
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
         self._socket = await self._create_socket()
         self._socket.setblocking(False)
         self._writer_enable()
@@ -175,6 +438,62 @@ class Connection(ABC):
         """Wait for all pending events to be send"""
         await self._write_done.wait()
 
+    async def drain(self) -> None:
+        """Wait until the write queue is below the high-water mark
+
+        Producers should await it periodically, once the queue goes above
+        high-water mark it blocks until the queue shrinks to low-water mark.
+        """
+        await self._write_drained.wait()
+        if self._is_terminated:
+            raise RuntimeError("connection has been terminated")
+
+    def get_write_buffer_size(self) -> int:
+        """Number of bytes queued for writing"""
+        return self._write_size
+
+    def get_write_buffer_limits(self) -> tuple[int, int]:
+        """Low and high water marks of the write queue"""
+        return self._write_low, self._write_high
+
+    def set_write_buffer_limits(
+        self,
+        high: int | None = None,
+        low: int | None = None,
+    ) -> None:
+        """Set high and low water marks of the write queue
+
+        If only high mark is given, low mark defaults to a quarter of it
+        """
+        if high is None:
+            high = WRITE_HIGH_WATER if low is None else 4 * low
+        if low is None:
+            low = high // 4
+        if not high >= low >= 0:
+            raise ValueError(f"high ({high}) must be >= low ({low}) must be >= 0")
+        self._write_high, self._write_low = high, low
+        self._write_size_update(0)
+
+    def event_queue(self, name: str) -> EventQueue:
+        """Get or create named event queue
+
+        Events of proxies assigned to the queue with `Proxy.set_queue` are
+        only dispatched when the queue is drained, proxies without a queue
+        are dispatched as soon as their events are received.
+        """
+        queue = self._queues.get(name)
+        if queue is None:
+            queue = self._queues[name] = EventQueue(self, name)
+        return queue
+
+    def batch(self) -> WriteBatch:
+        """Batch submitted requests and write them on exit with a single sendmsg
+
+        Can be used both as `with conn.batch():` and `async with conn.batch():`,
+        async variant also waits for all messages to be written on exit.
+        """
+        return WriteBatch(self)
+
     async def __aenter__(self) -> Self:
         return await self.connect()
 
@@ -187,59 +506,140 @@ class Connection(ABC):
         if self._is_terminated:
             raise RuntimeError("connection has beend terminated")
         self._write_done.clear()
-        if self._socket is not None:
+        if self._socket is None or self._write_scheduled or self._write_batched():
+            return
+        self._write_scheduled = True
+        if self._write_lock is not None and threading.get_ident() != self._loop_thread:
+            self._loop.call_soon_threadsafe(self._writer_schedule)
+        elif self._write_eager:
+            self._loop.call_soon(self._writer_eager)
+        else:
             self._loop.add_writer(self._socket, self._writer)
 
+    def _writer_schedule(self) -> None:
+        """Register writer requested by another thread"""
+        if self._write_scheduled and self._socket is not None:
+            if not self._is_terminated:
+                self._loop.add_writer(self._socket, self._writer)
+
     def _writer_disable(self) -> None:
         if self._socket is not None:
             self._loop.remove_writer(self._socket)
+        self._write_scheduled = False
         self._write_done.set()
 
+    def _writer_eager(self) -> None:
+        """Try to write pending messages without waiting for the socket"""
+        self._writer()
+        if self._write_queue and self._socket is not None and not self._is_terminated:
+            self._loop.add_writer(self._socket, self._writer)
+
     def _writer(self) -> None:
         """Write pending messages"""
+        if self._write_lock is None:
+            self._writer_send()
+        else:
+            with self._write_lock:
+                self._writer_send()
+
+    def _writer_send(self) -> None:
+        """Write pending messages, write lock must be held in thread-safe mode"""
         if self._is_terminated or self._socket is None:
             self._writer_disable()
             return
+        if self._write_batched():
+            # messages are going to be written on batch exit
+            self._writer_disable()
+            self._write_done.clear()
+            return
 
-        # pack queued messages
-        while self._write_queue:
-            message = self._write_queue.popleft()
-            self._write_buff.extend(
-                MSG_HEADER.pack(
-                    message.id,
-                    message.opcode,
-                    MSG_HEADER.size + len(message.data),
-                )
-            )
-            self._write_buff.extend(message.data)
-            self._write_fds.extend(message.fds)
-
-        # send messages
-        offset = 0
+        queue = self._write_queue
         try:
-            while offset < len(self._write_buff):
-                try:
-                    fds: list[int] = []
-                    for fd in self._write_fds:
-                        if isinstance(fd, FdFile):
-                            fds.append(fd.fileno())
-                        else:
-                            fds.append(fd)
-                    offset += socket.send_fds(
-                        self._socket, [self._write_buff[offset:]], fds
+            while queue:
+                # gather chunks, descriptors are limited per sendmsg and must
+                # not be sent later than the chunk they belong to
+                iov: list[bytes | memoryview] = []
+                fds: list[int] = []
+                for index, (data, data_fds) in enumerate(islice(queue, WRITE_IOV_MAX)):
+                    if data_fds and index >= self._write_fds_sent:
+                        if fds and len(fds) + len(data_fds) > FDS_MAX:
+                            break
+                        for fd in data_fds:
+                            fds.append(fd.fileno() if isinstance(fd, FdFile) else fd)
+                    if index == 0 and self._write_offset:
+                        iov.append(memoryview(data)[self._write_offset :])
+                    else:
+                        iov.append(data)
+                ancdata: list[tuple[int, int, array.array[int]]] = []
+                if fds:
+                    ancdata.append(
+                        (socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))
                     )
-                    self._write_fds.clear()
+                try:
+                    sent = self._socket.sendmsg(iov, ancdata)
                 except BlockingIOError:
                     break
+                self._write_fds_sent = max(self._write_fds_sent, len(iov))
+                self._write_size_update(-sent)
+
+                # consume sent chunks
+                while sent:
+                    data, _ = queue[0]
+                    remaining = len(data) - self._write_offset
+                    if sent < remaining:
+                        self._write_offset += sent
+                        break
+                    sent -= remaining
+                    queue.popleft()
+                    self._write_offset = 0
+                    self._write_fds_sent -= 1
         except Exception:
             error_msg = "failed to write to wayland socket"
             logging.exception(error_msg)
             self.terminate(error_msg)
         finally:
-            self._write_buff = self._write_buff[offset:]
-            if not self._write_buff and not self._write_queue:
+            if not queue:
                 self._writer_disable()
 
+    def _write_batched(self) -> bool:
+        """Whether the current thread is inside a `batch` scope"""
+        local = self._write_batch_local
+        if local is None:
+            return self._write_batch > 0
+        return local.depth > 0
+
+    def _batch_enter(self) -> None:
+        local = self._write_batch_local
+        if local is None:
+            self._write_batch += 1
+        else:
+            local.depth += 1
+
+    def _batch_exit(self) -> None:
+        """Write messages queued during the batch"""
+        local = self._write_batch_local
+        if local is None:
+            self._write_batch -= 1
+            if self._write_batch:
+                return
+        else:
+            local.depth -= 1
+            if local.depth:
+                return
+            if threading.get_ident() != self._loop_thread:
+                # writer can only be driven from the loop thread
+                if self._socket is not None and not self._is_terminated:
+                    self._loop.call_soon_threadsafe(self._batch_flush)
+                return
+        self._batch_flush()
+
+    def _batch_flush(self) -> None:
+        if not self._write_queue or self._is_terminated or self._socket is None:
+            return
+        self._writer()
+        if self._write_queue and not self._is_terminated:
+            self._writer_enable()
+
     def _reader_enable(self) -> None:
         if self._is_terminated:
             raise RuntimeError("connection has beend terminated")
@@ -256,16 +656,24 @@ class Connection(ABC):
             self._reader_disable()
             return
 
-        # reading data
         close = False
-        while True:
+        burst = 0  # bytes received by this call
+        while not self._is_terminated and not self._read_paused:
+            free = len(self._read_buff) - self._read_end
             try:
-                data, fds, _, _ = socket.recv_fds(self._socket, 4096, 32)
-                if not data:
+                self._read_syscalls += 1
+                size, ancdata, flags, _ = self._socket.recvmsg_into(
+                    [self._read_view[self._read_end :]],
+                    READ_ANC_SIZE,
+                    socket.MSG_CMSG_CLOEXEC,
+                )
+                if not size:
                     close = True
                     break
-                self._read_fds.extend(open(fd, "w+b") for fd in fds)
-                self._read_buff.extend(data)
+                if ancdata:
+                    fds = _ancdata_fds(ancdata, flags)
+                    self._read_fds.extend(fds)
+                    self._read_fds_count += len(fds)
             except BlockingIOError:
                 break
             except Exception:
@@ -273,35 +681,120 @@ class Connection(ABC):
                 logging.exception(error_msg)
                 self.terminate(error_msg)
                 return
+            self._read_bytes += size
+            self._read_end += size
+            burst += size
+            self._read_dispatch()
+            self._read_compact()
+            if size < free:
+                # short read, socket is most likely drained and if it is not
+                # the reader is going to be called again
+                break
 
-        while len(self._read_buff) >= MSG_HEADER.size:
-            # unpack message
-            id, opcode, size = MSG_HEADER.unpack(self._read_buff[: MSG_HEADER.size])
-            if len(self._read_buff) < size:
+        if close:
+            self.terminate("connection closed")
+        elif burst > len(self._read_buff) and not self._is_terminated:
+            # grow buffer so next burst of the same size is read at once
+            self._read_resize(min(READ_BUFF_MAX, 1 << (burst - 1).bit_length()))
+
+    def _read_dispatch(self) -> None:
+        """Decode and dispatch all complete messages in the read buffer"""
+        proxies = self._proxies._client
+        while not self._is_terminated and not self._read_paused:
+            # handlers can dispatch recursively (blocking connection roundtrip),
+            # which can move data and resize the buffer
+            buff, view = self._read_buff, self._read_view
+            start = self._read_start
+            available = self._read_end - start
+            if available < MSG_HEADER.size:
                 return
-            message = Message(
-                Id(id),
-                OpCode(opcode),
-                bytes(self._read_buff[MSG_HEADER.size : size]),
-                [],
-            )
-            # consume data and reset size
-            self._read_buff = self._read_buff[size:]
+            id, opcode, size = MSG_HEADER.unpack_from(buff, start)
+            if available < size:
+                return
+            if size < MSG_HEADER.size:
+                self.terminate(f"invalid message size {size}")
+                return
+            # consume message before dispatching, as handlers can re-enter
+            self._read_start = start + size
 
-            # dispatch event
-            proxy = self._proxies.get(message.id)
+            proxy: Proxy | None
+            try:
+                proxy = proxies[id]
+            except IndexError:
+                proxy = self._proxies.get(id)
             if proxy is None:
-                logging.error("unhandled message: %s", message)
+                logging.error("unhandled message: id=%s opcode=%s", id, opcode)
                 continue
-            args = proxy._interface.unpack(
-                self,
-                message.opcode,
-                message.data,
-            )
-            proxy._dispatch(opcode, args)
+            self._read_queue = queue = proxy._queue
+            decoder = proxy._interface.decoder(OpCode(opcode))
+            args = decoder(self, view, start + MSG_HEADER.size, start + size)
+            if queue is None:
+                proxy._dispatch(OpCode(opcode), args)
+            else:
+                queue._push(proxy, OpCode(opcode), args)
 
-        if close:
-            self.terminate("connection closed")
+    def _read_compact(self) -> None:
+        """Reclaim consumed space of the read buffer
+
+        Data is only moved when the end of the buffer has been reached,
+        buffer is grown if it cannot fit a single pending message.
+        """
+        start, end = self._read_start, self._read_end
+        if start == end:
+            self._read_start = self._read_end = 0
+            return
+        if end < len(self._read_buff):
+            return
+        pending = end - start
+        required = len(self._read_buff)
+        if pending >= MSG_HEADER.size:
+            _, _, size = MSG_HEADER.unpack_from(self._read_buff, start)
+            required = max(required, size)
+        if start == 0 or required > len(self._read_buff):
+            self._read_resize(max(required, 2 * len(self._read_buff)))
+        else:
+            self._read_buff[:pending] = self._read_view[start:end]
+            self._read_start, self._read_end = 0, pending
+
+    def _read_resize(self, size: int) -> None:
+        """Resize read buffer moving pending data to its start"""
+        if size <= len(self._read_buff):
+            return
+        start, end = self._read_start, self._read_end
+        buff = bytearray(size)
+        buff[: end - start] = self._read_view[start:end]
+        self._read_view.release()
+        self._read_buff, self._read_view = buff, memoryview(buff)
+        self._read_start, self._read_end = 0, end - start
+
+    def _read_pause(self) -> None:
+        """Stop reading and dispatching messages until `_read_resume`"""
+        self._read_paused += 1
+        if self._read_paused == 1 and not self._is_terminated:
+            self._reader_pause()
+
+    def _read_resume(self) -> None:
+        """Resume reading paused by `_read_pause`"""
+        self._read_paused -= 1
+        if not self._read_paused and not self._is_terminated:
+            self._reader_resume()
+
+    def _reader_pause(self) -> None:
+        """Stop reading from the socket, called once reading is paused"""
+        self._reader_disable()
+
+    def _reader_resume(self) -> None:
+        """Start reading from the socket, called once all pauses are released"""
+        # messages left in the buffer are dispatched outside of the caller
+        self._loop.call_soon(self._read_resumed)
+
+    def _read_resumed(self) -> None:
+        if self._read_paused or self._is_terminated:
+            return
+        self._read_dispatch()
+        self._read_compact()
+        if not self._read_paused and not self._is_terminated:
+            self._reader_enable()
 
     def _id_alloc(self) -> Id:
         if self._id_free:
@@ -309,10 +802,10 @@ class Connection(ABC):
         self._id_last = Id(self._id_last + 1)
         return self._id_last
 
-    def _fd_recv(self) -> Fd | None:
+    def _fd_recv(self) -> OwnedFd | None:
         """Pop next descriptor from file descriptor queue"""
         if self._read_fds:
-            return self._read_fds.popleft()
+            return OwnedFd(self._read_fds.popleft())
         return None
 
     def _new_id_recv(self, id: Id, iface_name: str) -> Proxy:
@@ -326,25 +819,218 @@ class Connection(ABC):
             proxy = Proxy(id, self, iface)
         else:
             proxy = proxy_type(id, self)
-        self._proxies[id] = proxy
+        with self._lock or _NO_LOCK:
+            self._proxies[id] = proxy
         proxy._is_attached = True
+        proxy._queue = self._read_queue
         return proxy
 
+    def _proxy_reuse(self, proxy: Proxy) -> None:
+        """Register deleted proxy object again under a newly allocated id
+
+        Avoids allocation of short-lived proxies created at high rate, such
+        as frame callbacks. Proxy must have been deleted by the server.
+        """
+        if self._is_terminated:
+            raise RuntimeError("connection has already been terminated")
+        if proxy._connection is not self or not proxy._is_detached:
+            raise ValueError(f"[{proxy}] only deleted proxy can be reused")
+        with self._lock or _NO_LOCK:
+            proxy._reset(self._id_alloc())
+            self._proxies[proxy._id] = proxy
+
     def _delete_proxy(self, target: Proxy | Id) -> None:
         """Delete proxy"""
         id = target._id if isinstance(target, Proxy) else target
-        proxy = self._proxies.pop(id, None)
+        with self._lock or _NO_LOCK:
+            proxy = self._proxies.pop(id, None)
+            self._id_free.append(id)
         if proxy is not None:
             proxy._detach("deleted by server")
-        self._id_free.append(id)
 
-    def _message_submit(self, message: Message) -> None:
-        """Submit message for writing"""
-        if message.id not in self._proxies:
+    def _request_scope(self) -> AbstractContextManager[Any]:
+        """Scope within which created proxy and its request are submitted atomically"""
+        return _NO_LOCK if self._write_lock is None else self._write_lock
+
+    def _message_submit(
+        self,
+        id: Id,
+        opcode: OpCode,
+        data: bytes,
+        fds: Sequence[Fd] = (),
+    ) -> None:
+        """Submit message for writing
+
+        Header and data are queued as separate chunks and are never copied
+        """
+        header = MSG_HEADER.pack(id, opcode, MSG_HEADER.size + len(data))
+        if self._write_lock is None:
+            self._message_enqueue(id, header, data, fds)
+        else:
+            with self._write_lock:
+                self._message_enqueue(id, header, data, fds)
+
+    def _message_submit_packed(self, id: Id, message: bytes) -> None:
+        """Submit message that has already been packed together with its header"""
+        if self._write_lock is None:
+            self._message_enqueue(id, message, b"", ())
+        else:
+            with self._write_lock:
+                self._message_enqueue(id, message, b"", ())
+
+    def _message_enqueue(
+        self,
+        id: Id,
+        header: bytes,
+        data: bytes,
+        fds: Sequence[Fd],
+    ) -> None:
+        """Append message to the write queue and arm the writer"""
+        try:
+            proxy = self._proxies._client[id]
+        except IndexError:
+            proxy = self._proxies.get(id)
+        if proxy is None:
             raise RuntimeError("object has already been deleted")
-        self._write_queue.append(message)
+        self._write_queue.append((header, fds))
+        if data:
+            self._write_queue.append((data, ()))
+        self._write_size += len(header) + len(data)
+        if self._write_size > self._write_high:
+            self._write_drained.clear()
         self._writer_enable()
 
+    def _write_size_update(self, delta: int) -> None:
+        """Update size of the write queue and water marks state"""
+        self._write_size += delta
+        if self._write_size > self._write_high:
+            self._write_drained.clear()
+        elif self._write_size <= self._write_low or self._is_terminated:
+            self._write_drained.set()
+
+
+def _ancdata_fds(ancdata: list[tuple[int, int, bytes]], flags: int) -> array.array[int]:
+    """Extract file descriptors from ancillary data returned by recvmsg"""
+    fds = array.array("i")
+    for level, type, data in ancdata:
+        if level == socket.SOL_SOCKET and type == socket.SCM_RIGHTS:
+            fds.frombytes(data[: len(data) - len(data) % fds.itemsize])
+    if flags & socket.MSG_CTRUNC:
+        for fd in fds:
+            os.close(fd)
+        raise RuntimeError("file descriptors have been truncated")
+    return fds
+
+
+class _BatchDepth(threading.local):
+    """Depth of nested `batch` scopes of the current thread"""
+
+    depth: int = 0
+
+
+class WriteBatch:
+    """Scope which batches requests submitted to the connection"""
+
+    __slots__ = ["_connection"]
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    def __enter__(self) -> Self:
+        self._connection._batch_enter()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self._connection._batch_exit()
+
+    async def __aenter__(self) -> Self:
+        return self.__enter__()
+
+    async def __aexit__(self, *_: Any) -> None:
+        self.__exit__()
+        await self._connection.flush()
+
+
+_QUEUE_DELETE = OpCode(-1)  # queued deletion of the proxy
+
+
+class EventQueue:
+    """Queue of events dispatched independently of other events
+
+    Events are decoded as soon as they are received, but their handlers are
+    only called when the queue is drained with `dispatch` or
+    `dispatch_pending`, which can happen on a different task or thread.
+    """
+
+    __slots__ = ["_connection", "_events", "_ready", "_ready_thread", "name"]
+
+    def __init__(self, connection: Connection, name: str) -> None:
+        self._connection = connection
+        self._events: deque[tuple[Proxy, OpCode, Sequence[Any]]] = deque()
+        self._ready = asyncio.Event()
+        self._ready_thread = threading.Event()
+        self.name = name
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def dispatch_pending(self) -> int:
+        """Dispatch all queued events, returns number of dispatched events"""
+        events = self._events
+        count = 0
+        while events:
+            try:
+                proxy, opcode, args = events.popleft()
+            except IndexError:
+                break  # drained concurrently by another thread
+            if opcode == _QUEUE_DELETE:
+                self._connection._delete_proxy(proxy)
+            elif not proxy._is_destroyed:
+                proxy._dispatch(opcode, args)
+                count += 1
+        if not events:
+            self._ready.clear()
+            self._ready_thread.clear()
+        return count
+
+    async def dispatch(self) -> int:
+        """Wait for events and dispatch them, returns number of dispatched events"""
+        while not self._events:
+            if self._connection._is_terminated:
+                raise RuntimeError("connection has been terminated")
+            await self._ready.wait()
+            self._ready.clear()
+        return self.dispatch_pending()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block current thread until queue has events or timeout has expired"""
+        if self._events:
+            return True
+        self._ready_thread.wait(timeout)
+        return bool(self._events)
+
+    def _push(self, proxy: Proxy, opcode: OpCode, args: Sequence[Any]) -> None:
+        self._events.append((proxy, opcode, args))
+        if len(self._events) == 1:
+            self._ready.set()
+            self._ready_thread.set()
+
+    def _push_delete(self, proxy: Proxy) -> None:
+        """Delete proxy once events queued before deletion are dispatched
+
+        Server sends `delete_id` right after the last event of an object, so
+        the proxy stays registered until those events are delivered.
+        """
+        self._push(proxy, _QUEUE_DELETE, ())
+
+    def _terminate(self) -> None:
+        self._events.clear()
+        self._ready.set()
+        self._ready_thread.set()
+
+    def __repr__(self) -> str:
+        return f"EventQueue({self.name}, pending={len(self._events)})"
+
 
 class Arg(ABC):
     """Abstract argument type"""
@@ -418,8 +1104,7 @@ class ArgFixed(Arg):
     def pack(self, write: io.BytesIO, value: Any) -> None:
         if not isinstance(value, (int, float)):
             raise TypeError(f"[{self.name}]  float expected")
-        value = (int(value) << 8) + int((value % 1.0) * 256)
-        write.write(self.struct.pack(value))
+        write.write(self.struct.pack(int(value * 256)))
 
     def unpack(
         self,
@@ -620,6 +1305,53 @@ class ArgFd(Arg):
         return fd
 
 
+class _EnumTable(dict[int, Any]):
+    """Lookup table from integer to enum value
+
+    Values missing from the table (combination of flags) are created on demand
+    """
+
+    __slots__ = ["enum_type"]
+
+    def __init__(self, enum_type: type[Enum]) -> None:
+        super().__init__((item.value, item) for item in enum_type)
+        self.enum_type = enum_type
+
+    def __missing__(self, value: int) -> Any:
+        item = self[value] = self.enum_type(value)
+        return item
+
+
+def _str_step(
+    name: str, arg_desc: ArgStr
+) -> Callable[[memoryview | bytes, int, list[Any]], int]:
+    """Unpack string argument"""
+    optional = arg_desc.optional
+
+    def step(buff: memoryview | bytes, offset: int, args: list[Any]) -> int:
+        size: int = _UINT.unpack_from(buff, offset)[0]
+        offset += _UINT.size
+        if size == 0:
+            if not optional:
+                raise ValueError(
+                    f"[{name}({arg_desc.name})] string length cannot be zero"
+                )
+            args.append(None)
+            return offset
+        args.append(str(buff[offset : offset + size - 1], "utf-8"))
+        return offset + size + (-size % 4)
+
+    return step
+
+
+def _array_step(buff: memoryview | bytes, offset: int, args: list[Any]) -> int:
+    """Unpack array argument"""
+    size: int = _UINT.unpack_from(buff, offset)[0]
+    offset += _UINT.size
+    args.append(bytes(buff[offset : offset + size]))
+    return offset + size + (-size % 4)
+
+
 class Interface:
     __slots__ = [
         "name",
@@ -630,7 +1362,8 @@ class Interface:
         "events_by_name",
         "enums",
         "summary",
-        "unpack_enum",
+        "enum_types",
+        "_decoders",
     ]
 
     def __init__(
@@ -648,7 +1381,9 @@ class Interface:
         self.events: list[WEvent] = events
         self.enums: list[WEnum] = enums
         self.summary: str | None = summary
-        self.unpack_enum: Callable[[str, int], Any] | None = None
+        # python types of enums, events use raw integers for missing enums
+        self.enum_types: dict[str, type[Enum]] = {}
+        self._decoders: list[Decoder | None] = [None] * len(events)
 
         self.requests_by_name: dict[str, tuple[OpCode, WRequest]] = {}
         for opcode, request in enumerate(requests):
@@ -689,28 +1424,189 @@ class Interface:
         self,
         connection: Connection,
         opcode: OpCode,
-        data: bytes,
+        data: bytes | memoryview,
     ) -> list[Any]:
         """Unpack opcode and data into request name and list of arguments"""
+        return list(self.decoder(opcode)(connection, data, 0, len(data)))
+
+    def decoder(self, opcode: OpCode) -> Decoder:
+        """Get decoder for the event, it is compiled on the first use"""
         if opcode >= len(self.events):
             raise RuntimeError(f"[{self.name}] received unknown event {opcode}")
-        request = self.events[opcode]
-        read = io.BytesIO(data)
-        args: list[Any] = []
-        for index, arg_desc in enumerate(request.args):
-            if (
-                isinstance(arg_desc, ArgUInt)
-                and arg_desc.enum is not None
-                and self.unpack_enum is not None
-            ):
-                args.append(
-                    self.unpack_enum(arg_desc.enum, arg_desc.unpack(read, connection))
-                )
-            elif isinstance(arg_desc, ArgNewId) and arg_desc.interface is None:
-                args.append(arg_desc.unpack(read, connection, args[index - 2]))
+        decoder = self._decoders[opcode]
+        if decoder is None:
+            decoder = self._decoder_compile(self.events[opcode])
+            self._decoders[opcode] = decoder
+        return decoder
+
+    def _decoder_compile(self, event: WEvent) -> Decoder:
+        """Compile specialized decoder for the event
+
+        Consecutive fixed-width arguments are unpacked with a single struct,
+        and then converted to python values by converters.
+        """
+        name = f"{self.name}.{event.name}"
+        steps: list[Callable[[memoryview | bytes, int, list[Any]], int]] = []
+        converters: list[Callable[[Connection, list[Any]], None]] = []
+        codes: list[str] = []
+
+        def fixed_step(codes: list[str]) -> None:
+            unpack_from = Struct("".join(codes)).unpack_from
+            size = sum(Struct(code).size for code in codes)
+
+            def step(buff: memoryview | bytes, offset: int, args: list[Any]) -> int:
+                args.extend(unpack_from(buff, offset))
+                return offset + size
+
+            steps.append(step)
+            codes.clear()
+
+        for index, arg_desc in enumerate(event.args):
+            if isinstance(arg_desc, ArgStr):
+                if codes:
+                    fixed_step(codes)
+                steps.append(_str_step(name, arg_desc))
+                continue
+            elif isinstance(arg_desc, ArgArray):
+                if codes:
+                    fixed_step(codes)
+                steps.append(_array_step)
+                continue
+            elif isinstance(arg_desc, ArgFd):
+                codes.append("0s")  # placeholder replaced by converter
+            elif isinstance(arg_desc, (ArgUInt, ArgFixed, ArgObject, ArgNewId)):
+                codes.append(arg_desc.struct.format)
             else:
-                args.append(arg_desc.unpack(read, connection))
-        return args
+                raise ValueError(f"[{name}] unsupported argument {arg_desc}")
+            converter = self._converter(name, index, arg_desc)
+            if converter is not None:
+                converters.append(converter)
+
+        if not steps:
+            # all arguments are fixed-width, unpacked with a single call
+            unpack_from = Struct("".join(codes)).unpack_from
+            size = Struct("".join(codes)).size
+
+            def decode_fixed(
+                connection: Connection,
+                buff: memoryview | bytes,
+                offset: int,
+                end: int,
+            ) -> Sequence[Any]:
+                if offset + size > end:
+                    raise ValueError(f"[{name}] message is too short")
+                if not converters:
+                    return unpack_from(buff, offset)
+                args = list(unpack_from(buff, offset))
+                for converter in converters:
+                    converter(connection, args)
+                return args
+
+            return decode_fixed
+
+        if codes:
+            fixed_step(codes)
+
+        def decode(
+            connection: Connection,
+            buff: memoryview | bytes,
+            offset: int,
+            end: int,
+        ) -> Sequence[Any]:
+            args: list[Any] = []
+            try:
+                for step in steps:
+                    offset = step(buff, offset, args)
+            except struct_error as error:
+                raise ValueError(f"[{name}] malformed message: {error}") from None
+            if offset > end:
+                raise ValueError(f"[{name}] message is too short")
+            for converter in converters:
+                converter(connection, args)
+            return args
+
+        return decode
+
+    def _converter(
+        self,
+        name: str,
+        index: int,
+        arg_desc: Arg,
+    ) -> Callable[[Connection, list[Any]], None] | None:
+        """Create converter from unpacked raw value to python value"""
+        if isinstance(arg_desc, ArgFd):
+
+            def convert_fd(connection: Connection, args: list[Any]) -> None:
+                fd = connection._fd_recv()
+                if fd is None:
+                    raise RuntimeError(f"[{name}] expected file descriptor")
+                args[index] = fd
+
+            return convert_fd
+
+        elif isinstance(arg_desc, ArgFixed):
+
+            def convert_fixed(_: Connection, args: list[Any]) -> None:
+                args[index] = args[index] / 256.0
+
+            return convert_fixed
+
+        elif isinstance(arg_desc, ArgUInt):
+            if arg_desc.enum is None:
+                return None
+            enum_type = self._enum_type(arg_desc.enum)
+            if enum_type is None:
+                return None
+            table = _EnumTable(enum_type)
+
+            def convert_enum(_: Connection, args: list[Any]) -> None:
+                args[index] = table[args[index]]
+
+            return convert_enum
+
+        elif isinstance(arg_desc, ArgObject):
+            optional = arg_desc.optional
+
+            def convert_object(connection: Connection, args: list[Any]) -> None:
+                id = args[index]
+                if optional and id == 0:
+                    args[index] = None
+                    return
+                proxy: Proxy | None
+                try:
+                    proxy = connection._proxies._client[id]
+                except IndexError:
+                    proxy = connection._proxies.get(id)
+                if proxy is None:
+                    raise RuntimeError(f"[{name}] unknown incomming object {id}")
+                args[index] = proxy
+
+            return convert_object
+
+        elif isinstance(arg_desc, ArgNewId):
+            interface = arg_desc.interface
+
+            def convert_new_id(connection: Connection, args: list[Any]) -> None:
+                id = Id(args[index])
+                if id in connection._proxies:
+                    raise RuntimeError(f"[{name}] proxy with id={id} already exists")
+                # new_id without interface is preceded by interface name and version
+                iface_name: str = interface or args[index - 2]
+                args[index] = connection._new_id_recv(id, iface_name)
+
+            return convert_new_id
+
+        return None
+
+    def _enum_type(self, enum: str) -> type[Enum] | None:
+        """Resolve enum type by name, which can be qualified with interface name"""
+        iface_name, _, enum_name = enum.rpartition(".")
+        if not iface_name:
+            return self.enum_types.get(enum_name)
+        proxy_type = PROXIES.get(iface_name)
+        if proxy_type is None:
+            return None
+        return proxy_type.interface.enum_types.get(enum_name)
 
     def swap_events_and_requests(self) -> Interface:
         """Create new interface with swapped events and requests"""
@@ -730,6 +1626,191 @@ class Interface:
 EventHandler = Callable[..., bool]
 
 
+class _EventFanout:
+    """Event handler calling multiple subscribers"""
+
+    __slots__ = ["handlers"]
+
+    def __init__(self, handlers: list[EventHandler]) -> None:
+        self.handlers = handlers
+
+    def __call__(self, *args: Any) -> bool:
+        # copy, as subscribers can be added or removed by handlers
+        for handler in tuple(self.handlers):
+            try:
+                keep = handler(*args)
+            except Exception:
+                logging.exception(f"[{handler}] subscriber raised an error")
+                keep = False
+            if not keep and handler in self.handlers:
+                self.handlers.remove(handler)
+        return bool(self.handlers)
+
+
+class Subscription:
+    """Handle of the handler added with `Proxy.subscribe`"""
+
+    __slots__ = ["_proxy", "_opcode", "_handler"]
+
+    def __init__(self, proxy: Proxy, opcode: OpCode, handler: EventHandler) -> None:
+        self._proxy = proxy
+        self._opcode = opcode
+        self._handler = handler
+
+    @property
+    def is_active(self) -> bool:
+        current = self._proxy._handler_get(self._opcode)
+        if isinstance(current, _EventFanout):
+            return self._handler in current.handlers
+        return current is self._handler
+
+    def cancel(self) -> None:
+        """Unsubscribe handler, does nothing if it has already been removed"""
+        proxy, opcode = self._proxy, self._opcode
+        with proxy._connection._lock or _NO_LOCK:
+            handlers = proxy._handlers
+            if handlers is None:
+                return
+            current = handlers[opcode]
+            if current is self._handler:
+                handlers[opcode] = None
+            elif isinstance(current, _EventFanout):
+                if self._handler in current.handlers:
+                    current.handlers.remove(self._handler)
+                if not current.handlers:
+                    handlers[opcode] = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.cancel()
+
+
+class EventOverflow(Enum):
+    """What event stream does when its buffer is full"""
+
+    DROP_OLDEST = 0  # oldest buffered event is dropped
+    COALESCE = 1  # newest buffered event is replaced
+    BLOCK = 2  # connection stops reading until the buffer is consumed
+
+
+class EventStream:
+    """Bounded buffer of events which can be consumed with `async for`
+
+    Future is only allocated when consumer waits on empty buffer. With
+    `BLOCK` overflow policy messages that have already been received are
+    kept in the read buffer while the stream is full, so such stream must
+    be consumed or closed, otherwise the whole connection stalls.
+    """
+
+    __slots__ = [
+        "_proxy",
+        "_subscription",
+        "_buffer",
+        "_maxsize",
+        "_overflow",
+        "_waiter",
+        "_paused",
+        "_closed",
+        "dropped",
+    ]
+
+    def __init__(
+        self,
+        proxy: Proxy,
+        name: str,
+        maxsize: int,
+        overflow: EventOverflow,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"[{proxy}] maxsize must be positive: {maxsize}")
+        self._proxy = proxy
+        self._buffer: deque[tuple[Any, ...]] = deque()
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._waiter: Future[None] | None = None
+        self._paused = False
+        self._closed = False
+        self.dropped = 0  # number of dropped or coalesced events
+        self._subscription = proxy.subscribe(name, self._on_event)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def close(self) -> None:
+        """Unsubscribe from the event, buffered events can still be consumed"""
+        if self._closed:
+            return
+        self._closed = True
+        self._subscription.cancel()
+        self._resume()
+        self._wakeup()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> tuple[Any, ...]:
+        buffer = self._buffer
+        while not buffer:
+            if self._closed or self._proxy._is_detached:
+                self.close()
+                raise StopAsyncIteration
+            waiter = self._waiter = asyncio.get_running_loop().create_future()
+            self._proxy._future_add(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # proxy detach cancels its futures, which ends the stream
+                task = asyncio.current_task()
+                if task is None or task.cancelling() or not self._proxy._is_detached:
+                    raise
+            finally:
+                self._waiter = None
+        args = buffer.popleft()
+        if self._paused and len(buffer) < self._maxsize:
+            self._resume()
+        return args
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        self.close()
+
+    def _on_event(self, *args: Any) -> bool:
+        if self._closed:
+            return False
+        buffer = self._buffer
+        if len(buffer) >= self._maxsize:
+            if self._overflow == EventOverflow.DROP_OLDEST:
+                buffer.popleft()
+                self.dropped += 1
+            elif self._overflow == EventOverflow.COALESCE:
+                buffer.pop()
+                self.dropped += 1
+        buffer.append(args)
+        if (
+            self._overflow == EventOverflow.BLOCK
+            and not self._paused
+            and len(buffer) >= self._maxsize
+        ):
+            self._paused = True
+            self._proxy._connection._read_pause()
+        self._wakeup()
+        return True
+
+    def _wakeup(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _resume(self) -> None:
+        if self._paused:
+            self._paused = False
+            self._proxy._connection._read_resume()
+
+
 class Proxy:
     __slots__ = [
         "_id",
@@ -740,6 +1821,7 @@ class Proxy:
         "_is_destroyed",
         "_handlers",
         "_futures",
+        "_queue",
     ]
     interface: ClassVar[Interface]
 
@@ -755,8 +1837,12 @@ class Proxy:
         self._id: Id = id
         self._interface: Interface = interface
         self._connection: Connection = connection
-        self._handlers: list[EventHandler | None] = [None] * len(interface.events)
-        self._futures: WeakSet[Future[Any]] = WeakSet()
+        # handlers and futures are allocated on first use, as most proxies
+        # (buffers, regions, callbacks) never have any of them
+        self._handlers: list[EventHandler | None] | None = None
+        self._futures: WeakSet[Future[Any]] | None = None
+        # events are dispatched immediately if proxy is not assigned to a queue
+        self._queue: EventQueue | None = None
         # `new_id` has been send to the other side
         self._is_attached: bool = False
         # release by the other side and will no longer be identified by its id
@@ -777,7 +1863,7 @@ class Proxy:
         if self._connection._debug:
             print(f" -> {self._call_fmt(opcode, args)}", file=sys.stderr)
         data, fds = self._interface.pack(opcode, args)
-        self._connection._message_submit(Message(self._id, opcode, data, fds))
+        self._connection._message_submit(self._id, opcode, data, fds)
 
     def _call_fmt(self, opcode: OpCode, args: tuple[Any, ...]) -> str:
         request = self._interface.requests[opcode]
@@ -794,40 +1880,137 @@ class Proxy:
         if desc is None:
             raise ValueError(f"[{self}] does not have event '{name}'")
         opcode, _ = desc
-        old_handler, self._handlers[opcode] = self._handlers[opcode], handler
+        return self._handler_set(opcode, handler)
+
+    def _handler_set(
+        self,
+        opcode: OpCode,
+        handler: EventHandler,
+    ) -> EventHandler | None:
+        """Register handler for the event by opcode returning previous one"""
+        with self._connection._lock or _NO_LOCK:
+            handlers = self._handler_table()
+            old_handler, handlers[opcode] = handlers[opcode], handler
         return old_handler
 
+    def _handler_get(self, opcode: OpCode) -> EventHandler | None:
+        """Handler of the event by opcode"""
+        handlers = self._handlers
+        return None if handlers is None else handlers[opcode]
+
+    def _handler_table(self) -> list[EventHandler | None]:
+        """Handlers indexed by opcode, allocated on first use under the lock"""
+        handlers = self._handlers
+        if handlers is None:
+            table: list[EventHandler | None] = [None] * len(self._interface.events)
+            handlers = self._handlers = table
+        return handlers
+
+    def _future_add(self, future: Future[Any]) -> None:
+        """Add future which is cancelled when proxy is detached"""
+        futures = self._futures
+        if futures is None:
+            futures = self._futures = WeakSet()
+        futures.add(future)
+
+    def subscribe(self, name: str, handler: EventHandler) -> Subscription:
+        """Add handler for the event without replacing existing ones
+
+        All subscribers are called in subscription order, each subscriber is
+        removed once it returns `False` or raises. Returned subscription can
+        be used to unsubscribe, while `on` replaces all subscribers.
+        """
+        if self._is_detached:
+            raise RuntimeError(f"[{self}] is deleted")
+        desc = self._interface.events_by_name.get(name)
+        if desc is None:
+            raise ValueError(f"[{self}] does not have event '{name}'")
+        opcode, _ = desc
+        with self._connection._lock or _NO_LOCK:
+            handlers = self._handler_table()
+            current = handlers[opcode]
+            if current is None:
+                # single subscriber is stored as is
+                handlers[opcode] = handler
+            elif isinstance(current, _EventFanout):
+                current.handlers.append(handler)
+            else:
+                handlers[opcode] = _EventFanout([current, handler])
+        return Subscription(self, opcode, handler)
+
+    def events(
+        self,
+        name: str,
+        maxsize: int = 64,
+        overflow: EventOverflow = EventOverflow.DROP_OLDEST,
+    ) -> EventStream:
+        """Stream of event arguments to be consumed with `async for`
+
+        Events are buffered until consumed, at most `maxsize` events are
+        buffered and `overflow` defines what happens when the buffer is full.
+        Full stream with `BLOCK` policy pauses reading of the connection until
+        it is consumed or closed, and abandoning it stalls the connection.
+        """
+        return EventStream(self, name, maxsize, overflow)
+
+    def set_queue(self, queue: EventQueue | None) -> None:
+        """Assign proxy to the event queue, `None` means default dispatch
+
+        Proxies created by requests and events of this proxy inherit its queue.
+        """
+        if queue is not None and queue._connection is not self._connection:
+            raise ValueError(f"[{self}] queue belongs to a different connection")
+        self._queue = queue
+
+    @property
+    def queue(self) -> EventQueue | None:
+        return self._queue
+
     def on_async(self, name: str) -> Future[tuple[Any, ...]]:
-        """Create future which is resolved on event"""
+        """Create future which is resolved on event
+
+        Handler is added as a subscriber, so existing handlers are kept, and
+        it is unsubscribed once the future is resolved or cancelled.
+        """
 
         def handler(*args: Any) -> bool:
-            future.set_result(args)
+            if not future.done():
+                future.set_result(args)
             return False
 
-        self.on(name, handler)
         future: Future[tuple[Any, ...]] = asyncio.get_running_loop().create_future()
-        self._futures.add(future)
+        subscription = self.subscribe(name, handler)
+        future.add_done_callback(lambda _: subscription.cancel())
+        self._future_add(future)
 
         return future
 
-    def _dispatch(self, opcode: OpCode, args: list[Any]) -> None:
+    def _dispatch(self, opcode: OpCode, args: Sequence[Any]) -> None:
         """Dispatch event to the handler"""
         if self._connection._debug:
             print(f"{self._dispatch_fmt(opcode, args)}", file=sys.stderr)
-        handler = self._handlers[opcode]
+        handlers = self._handlers
+        handler = None if handlers is None else handlers[opcode]
         if handler is None:
             fmt = self._dispatch_fmt(opcode, args)
             print(f"\x1b[93m[unhandled] {fmt}\x1b[m", file=sys.stderr)
             return
         try:
             if not handler(*args):
-                self._handlers[opcode] = None
+                self._handler_reset(opcode, handler)
         except Exception:
             event = self._interface.events[opcode]
             logging.exception(f"[{self}.{event.name}] handler raised an error")
-            self._handlers[opcode] = None
+            self._handler_reset(opcode, handler)
+
+    def _handler_reset(self, opcode: OpCode, handler: EventHandler) -> None:
+        """Unregister handler unless it has already been replaced"""
+        with self._connection._lock or _NO_LOCK:
+            handlers = self._handlers
+            if handlers is not None and handlers[opcode] is handler:
+                handlers[opcode] = None
 
-    def _dispatch_fmt(self, opcode: OpCode, args: list[Any]) -> str:
+    def _dispatch_fmt(self, opcode: OpCode, args: Sequence[Any]) -> str:
         """Format incoming message"""
         event = self._interface.events[opcode]
         args_repr = ", ".join(
@@ -835,13 +2018,23 @@ class Proxy:
         )
         return f"{self}.{event.name}({args_repr})"
 
+    def _reset(self, id: Id) -> None:
+        """Reset proxy to the state of the newly created one with the given id"""
+        self._id = id
+        self._handlers = None
+        self._is_attached = False
+        self._is_detached = False
+        self._is_destroyed = False
+
     def _detach(self, msg: str) -> None:
         is_detached, self._is_detached = self._is_detached, True
         if is_detached:
             return None
-        for future in self._futures:
+        futures, self._futures = self._futures, None
+        if futures is None:
+            return None
+        for future in futures:
             future.cancel(f"{self} {msg}")
-        self._futures.clear()
 
     def __str__(self) -> str:
         return repr(self)
@@ -1043,36 +2236,98 @@ class FdFile(Proto):
     def close(self) -> None: ...
 
 
+class OwnedFd:
+    """Owned file descriptor
+
+    Lightweight alternative to file objects for received descriptors, it is
+    closed when garbage collected unless detached.
+    """
+
+    __slots__ = ["_fd"]
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    @property
+    def closed(self) -> bool:
+        return self._fd < 0
+
+    def fileno(self) -> int:
+        if self._fd < 0:
+            raise ValueError("file descriptor is closed")
+        return self._fd
+
+    def detach(self) -> int:
+        """Release ownership of the descriptor and return it"""
+        fd = self.fileno()
+        self._fd = -1
+        return fd
+
+    def close(self) -> None:
+        fd, self._fd = self._fd, -1
+        if fd >= 0:
+            os.close(fd)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"OwnedFd({self._fd})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
 class SharedMemory:
     """Create shared memory file
 
     This can be send over to wayland compositor, or converted to numpy array:
     >>> shm = SharedMemory(8192)
     >>> array = numpy.ndarray(shape=(32,32), dtype=float, shm.buf)
+
+    File is created with `memfd_create` where it is available, otherwise with
+    `shm_open`. With `seal` the file can not be shrunk (`F_SEAL_SHRINK`), so
+    compositor can safely map it. With `hugetlb` memory of at least
+    `HUGE_PAGE_SIZE` is allocated from huge pages if the system has them,
+    the size is rounded up to the huge page size. Both are only supported
+    by `memfd_create`.
     """
 
-    __slots__ = ["_fd", "_mmap", "_is_closed"]
+    __slots__ = ["_fd", "_mmap", "_is_closed", "_page_size"]
     _fd: int
     _mmap: mmap
     _is_closed: bool
+    _page_size: int  # size is always a multiple of it
 
-    def __init__(self, size: int, fd: Fd | None = None) -> None:
-        self._is_closed = False
+    def __init__(
+        self,
+        size: int,
+        fd: Fd | None = None,
+        seal: bool = False,
+        hugetlb: bool = False,
+    ) -> None:
+        self._is_closed = True  # until allocation succeeds
+        self._page_size = 1
         if fd is None:
-            name = secrets.token_hex(16)
-            flags = os.O_RDWR | os.O_CREAT | os.O_EXCL
-            self._fd = shm_open(name, flags, 0o600)
-            try:
-                os.ftruncate(self._fd, size)
-                self._mmap = mmap(self._fd, size)
-            finally:
-                shm_unlink(name)
+            if hasattr(os, "memfd_create"):
+                self._fd, self._mmap, self._page_size = _memfd_create(
+                    size, seal, hugetlb
+                )
+            else:
+                self._fd, self._mmap = _shm_create(size)
         else:
             if isinstance(fd, int):
                 self._fd = fd
             else:
                 self._fd = os.dup(fd.fileno())
             self._mmap = mmap(self._fd, size)
+        self._is_closed = False
 
     def fileno(self) -> int:
         if self._is_closed:
@@ -1083,6 +2338,29 @@ class SharedMemory:
     def buf(self) -> memoryview:
         return cast(memoryview, self._mmap)
 
+    def __len__(self) -> int:
+        return len(self._mmap)
+
+    def resize(self, size: int) -> None:
+        """Resize file and its mapping in place, content is preserved
+
+        All views of the buffer must be released, otherwise `BufferError` is
+        raised. Mapping is moved with `mremap` where it is available.
+        """
+        if self._is_closed:
+            raise RuntimeError("shared memory file is closed")
+        size = -(-size // self._page_size) * self._page_size
+        if size == len(self._mmap):
+            return
+        try:
+            # truncates the file and remaps it
+            self._mmap.resize(size)
+        except SystemError:
+            # resize is not supported on this platform
+            self._mmap.close()
+            os.ftruncate(self._fd, size)
+            self._mmap = mmap(self._fd, size)
+
     def close(self) -> None:
         is_closed, self._is_closed = self._is_closed, True
         if is_closed:
@@ -1098,3 +2376,46 @@ class SharedMemory:
 
     def __repr__(self) -> str:
         return str(self)
+
+
+def _memfd_create(size: int, seal: bool, hugetlb: bool) -> tuple[int, mmap, int]:
+    """Create and map anonymous memory file, returns it with its page size"""
+    flags = os.MFD_CLOEXEC | os.MFD_ALLOW_SEALING
+    if hugetlb and size >= HUGE_PAGE_SIZE:
+        fd = -1
+        try:
+            fd = os.memfd_create("wayland-shm", flags | os.MFD_HUGETLB)
+            size_huge = -(-size // HUGE_PAGE_SIZE) * HUGE_PAGE_SIZE
+            os.ftruncate(fd, size_huge)
+            # huge pages are reserved by mmap, which fails if there are none
+            mem = mmap(fd, size_huge)
+            if seal:
+                fcntl.fcntl(fd, fcntl.F_ADD_SEALS, fcntl.F_SEAL_SHRINK)
+            return fd, mem, HUGE_PAGE_SIZE
+        except OSError:
+            if fd >= 0:
+                os.close(fd)
+    fd = os.memfd_create("wayland-shm", flags)
+    try:
+        os.ftruncate(fd, size)
+        if seal:
+            fcntl.fcntl(fd, fcntl.F_ADD_SEALS, fcntl.F_SEAL_SHRINK)
+        return fd, mmap(fd, size), 1
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def _shm_create(size: int) -> tuple[int, mmap]:
+    """Create and map POSIX shared memory file which is unlinked immediately"""
+    name = secrets.token_hex(16)
+    flags = os.O_RDWR | os.O_CREAT | os.O_EXCL
+    fd = shm_open(name, flags, 0o600)
+    try:
+        os.ftruncate(fd, size)
+        return fd, mmap(fd, size)
+    except BaseException:
+        os.close(fd)
+        raise
+    finally:
+        shm_unlink(name)
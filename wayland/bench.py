@@ -0,0 +1,246 @@
+"""Benchmarks of the connection hot paths
+
+Run all benchmarks or only selected ones:
+>>> python -m wayland.bench [--count N] [name ...]
+"""
+
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from struct import Struct
+
+from .base import (
+    MSG_HEADER,
+    Id,
+    Protocol,
+    Proxy,
+    SharedMemory,
+    _memfd_create,
+    _shm_create,
+)
+from .client import ClientConnection
+from .codegen import _compile_key, _protocol_code, generate_client
+from .protocol.wayland import WlOutput, WlRegion, WlSurface
+
+__all__ = ["BENCHMARKS", "main"]
+
+# benchmarks by name with their default count
+BENCHMARKS: dict[str, tuple[Callable[[int], None], int]] = {}
+REPEAT = 5
+_UINT = Struct("I")
+
+
+def benchmark(count: int) -> Callable[[Callable[[int], None]], Callable[[int], None]]:
+    """Register benchmark under the name of the function"""
+
+    def register(fn: Callable[[int], None]) -> Callable[[int], None]:
+        BENCHMARKS[fn.__name__] = (fn, count)
+        return fn
+
+    return register
+
+
+def report(name: str, fn: Callable[[], object], ops: int) -> float:
+    """Run `fn` performing `ops` operations and print best time per operation"""
+    elapsed = min(timeit.repeat(fn, number=1, repeat=REPEAT)) / ops
+    print(f"  {name:<24} {elapsed * 1e9:10.1f} ns/op")
+    return elapsed
+
+
+def _connection(count: int) -> tuple[ClientConnection, list[WlSurface]]:
+    """Connection which is never connected, with `count` surfaces"""
+    conn = ClientConnection("/nonexistent")
+    surfaces = [conn.create_proxy(WlSurface) for _ in range(count)]
+    for surface in surfaces:
+        surface._is_attached = True
+    return conn, surfaces
+
+
+@benchmark(5000)
+def lookup(count: int) -> None:
+    """Proxy lookup by id, dictionary compared to the proxy table"""
+    conn, surfaces = _connection(count)
+    ids = [surface._id for surface in surfaces]
+    random.Random(count).shuffle(ids)
+    table = conn._proxies
+    client = table._client
+    proxies: dict[Id, Proxy] = {surface._id: surface for surface in surfaces}
+
+    def dict_get() -> None:
+        for id in ids:
+            proxies.get(id)
+
+    def table_get() -> None:
+        for id in ids:
+            table.get(id)
+
+    def table_index() -> None:
+        for id in ids:
+            try:
+                client[id]
+            except IndexError:
+                table.get(id)
+
+    report("dict.get", dict_get, len(ids))
+    report("ProxyTable.get", table_get, len(ids))
+    report("ProxyTable inline", table_index, len(ids))
+
+
+@benchmark(5000)
+def dispatch(count: int) -> None:
+    """Decode and dispatch of `wl_surface.enter` to every surface"""
+    conn, surfaces = _connection(count)
+    output = conn.create_proxy(WlOutput)
+    opcode, _ = WlSurface.interface.events_by_name["enter"]
+    size = MSG_HEADER.size + 4
+    data = bytearray()
+    for surface in surfaces:
+        surface.on_enter(lambda _: True)
+        data += MSG_HEADER.pack(surface._id, opcode, size)
+        data += _UINT.pack(output._id)
+    conn._read_resize(len(data))
+
+    def run() -> None:
+        conn._read_buff[: len(data)] = data
+        conn._read_start, conn._read_end = 0, len(data)
+        conn._read_dispatch()
+
+    report("dispatch", run, count)
+
+
+@benchmark(100_000)
+def memory(count: int) -> None:
+    """Creation of proxies which never register handlers or futures"""
+
+    def create() -> list[WlRegion]:
+        conn = ClientConnection("/nonexistent")
+        return [conn.create_proxy(WlRegion) for _ in range(count)]
+
+    report("create", create, count)
+
+    gc.collect()
+    objects = len(gc.get_objects())
+    tracemalloc.start()
+    regions = create()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = len(gc.get_objects()) - objects
+    print(f"  {'memory':<24} {size / len(regions):10.1f} B/proxy")
+    print(f"  {'gc objects':<24} {objects / len(regions):10.1f} objects/proxy")
+
+
+@benchmark(1000)
+def shm(count: int) -> None:
+    """Allocation of 4K shared memory files, `memfd_create` and `shm_open`"""
+    size = 4096
+
+    def memfd() -> None:
+        for _ in range(count):
+            fd, mem, _ = _memfd_create(size, True, False)
+            mem.close()
+            os.close(fd)
+
+    def shm_open() -> None:
+        for _ in range(count):
+            fd, mem = _shm_create(size)
+            mem.close()
+            os.close(fd)
+
+    def shared_memory() -> None:
+        for _ in range(count):
+            SharedMemory(size).close()
+
+    report("memfd_create", memfd, count)
+    report("shm_open", shm_open, count)
+    report("SharedMemory", shared_memory, count)
+
+
+@benchmark(20)
+def imports(count: int) -> None:
+    """Import of the client in a fresh interpreter, with only the proxy
+    classes it needs, with `xdg_wm_base`, and with all generated proxy classes
+
+    `wayland.base` is imported beforehand, as its dependencies (asyncio)
+    dominate and do not depend on the protocols.
+    """
+    statements = {
+        "wayland.client": "import wayland.client",
+        "xdg_wm_base": (
+            "import wayland.client;" "from wayland.protocol.xdg_shell import XdgWmBase"
+        ),
+        "all protocols": (
+            "import wayland.client;"
+            "from wayland.protocol.wayland import *;"
+            "from wayland.protocol.xdg_shell import *;"
+            "from wayland.protocol.wlr_layer_shell_unstable_v1 import *"
+        ),
+    }
+    for name, statement in statements.items():
+        script = (
+            "import time, wayland.base; start = time.perf_counter_ns();"
+            f"{statement}; print(time.perf_counter_ns() - start)"
+        )
+        elapsed = min(
+            int(
+                subprocess.check_output(
+                    [sys.executable, "-c", script],
+                    cwd=Path(__file__).parent.parent,
+                )
+            )
+            for _ in range(count)
+        )
+        print(f"  {name:<24} {elapsed:10.1f} ns/op")
+
+
+@benchmark(20)
+def compiler(count: int) -> None:
+    """Runtime compilation of `xdg-shell.xml`, from XML and from the cache"""
+    path = Path(__file__).parent.parent / "protocol" / "xdg-shell.xml"
+    key = _compile_key(path.read_bytes())
+
+    def cold() -> None:
+        for _ in range(count):
+            proto = Protocol.load(str(path))
+            source = generate_client(proto, reliative=False, deps=set())
+            compile(source, "<protocol>", "exec")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        _protocol_code(path, key, Path(cache_dir))
+
+        def warm() -> None:
+            for _ in range(count):
+                _protocol_code(path, key, Path(cache_dir))
+
+        report("xml", cold, count)
+        report("cache", warm, count)
+
+
+def main() -> None:
+    args = argparse.ArgumentParser(description="run benchmarks")
+    args.add_argument("--count", type=int, help="number of proxies")
+    args.add_argument("names", nargs="*", help=f"any of {', '.join(BENCHMARKS)}")
+    opts = args.parse_args()
+    for name in opts.names:
+        if name not in BENCHMARKS:
+            args.error(f"unknown benchmark: {name}")
+
+    for name in opts.names or BENCHMARKS:
+        bench, count = BENCHMARKS[name]
+        count = opts.count or count
+        print(f"{name} (count={count})")
+        bench(count)
+
+
+if __name__ == "__main__":
+    main()
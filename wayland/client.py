@@ -2,13 +2,26 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
+import select
 import socket
 import sys
-from typing import NamedTuple, Self, Any, overload
-from collections.abc import Awaitable, Callable, Iterable
-
-from .base import Connection, Id, Proxy
+import threading
+import time
+from typing import NamedTuple, Self, Any, cast, overload
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+from .base import (
+    READ_ANC_SIZE,
+    READ_BUFF_MAX,
+    READ_BUFF_SIZE,
+    Connection,
+    Id,
+    Proxy,
+)
+from .base import _ancdata_fds
 from .protocol.wayland import WlDisplay, WlRegistry, WlShm
 
 _guard: Any = object()
@@ -22,8 +35,13 @@ class Global(NamedTuple):
 
 
 class ClientConnection(Connection):
-    def __init__(self, path: str | None = None):
-        super().__init__()
+    def __init__(
+        self,
+        path: str | None = None,
+        eager_flush: bool = False,
+        thread_safe: bool = False,
+    ):
+        super().__init__(eager_flush=eager_flush, thread_safe=thread_safe)
 
         self._path: str
         if path is not None:
@@ -44,6 +62,11 @@ class ClientConnection(Connection):
         self._display.on_delete_id(self._on_display_delete_id)
 
         self._registry_globals: dict[int, Global] = {}
+        # globals by interface name, bound proxies of interfaces which have all
+        # their globals bound, and futures waiting for interfaces to appear
+        self._registry_index: dict[str, dict[int, Global]] = {}
+        self._registry_cache: dict[str, tuple[type[Proxy], list[Proxy]]] = {}
+        self._registry_waiters: dict[str, list[asyncio.Future[None]]] = {}
         self._registry: WlRegistry = self._display.get_registry()
         self._registry.on_global(self._on_registry_global)
         self._registry.on_global_remove(self._on_registry_global_remove)
@@ -83,27 +106,62 @@ class ClientConnection(Connection):
         """Get global by proxy type"""
         if (interface := getattr(proxy_type, "interface", None)) is None:
             raise TypeError("cannot get untyped proxy")
+        cached = self._registry_cache.get(interface.name)
+        if cached is not None and cached[0] is proxy_type:
+            return cast(list[P], cached[1].copy())
 
-        # find/bind proxies by interface name
+        # bind proxies by interface name
         globals: list[P] = []
-        globals_new: dict[int, Global] = {}
-        for num_name, (iface_name, version, _, proxy) in self._registry_globals.items():
-            if iface_name != interface.name:
-                continue
+        index = self._registry_index.get(interface.name, {})
+        for num_name, (iface_name, version, _, proxy) in index.items():
             if proxy is None:
-                proxy = self.create_proxy(proxy_type)
                 version = min(interface.version, version)
-                self._registry.bind(num_name, iface_name, version, proxy)
+                with self._request_scope():
+                    proxy = self.create_proxy(proxy_type)
+                    self._registry.bind(num_name, iface_name, version, proxy)
                 self._proxy_setup(proxy)
-                globals_new[num_name] = Global(iface_name, version, num_name, proxy)
+                entry = Global(iface_name, version, num_name, proxy)
+                index[num_name] = self._registry_globals[num_name] = entry
             if not isinstance(proxy, proxy_type):
                 raise ValueError("global has already been bound by untyped proxy")
             globals.append(proxy)
-        if globals_new:
-            self._registry_globals.update(globals_new)
+        if globals:
+            self._registry_cache[interface.name] = (proxy_type, list(globals))
 
         return globals
 
+    async def wait_global[P: Proxy](
+        self,
+        proxy_type: type[P],
+        timeout: float | None = None,
+    ) -> P:
+        """Wait until global of the type is announced and get it
+
+        Returns immediately if the global already exists, if there are
+        multiple globals of the type the first announced one is returned.
+        Raises `TimeoutError` if it has not appeared within `timeout` seconds.
+        """
+        if (interface := getattr(proxy_type, "interface", None)) is None:
+            raise TypeError("cannot get untyped proxy")
+        async with asyncio.timeout(timeout):
+            while not (globals := self.get_globals(proxy_type)):
+                if self._is_terminated:
+                    raise RuntimeError("connection has been terminated")
+                waiter = asyncio.get_running_loop().create_future()
+                waiters = self._registry_waiters.setdefault(interface.name, [])
+                waiters.append(waiter)
+                self._registry._future_add(waiter)  # cancelled on termination
+                try:
+                    await waiter
+                except asyncio.CancelledError:
+                    task = asyncio.current_task()
+                    if task is None or task.cancelling() or not self._is_terminated:
+                        raise
+                finally:
+                    if waiter in waiters:
+                        waiters.remove(waiter)
+        return globals[0]
+
     def all_globals(self) -> Iterable[Global]:
         return self._registry_globals.values()
 
@@ -129,6 +187,9 @@ class ClientConnection(Connection):
         await self.display.sync()
 
     async def _create_socket(self) -> socket.socket:
+        return self._open_socket()
+
+    def _open_socket(self) -> socket.socket:
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM, 0)
         sock.connect(self._path)
         return sock
@@ -162,18 +223,408 @@ class ClientConnection(Connection):
 
     def _on_display_delete_id(self, id_int: int) -> bool:
         """Unregister proxy"""
-        self._delete_proxy(Id(id_int))
+        id = Id(id_int)
+        proxy = self._proxies.get(id)
+        if proxy is not None and proxy._queue is not None:
+            proxy._queue._push_delete(proxy)
+        else:
+            self._delete_proxy(id)
         return True
 
     def _on_registry_global(self, name: int, interface: str, version: int) -> bool:
         """Register name in registry globals"""
-        self._registry_globals[name] = Global(interface, version, name, None)
+        entry = Global(interface, version, name, None)
+        self._registry_globals[name] = entry
+        self._registry_index.setdefault(interface, {})[name] = entry
+        self._registry_cache.pop(interface, None)
+        for waiter in self._registry_waiters.pop(interface, ()):
+            if not waiter.done():
+                waiter.set_result(None)
         return True
 
     def _on_registry_global_remove(self, target_name: int) -> bool:
         """Unregister name from registry globals"""
         entry = self._registry_globals.pop(target_name, None)
-        if entry is not None and (proxy := entry.proxy) is not None:
+        if entry is None:
+            return True
+        index = self._registry_index.get(entry.iface_name, {})
+        index.pop(target_name, None)
+        if not index:
+            self._registry_index.pop(entry.iface_name, None)
+        self._registry_cache.pop(entry.iface_name, None)
+        if (proxy := entry.proxy) is not None:
             self._proxies.pop(proxy._id)
-            proxy._detach("global removed: {interface}")
+            proxy._detach(f"global removed: {entry.iface_name}")
         return True
+
+
+class BlockingClientConnection(ClientConnection):
+    """Client connection which does not require asyncio
+
+    Messages are only written and read when `flush_sync`, `dispatch`,
+    `dispatch_pending` or `roundtrip` is called, which makes it suitable for
+    short-lived synchronous tools. Coroutine methods inherited from
+    `ClientConnection` (`connect`, `flush`, `sync`, `wait_global`) block
+    on their synchronous counterparts.
+    >>> with BlockingClientConnection() as conn:
+    ...     conn.get_global(WlShm)
+    ...     conn.roundtrip()
+    """
+
+    def __init__(self, path: str | None = None):
+        super().__init__(path)
+        self._poll = select.poll()
+
+    def connect_sync(self) -> Self:
+        """Connect to the compositor and wait for initial globals"""
+        if self._socket is not None:
+            raise RuntimeError("socket has already been set")
+        self._socket = self._open_socket()
+        self._socket.setblocking(False)
+        self._poll.register(self._socket, select.POLLIN)
+        self.roundtrip()
+        return self
+
+    def flush_sync(self) -> None:
+        """Write all pending requests, blocking until socket accepts them"""
+        while self._write_queue:
+            if self._is_terminated or self._socket is None:
+                raise RuntimeError("connection has been terminated")
+            self._writer()
+            if self._write_queue:
+                self._poll.modify(self._socket, select.POLLOUT)
+                self._poll.poll()
+
+    def dispatch_pending(self, timeout: float | None = 0) -> bool:
+        """Wait at most `timeout` seconds for events and dispatch them
+
+        Pending requests are written as socket accepts them. Blocks indefinitely
+        if `timeout` is `None`, returns `True` if any data has been received.
+        """
+        if self._is_terminated or self._socket is None:
+            raise RuntimeError("connection has been terminated")
+        if self._read_paused:
+            # socket is not read until blocked event streams are consumed
+            if timeout is None:
+                raise RuntimeError("reading is paused by a blocked event stream")
+            events = 0
+        else:
+            # messages kept in the buffer while reading was paused
+            start = self._read_start
+            self._read_dispatch()
+            if self._read_start != start:
+                self._read_compact()
+                return True
+            events = select.POLLIN
+        if self._write_queue:
+            events |= select.POLLOUT
+        self._poll.modify(self._socket, events)
+        received = self._read_bytes
+        for _, event in self._poll.poll(None if timeout is None else timeout * 1000):
+            if event & select.POLLOUT:
+                self._writer()
+            if event & (select.POLLIN | select.POLLHUP | select.POLLERR):
+                self._reader()
+        return self._read_bytes != received or self._is_terminated
+
+    def dispatch(self) -> None:
+        """Write pending requests, then block until events are received and dispatched"""
+        self.flush_sync()
+        while not self.dispatch_pending(None):
+            pass
+
+    def roundtrip(self) -> None:
+        """Block until all pending requests are processed by the server"""
+
+        done = False
+
+        def on_done(_: int) -> bool:
+            nonlocal done
+            done = True
+            return False
+
+        self.display.sync().on_done(on_done)
+        while not done:
+            self.dispatch()
+
+    async def connect(self) -> Self:
+        return self.connect_sync()
+
+    async def flush(self) -> None:
+        self.flush_sync()
+
+    async def sync(self) -> None:
+        self.roundtrip()
+
+    async def wait_global[P: Proxy](
+        self,
+        proxy_type: type[P],
+        timeout: float | None = None,
+    ) -> P:
+        if getattr(proxy_type, "interface", None) is None:
+            raise TypeError("cannot get untyped proxy")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.flush_sync()
+        while not (globals := self.get_globals(proxy_type)):
+            if self._is_terminated:
+                raise RuntimeError("connection has been terminated")
+            if deadline is None:
+                self.dispatch_pending(None)
+            elif (remaining := deadline - time.monotonic()) <= 0:
+                raise TimeoutError()
+            else:
+                self.dispatch_pending(remaining)
+        return globals[0]
+
+    def __enter__(self) -> Self:
+        return self.connect_sync()
+
+    def __exit__(self, *_: Any) -> None:
+        self.terminate()
+
+    def _writer_enable(self) -> None:
+        # requests are only written on `flush` or `dispatch`
+        if self._is_terminated:
+            raise RuntimeError("connection has beend terminated")
+        self._write_done.clear()
+
+    def _writer_disable(self) -> None:
+        self._write_done.set()
+
+    def _reader_enable(self) -> None:
+        pass
+
+    def _reader_disable(self) -> None:
+        pass
+
+    def _reader_pause(self) -> None:
+        pass  # socket is not polled for input while paused
+
+    def _reader_resume(self) -> None:
+        pass  # buffered messages are dispatched by the next `dispatch_pending`
+
+
+class ThreadedClientConnection(ClientConnection):
+    """Client connection with the socket owned by a dedicated I/O thread
+
+    I/O thread reads incoming data and writes requests, so the socket keeps
+    being serviced while the event loop is busy. Received data is handed over
+    to the loop with `call_soon_threadsafe` where it is decoded and
+    dispatched. Connection is always in thread-safe mode, so requests can be
+    submitted from any thread.
+    """
+
+    def __init__(self, path: str | None = None):
+        super().__init__(path, thread_safe=True)
+        # I/O thread is woken by writing to the pipe, wake is only requested
+        # if the thread has not already been woken since it drained the pipe
+        self._wake_recv, self._wake_send = os.pipe()
+        os.set_blocking(self._wake_recv, False)
+        os.set_blocking(self._wake_send, False)
+        self._wake_pending = False
+        self._io_thread: threading.Thread | None = None
+        self._io_size = READ_BUFF_SIZE  # size of recvmsg, grows on full reads
+        # data received by the I/O thread and not yet copied to the read buffer,
+        # thread stops reading once READ_BUFF_MAX bytes are in flight, counters
+        # are only updated by a single thread each
+        self._io_backlog: deque[bytes] = deque()
+        self._io_posted = 0  # bytes posted by the I/O thread
+        self._io_consumed = 0  # bytes moved to the read buffer by the loop
+        self._io_stalled = False  # I/O thread does not poll for input
+
+    def terminate(self, msg: Any | None = None) -> None:
+        if (
+            self._io_thread is not None
+            and self._io_thread.ident == threading.get_ident()
+        ):
+            # proxies are detached on the loop thread
+            self._loop.call_soon_threadsafe(self.terminate, msg)
+            return
+        if self._is_terminated:
+            return
+        super().terminate(msg)
+        os.close(self._wake_recv)
+        os.close(self._wake_send)
+
+    def _writer_enable(self) -> None:
+        if self._is_terminated:
+            raise RuntimeError("connection has beend terminated")
+        self._write_done.clear()
+        if self._socket is None or self._write_batched():
+            return
+        self._io_wake()
+
+    def _io_wake(self) -> None:
+        """Wake I/O thread so it re-evaluates what to poll for"""
+        if self._wake_pending:
+            return
+        self._wake_pending = True
+        try:
+            os.write(self._wake_send, b"\x00")
+        except BlockingIOError:
+            pass  # pipe is full, thread is going to be woken anyway
+
+    def _writer_disable(self) -> None:
+        if (
+            self._io_thread is not None
+            and self._io_thread.ident == threading.get_ident()
+        ):
+            self._loop.call_soon_threadsafe(self._writer_done)
+        else:
+            self._writer_done()
+
+    def _writer_done(self) -> None:
+        """Notify `flush` waiters if the queue is still empty"""
+        if not self._write_queue or self._is_terminated:
+            self._write_done.set()
+
+    def _write_size_update(self, delta: int) -> None:
+        if self._io_thread is None or self._io_thread.ident != threading.get_ident():
+            super()._write_size_update(delta)
+            return
+        # events can only be set on the loop thread
+        self._write_size += delta
+        if self._write_size <= self._write_low and not self._write_drained.is_set():
+            self._loop.call_soon_threadsafe(self._write_size_update, 0)
+
+    def _reader_enable(self) -> None:
+        if self._is_terminated:
+            raise RuntimeError("connection has beend terminated")
+        if self._socket is None or self._io_thread is not None:
+            return
+        self._io_thread = threading.Thread(
+            target=self._io_run,
+            args=(self._socket,),
+            name=f"wayland-io-{self._path}",
+            daemon=True,
+        )
+        self._io_thread.start()
+
+    def _reader_disable(self) -> None:
+        thread = self._io_thread
+        if thread is None or thread.ident == threading.get_ident():
+            return
+        try:
+            os.write(self._wake_send, b"\x00")
+        except BlockingIOError:
+            pass
+        thread.join()
+
+    def _reader_pause(self) -> None:
+        # I/O thread stops polling for input once it is woken
+        self._io_wake()
+
+    def _reader_resume(self) -> None:
+        self._loop.call_soon(self._io_drain)
+
+    def _io_run(self, sock: socket.socket) -> None:
+        """I/O thread main loop"""
+        poll = select.poll()
+        poll.register(self._wake_recv, select.POLLIN)
+        poll.register(sock, select.POLLIN)
+        try:
+            while not self._is_terminated:
+                # flag is set before the check, so the loop wakes the thread
+                # if it lifts the pause after the check
+                self._io_stalled = True
+                events = 0
+                if (
+                    not self._read_paused
+                    and self._io_posted - self._io_consumed < READ_BUFF_MAX
+                ):
+                    self._io_stalled = False
+                    events |= select.POLLIN
+                if self._write_queue:
+                    events |= select.POLLOUT
+                poll.modify(sock, events)
+                for fd, event in poll.poll():
+                    if self._is_terminated:
+                        return
+                    if fd == self._wake_recv:
+                        # pipe must be drained before wake flag is reset,
+                        # otherwise wake request can be lost
+                        try:
+                            while os.read(self._wake_recv, 4096):
+                                pass
+                        except BlockingIOError:
+                            pass
+                        continue
+                    if event & select.POLLOUT:
+                        self._writer()
+                    if event & (select.POLLIN | select.POLLHUP | select.POLLERR):
+                        if not self._io_read(sock):
+                            return
+                if self._wake_pending:
+                    self._wake_pending = False
+                    self._writer()
+        except Exception:
+            error_msg = "wayland I/O thread failed"
+            logging.exception(error_msg)
+            self.terminate(error_msg)
+
+    def _io_read(self, sock: socket.socket) -> bool:
+        """Receive available data on the I/O thread and pass it to the loop"""
+        try:
+            self._read_syscalls += 1
+            data, ancdata, flags, _ = sock.recvmsg(
+                self._io_size,
+                READ_ANC_SIZE,
+                socket.MSG_CMSG_CLOEXEC,
+            )
+            fds = _ancdata_fds(ancdata, flags) if ancdata else ()
+            if len(data) == self._io_size:
+                self._io_size = min(READ_BUFF_MAX, 2 * self._io_size)
+        except BlockingIOError:
+            return True
+        except Exception:
+            error_msg = "failed to read from wayland socket"
+            logging.exception(error_msg)
+            self.terminate(error_msg)
+            return False
+        if not data:
+            self.terminate("connection closed")
+            return False
+        self._io_posted += len(data)
+        self._loop.call_soon_threadsafe(self._io_dispatch, data, fds)
+        return True
+
+    def _io_dispatch(self, data: bytes, fds: Sequence[int]) -> None:
+        """Dispatch data received by the I/O thread"""
+        if self._is_terminated:
+            for fd in fds:
+                os.close(fd)
+            return
+        self._read_fds.extend(fds)
+        self._read_fds_count += len(fds)
+        self._read_bytes += len(data)
+        self._io_backlog.append(data)
+        self._io_drain()
+
+    def _io_drain(self) -> None:
+        """Move received data to the read buffer and dispatch it unless paused"""
+        if self._read_paused or self._is_terminated:
+            return
+        # messages kept in the buffer while reading was paused
+        self._read_dispatch()
+        self._read_compact()
+        backlog = self._io_backlog
+        while backlog and not self._read_paused and not self._is_terminated:
+            data = backlog.popleft()
+            self._io_consumed += len(data)
+            start, end = self._read_start, self._read_end
+            if len(self._read_buff) - end < len(data):
+                # buffer only holds a partial message and a single chunk,
+                # as chunks are not copied while reading is paused
+                pending = end - start
+                if pending + len(data) > len(self._read_buff):
+                    self._read_resize(1 << (pending + len(data) - 1).bit_length())
+                else:
+                    self._read_buff[:pending] = self._read_view[start:end]
+                    self._read_start, self._read_end = 0, pending
+            end = self._read_end
+            self._read_buff[end : end + len(data)] = data
+            self._read_end = end + len(data)
+            self._read_dispatch()
+            self._read_compact()
+        if self._io_stalled and not self._is_terminated:
+            self._io_wake()
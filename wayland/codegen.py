@@ -1,14 +1,26 @@
 import argparse
+import hashlib
 import io
+import marshal
+import os
 import sys
+import tempfile
+import textwrap
+from functools import cache
+from importlib.util import MAGIC_NUMBER
 from pathlib import Path
+from types import CodeType, ModuleType
 
 from .base import (
+    MSG_HEADER,
+    PROXIES,
     ArgFd,
+    ArgFixed,
     ArgNewId,
     ArgObject,
     ArgUInt,
     ArgStr,
+    Interface,
     Protocol,
     WEvent,
     WRequest,
@@ -20,13 +32,216 @@ def generate_client(
     reliative: bool,
     deps: set[str],
 ) -> str:
-    """Generate client proxies from protocol"""
+    """Generate client proxies from protocol as a single module"""
     interfaces = proto.interfaces
     module = io.StringIO()
-    if reliative:
-        wayland_base = "..base"
-    else:
-        wayland_base = "wayland.base"
+    _generate_header(module, "..base" if reliative else "wayland.base")
+    for dep in sorted(deps):
+        print(f"from .{dep} import *", file=module)
+    print(file=module)
+
+    print("__all__ = [", file=module)
+    for iface_name in interfaces:
+        print(f'    "{_camle_case(iface_name)}",', file=module)
+    print("]\n", file=module)
+
+    for iface_name, interface in interfaces.items():
+        _generate_interface(module, proto, iface_name, interface)
+
+    module.write("# fmt: on\n")
+    return module.getvalue()
+
+
+def generate_client_package(
+    proto: Protocol,
+    owners: dict[str, str],
+) -> dict[str, str]:
+    """Generate client proxies from protocol as a package
+
+    Each interface is defined in its own module, which is only imported
+    when its proxy class is accessed for the first time. `owners` maps
+    interface names to the names of the protocols that define them.
+    Returns source of the package modules by file name.
+    """
+    files: dict[str, str] = {}
+    names = {_camle_case(iface_name): iface_name for iface_name in proto.interfaces}
+
+    package = io.StringIO()
+    print(
+        "# Auto generated do not edit manually\n"
+        "# fmt: off\n"
+        "# pyright: reportUnusedImport=false\n"
+        f'"""Proxies of `{proto.name}` protocol, loaded on first access"""\n'
+        "from __future__ import annotations\n"
+        "import typing\n"
+        "from importlib import import_module\n"
+        "\n"
+        "if typing.TYPE_CHECKING:",
+        file=package,
+    )
+    for class_name, iface_name in names.items():
+        print(f"    from .{iface_name} import {class_name}", file=package)
+    print("\n__all__ = [", file=package)
+    for class_name in names:
+        print(f'    "{class_name}",', file=package)
+    print("]\n\n_MODULES = {", file=package)
+    for class_name, iface_name in names.items():
+        print(f'    "{class_name}": ".{iface_name}",', file=package)
+    print(
+        "}\n"
+        "\n"
+        "\n"
+        "def __getattr__(name: str) -> typing.Any:\n"
+        "    module = _MODULES.get(name)\n"
+        "    if module is None:\n"
+        '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")\n'
+        "    value = getattr(import_module(module, __name__), name)\n"
+        "    globals()[name] = value\n"
+        "    return value\n"
+        "\n"
+        "\n"
+        "def __dir__() -> list[str]:\n"
+        "    return sorted({*globals(), *__all__})\n"
+        "# fmt: on",
+        file=package,
+    )
+    files["__init__.py"] = package.getvalue()
+
+    for iface_name, interface in proto.interfaces.items():
+        module = io.StringIO()
+        _generate_header(module, "...base")
+        # proxies created by requests are needed at runtime, the rest only
+        # by annotations, so their modules are not imported
+        runtime, annotations = _interface_refs(interface)
+        imports: list[str] = []
+        typing_imports: list[str] = []
+        for ref in sorted(runtime | annotations):
+            owner = owners.get(ref)
+            if owner is None or ref == iface_name:
+                continue
+            path = f".{ref}" if owner == proto.name else f"..{owner}.{ref}"
+            line = f"from {path} import {_camle_case(ref)}"
+            if ref in runtime:
+                imports.append(line)
+            else:
+                typing_imports.append(f"    {line}")
+        if typing_imports:
+            imports.append("if typing.TYPE_CHECKING:")
+            imports.extend(typing_imports)
+        for line in imports:
+            print(line, file=module)
+        print(f'\n__all__ = ["{_camle_case(iface_name)}"]\n', file=module)
+        _generate_interface(module, proto, iface_name, interface)
+        module.write("# fmt: on\n")
+        files[f"{iface_name}.py"] = module.getvalue()
+
+    return files
+
+
+def generate_index(protocols: list[Protocol]) -> str:
+    """Generate index of modules defining proxies of each interface"""
+    module = io.StringIO()
+    print(
+        "# Auto generated do not edit manually\n"
+        "# fmt: off\n"
+        '"""Generated protocols, proxy classes are imported on first use"""\n'
+        "from ..base import PROXIES\n"
+        "\n"
+        "PROXIES.register_modules(__name__, {",
+        file=module,
+    )
+    for proto in sorted(protocols, key=lambda proto: proto.name):
+        for iface_name in proto.interfaces:
+            print(f'    "{iface_name}": ".{proto.name}.{iface_name}",', file=module)
+    print("})\n# fmt: on", file=module)
+    return module.getvalue()
+
+
+# protocols compiled at runtime by cache key
+_COMPILED: dict[str, ModuleType] = {}
+
+
+def compile_protocol(path: str | Path, cache_dir: Path | None = None) -> ModuleType:
+    """Compile protocol XML file into a module with generated proxies
+
+    Module contains the same proxy classes as the code generation produces,
+    and they are registered in `PROXIES`. Compiled code is cached in
+    `cache_dir` (`$XDG_CACHE_HOME/wayland-py` by default) keyed by the hash
+    of XML content, so warm starts do not parse XML. Protocols that define
+    already known interfaces, such as generated ones, can not be compiled.
+    >>> compile_protocol("vendor-shell.xml").VendorShellV1
+    """
+    xml = Path(path).read_bytes()
+    key = _compile_key(xml)
+    module = _COMPILED.get(key)
+    if module is not None:
+        return module
+
+    name, interfaces, extern, code = _protocol_code(path, key, cache_dir)
+    for iface_name in interfaces:
+        if iface_name in PROXIES:
+            raise ValueError(f"[{name}] interface {iface_name} is already defined")
+    module = ModuleType(name)
+    # requests can create proxies of external interfaces
+    for iface_name in extern:
+        proxy_type = PROXIES.get(iface_name)
+        if proxy_type is not None:
+            setattr(module, _camle_case(iface_name), proxy_type)
+    exec(code, module.__dict__)
+    _COMPILED[key] = module
+    return module
+
+
+type _Compiled = tuple[str, list[str], list[str], CodeType]
+
+
+def _protocol_code(path: str | Path, key: str, cache_dir: Path | None) -> _Compiled:
+    """Load protocol name, interfaces, external interfaces and compiled code
+    from the cache, or compile it from XML and store it in the cache"""
+    if cache_dir is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(cache_home) / "wayland-py"
+    cache_file = cache_dir / f"{key}.bin"
+    try:
+        name, interfaces, extern, code = marshal.loads(cache_file.read_bytes())
+        if isinstance(code, CodeType):
+            return name, interfaces, extern, code
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # missing or corrupted cache entry
+
+    proto = Protocol.load(str(path))
+    source = generate_client(proto, reliative=False, deps=set())
+    code = compile(source, f"<protocol {proto.name}>", "exec")
+    compiled = (proto.name, list(proto.interfaces), sorted(proto.extern), code)
+    try:
+        # written atomically, other processes may load the same protocol
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir, prefix=f".{key}")
+        with os.fdopen(fd, "wb") as file:
+            file.write(marshal.dumps(compiled))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # cache is optional, it might be read-only
+    return compiled
+
+
+def _compile_key(xml: bytes) -> str:
+    """Cache key of compiled protocol
+
+    Code depends on the interpreter bytecode version and the generator.
+    """
+    digest = hashlib.sha256(MAGIC_NUMBER)
+    digest.update(_generator_digest())
+    digest.update(xml)
+    return digest.hexdigest()
+
+
+@cache
+def _generator_digest() -> bytes:
+    return hashlib.sha256(Path(__file__).read_bytes()).digest()
+
+
+def _generate_header(module: io.StringIO, wayland_base: str) -> None:
     print(
         "# Auto generated do not edit manually\n"
         "# fmt: off\n"
@@ -36,136 +251,176 @@ def generate_client(
         "import typing\n"
         "from typing import Any, ClassVar\n"
         "from collections.abc import Callable\n"
+        "from struct import Struct\n"
+        "from struct import error as struct_error\n"
         f"from {wayland_base} import *",
         file=module,
     )
-    for dep in deps:
-        print(f"from .{dep} import *", file=module)
-    print(file=module)
 
-    print("__all__ = [", file=module)
-    for iface_name in interfaces:
-        print(f'    "{_camle_case(iface_name)}",'.format(iface_name), file=module)
-    print("]\n", file=module)
 
-    for iface_name, interface in interfaces.items():
-        # define class
-        class_name = _camle_case(iface_name)
-        print(f"class {class_name}(Proxy):", file=module)
-        if interface.summary is not None:
-            print(f'    """{interface.summary}"""', file=module)
-
-        # define interface
-        print(f"    interface: ClassVar[Interface] = Interface(", file=module)
-        print(f'        name="{iface_name}",', file=module)
-        print(f"        version={interface.version},", file=module)
-        print(f"        requests=[", file=module)
-        for request in interface.requests:
-            print(
-                f'            WRequest("{request.name}", {request.args}),',
-                file=module,
+def _interface_refs(interface: Interface) -> tuple[set[str], set[str]]:
+    """Interfaces referenced by the generated proxy
+
+    Returns interfaces of proxies created by requests, which are needed at
+    runtime, and interfaces only used in type annotations.
+    """
+    runtime: set[str] = set()
+    annotations: set[str] = set()
+    messages: list[WRequest | WEvent] = [*interface.requests, *interface.events]
+    for message in messages:
+        for arg_desc in message.args:
+            if isinstance(arg_desc, (ArgObject, ArgNewId)) and arg_desc.interface:
+                if isinstance(arg_desc, ArgNewId) and isinstance(message, WRequest):
+                    runtime.add(arg_desc.interface)
+                else:
+                    annotations.add(arg_desc.interface)
+            elif isinstance(arg_desc, ArgUInt) and arg_desc.enum:
+                iface_name, _, _ = arg_desc.enum.rpartition(".")
+                if iface_name:
+                    annotations.add(iface_name)
+    return runtime, annotations - runtime
+
+
+def _generate_interface(
+    module: io.StringIO,
+    proto: Protocol,
+    iface_name: str,
+    interface: Interface,
+) -> None:
+    """Generate proxy class of the interface and register it"""
+    # define packers for requests with only fixed-width arguments
+    packers: list[str] = []
+    for request in interface.requests:
+        packer_format = _request_packer_format(request)
+        if packer_format is not None:
+            packers.append(
+                f'_pack_{iface_name}_{request.name} = Struct("{packer_format}").pack\n'
             )
-        print(f"        ],", file=module)
-        print(f"        events=[", file=module)
-        for event in interface.events:
-            print(f'            WEvent("{event.name}", {event.args}),', file=module)
-        print(f"        ],", file=module)
-        print("        enums=[", file=module)
-        for enum in interface.enums:
-            print("            WEnum(", file=module)
-            print(f'                name="{enum.name}",', file=module)
-            print(f"                values={{", file=module)
-            for var_name, value in enum.values.items():
-                print(f'                    "{var_name}": {value},', file=module)
-            print("                },", file=module)
-            if enum.flag:
-                print(f"                flag=True,", file=module)
-            print("            ),", file=module)
-        print("        ],", file=module)
-        print(f"    )\n", file=module)
-
-        # define init
+    if packers:
+        print("".join(packers), file=module)
+
+    # define class
+    class_name = _camle_case(iface_name)
+    print(f"class {class_name}(Proxy):", file=module)
+    if interface.summary is not None:
+        print(f'    """{interface.summary}"""', file=module)
+
+    # define interface
+    print(f"    interface: ClassVar[Interface] = Interface(", file=module)
+    print(f'        name="{iface_name}",', file=module)
+    print(f"        version={interface.version},", file=module)
+    print(f"        requests=[", file=module)
+    for request in interface.requests:
         print(
-            f"    def __init__(self, id: Id, connection: Connection) -> None:\n"
-            f"        super().__init__(id, connection, self.interface)\n",
+            f'            WRequest("{request.name}", {request.args}),',
             file=module,
         )
+    print(f"        ],", file=module)
+    print(f"        events=[", file=module)
+    for event in interface.events:
+        print(f'            WEvent("{event.name}", {event.args}),', file=module)
+    print(f"        ],", file=module)
+    print("        enums=[", file=module)
+    for enum in interface.enums:
+        print("            WEnum(", file=module)
+        print(f'                name="{enum.name}",', file=module)
+        print(f"                values={{", file=module)
+        for var_name, value in enum.values.items():
+            print(f'                    "{var_name}": {value},', file=module)
+        print("                },", file=module)
+        if enum.flag:
+            print(f"                flag=True,", file=module)
+        print("            ),", file=module)
+    print("        ],", file=module)
+    print(f"    )\n", file=module)
+
+    # define init
+    print(
+        f"    def __init__(self, id: Id, connection: Connection) -> None:\n"
+        f"        super().__init__(id, connection, self.interface)\n",
+        file=module,
+    )
 
-        # define requests
-        destructor: str | None = None
-        for opcode, request in enumerate(interface.requests):
-            if request.destructor and not request.args:
-                destructor = request.name
-            _generate_request(module, opcode, request, request.destructor)
-
-        # destroy scope
-        if destructor:
-            print(
-                f"    def __enter__(self) -> {class_name}:\n"
-                "        return self\n"
-                "\n"
-                "    def __exit__(self, *_: Any) -> None:\n"
-                f"        self.{destructor}()\n"
-                "\n"
-                "    def __del__(self) -> None:\n"
-                f"        self.{destructor}()\n",
-                file=module,
-            )
-
-        # define events
-        for opcode, event in enumerate(interface.events):
-            _generate_events(module, opcode, event)
+    # define requests
+    destructor: str | None = None
+    for opcode, request in enumerate(interface.requests):
+        if request.destructor and not request.args:
+            destructor = request.name
+        _generate_request(module, iface_name, opcode, request, request.destructor)
 
-        # special handling for `wayland.wl_callback`, to make it [Awaitable]
-        if iface_name == "wl_callback" and proto.name == "wayland":
-            print(
-                "    def __await__(self) -> typing.Generator[Any, None, int]:\n"
-                "        import asyncio\n"
-                "        def callback_done_handler(value: int) -> bool:\n"
-                "            future.set_result(value)\n"
-                "            return False\n"
-                "        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()\n"
-                "        self.on_done(callback_done_handler)\n"
-                "        self._futures.add(future)\n"
-                "        return future.__await__()\n",
-                file=module,
-            )
+    # destroy scope
+    if destructor:
+        print(
+            f"    def __enter__(self) -> {class_name}:\n"
+            "        return self\n"
+            "\n"
+            "    def __exit__(self, *_: Any) -> None:\n"
+            f"        self.{destructor}()\n"
+            "\n"
+            "    def __del__(self) -> None:\n"
+            f"        self.{destructor}()\n",
+            file=module,
+        )
 
-        # define enums
-        enums: dict[str, str] = {}
-        for enum in interface.enums:
-            enum_name = _camle_case(enum.name)
-            enums[enum.name] = enum_name
-            enum_type = "Flag" if enum.flag else "Enum"
-            print(f"    class {enum_name}({enum_type}):", file=module)
-            for var_name, value in enum.values.items():
-                # prefix digit only enums with "U"
-                prefix = "U" if var_name.isdigit() else ""
-                print(f"        {prefix}{var_name.upper()} = {value}", file=module)
-            print(file=module)
-        if enums:
-            module.write(
-                f"def _unpack_enum_{iface_name}(name: str, value: int) -> Any:\n"
-            )
-            for enum_name, enum_type in enums.items():
-                print(
-                    f'    if name == "{enum_name}":\n'
-                    f"        return {class_name}.{enum_type}(value)",
-                    file=module,
-                )
-            module.write("    return None\n")
-            module.write(
-                f"{class_name}.interface.unpack_enum = _unpack_enum_{iface_name}\n\n"
-            )
+    # define events
+    for opcode, event in enumerate(interface.events):
+        _generate_events(module, opcode, event)
 
-        module.write(f'PROXIES["{iface_name}"] = {class_name}\n\n')
+    # special handling for `wayland.wl_callback`, to make it [Awaitable]
+    if iface_name == "wl_callback" and proto.name == "wayland":
+        print(
+            "    def __await__(self) -> typing.Generator[Any, None, int]:\n"
+            "        import asyncio\n"
+            "        def callback_done_handler(value: int) -> bool:\n"
+            "            future.set_result(value)\n"
+            "            return False\n"
+            "        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()\n"
+            "        self.on_done(callback_done_handler)\n"
+            "        self._future_add(future)\n"
+            "        return future.__await__()\n",
+            file=module,
+        )
 
-    module.write("# fmt: on\n")
-    return module.getvalue()
+    # define enums
+    enums: dict[str, str] = {}
+    for enum in interface.enums:
+        enum_name = _camle_case(enum.name)
+        enums[enum.name] = enum_name
+        enum_type = "Flag" if enum.flag else "Enum"
+        print(f"    class {enum_name}({enum_type}):", file=module)
+        for var_name, value in enum.values.items():
+            # prefix digit only enums with "U"
+            prefix = "U" if var_name.isdigit() else ""
+            print(f"        {prefix}{var_name.upper()} = {value}", file=module)
+        print(file=module)
+    if enums:
+        print(f"{class_name}.interface.enum_types = {{", file=module)
+        for enum_name, enum_type in enums.items():
+            print(f'    "{enum_name}": {class_name}.{enum_type},', file=module)
+        print("}\n", file=module)
+
+    module.write(f'PROXIES["{iface_name}"] = {class_name}\n\n')
+
+
+def _request_packer_format(request: WRequest) -> str | None:
+    """Struct format packing header and arguments of the request
+
+    Returns `None` if request has arguments that are not fixed-width
+    """
+    codes = [MSG_HEADER.format]
+    for arg_desc in request.args:
+        if isinstance(arg_desc, ArgNewId) and arg_desc.interface is None:
+            return None
+        elif isinstance(arg_desc, (ArgUInt, ArgFixed, ArgObject, ArgNewId)):
+            codes.append(arg_desc.struct.format)
+        else:
+            return None
+    return "".join(codes)
 
 
 def _generate_request(
     module: io.StringIO,
+    iface_name: str,
     opcode: int,
     request: WRequest,
     is_destructor: bool,
@@ -216,6 +471,7 @@ def _generate_request(
     if request.summary:
         print(f'        """{request.summary}"""', file=module)
 
+    body = io.StringIO()
     if is_destructor:
         # no-op for disconnected destructor
         # fmt: off
@@ -223,7 +479,7 @@ def _generate_request(
             "        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:\n"
             "            return None\n"
             "        self._is_destroyed = True",
-            file=module,
+            file=body,
         )
         # fmt: on
 
@@ -236,12 +492,13 @@ def _generate_request(
                 f"        _proxy_iface = {name}._interface.name\n"
                 f"        if _proxy_iface != {name}_interface:\n"
                 f'            raise TypeError("[{{self}}({name})] expected {{{name}_interface}} (got {{_proxy_iface}})")',
-                file=module,
+                file=body,
             )
             continue
         print(
-            f"        {name} = self._connection.create_proxy({_camle_case(result_desc.interface)})",
-            file=module,
+            f"        {name} = self._connection.create_proxy({_camle_case(result_desc.interface)})\n"
+            f"        {name}._queue = self._queue",
+            file=body,
         )
         result_vals.append(result_desc.name)
 
@@ -249,10 +506,78 @@ def _generate_request(
     values = "()"
     if request.args:
         values = "({},)".format(", ".join(arg.name for arg in request.args))
+    result = ",".join(result_vals) if result_vals else None
+    if _request_packer_format(request) is None:
+        print(
+            f"        self._call(OpCode({opcode}), {values})\n"
+            f"        return {result}\n",
+            file=body,
+        )
+        _generate_request_scope(module, body.getvalue(), bool(result_vals))
+        return
+
+    # fixed-width requests are packed with a single struct, generic
+    # path is still used in debug mode as it does logging, and for invalid
+    # arguments as it reports them with descriptive errors
+    packed: list[str] = ["self._id", str(opcode), str(_request_size(request))]
+    checks: list[str] = ["_message is None", "self._connection._debug"]
+    for arg_desc in request.args:
+        name = arg_desc.name
+        if isinstance(arg_desc, ArgNewId):
+            packed.append(f"{name}._id")
+        elif isinstance(arg_desc, ArgObject):
+            if arg_desc.optional:
+                packed.append(f"0 if {name} is None else {name}._id")
+            else:
+                packed.append(f"{name}._id")
+            if arg_desc.interface is not None:
+                check = f'{name}._interface.name != "{arg_desc.interface}"'
+                if arg_desc.optional:
+                    check = f"({name} is not None and {check})"
+                checks.append(check)
+        elif isinstance(arg_desc, ArgFixed):
+            packed.append(f"int({name} * 256)")
+        elif isinstance(arg_desc, ArgUInt) and arg_desc.enum:
+            packed.append(f"{name}.value if isinstance({name}, Enum) else {name}")
+        else:
+            packed.append(name)
     print(
-        f"        self._call(OpCode({opcode}), {values})\n"
-        f'        return {",".join(result_vals) if result_vals else None}\n',
-        file=module,
+        "        try:\n"
+        f"            _message = _pack_{iface_name}_{request.name}({', '.join(packed)})\n"
+        "        except (AttributeError, TypeError, ValueError, struct_error):\n"
+        "            _message = None\n"
+        f"        if {' or '.join(checks)}:\n"
+        f"            self._call(OpCode({opcode}), {values})\n"
+        f"            return {result}",
+        file=body,
+    )
+    for result_desc in results_desc:
+        print(f"        {result_desc.name}._is_attached = True", file=body)
+    print(
+        "        self._connection._message_submit_packed(self._id, _message)\n"
+        f"        return {result}\n",
+        file=body,
+    )
+    _generate_request_scope(module, body.getvalue(), bool(result_vals))
+
+
+def _generate_request_scope(module: io.StringIO, body: str, creates: bool) -> None:
+    """Write request body, wrapping it in request scope if it creates proxies
+
+    In thread-safe mode new ids must reach the server in allocation order.
+    """
+    if creates:
+        print("        with self._connection._request_scope():", file=module)
+        body = textwrap.indent(body, "    ")
+    module.write(body)
+
+
+def _request_size(request: WRequest) -> int:
+    """Size of the fixed-width request including header"""
+    return MSG_HEADER.size + sum(
+        arg_desc.struct.size
+        for arg_desc in request.args
+        if isinstance(arg_desc, (ArgUInt, ArgFixed, ArgObject, ArgNewId))
     )
 
 
@@ -286,9 +611,7 @@ def _generate_events(
     if event.summary:
         print(f'        """{event.summary}"""', file=module)
     print(
-        f"        _opcode = OpCode({opcode})\n"
-        f"        old_handler, self._handlers[_opcode] = self._handlers[_opcode], handler\n"
-        f"        return old_handler\n",
+        f"        return self._handler_set(OpCode({opcode}), handler)\n",
         file=module,
     )
 
@@ -328,19 +651,21 @@ def main() -> None:
             continue
         protocols.append(Protocol.load(str(proto_file)))
 
-    deps: dict[str, set[str]] = {proto.name: set() for proto in protocols}
-    for protocol in protocols:
-        for extern in protocol.extern:
-            for dep in protocols:
-                if extern in dep.interfaces:
-                    deps[protocol.name].add(dep.name)
-
+    owners = {
+        iface_name: protocol.name
+        for protocol in protocols
+        for iface_name in protocol.interfaces
+    }
     target = Path(__file__).parent / "protocol"
     for protocol in protocols:
         print(protocol.name, file=sys.stderr)
-        module = generate_client(protocol, reliative=True, deps=deps[protocol.name])
-        module_file = target / f"{protocol.name}.py"
-        module_file.write_text(module)
+        package = target / protocol.name
+        package.mkdir(exist_ok=True)
+        for stale in package.glob("*.py"):
+            stale.unlink()
+        for name, source in generate_client_package(protocol, owners).items():
+            (package / name).write_text(source)
+    (target / "__init__.py").write_text(generate_index(protocols))
 
 
 if __name__ == "__main__":
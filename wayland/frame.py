@@ -0,0 +1,186 @@
+"""Frame pacing with frame callbacks
+
+>>> async for timestamp in FrameScheduler(wl_surf):
+...     draw(timestamp)
+...     wl_surf.commit()
+"""
+
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from struct import Struct
+
+from .base import MSG_HEADER, Connection
+from .protocol.wayland import WlCallback, WlSurface
+
+__all__ = ["FrameScheduler"]
+
+_FRAME_OPCODE = WlSurface.interface.requests_by_name["frame"][0]
+_FRAME = Struct(MSG_HEADER.format + "I")  # header and callback id
+_DONE_OPCODE = WlCallback.interface.events_by_name["done"][0]
+_TIMESTAMP_MASK = 0xFFFFFFFF  # frame timestamps are 32-bit milliseconds
+
+
+class FrameScheduler:
+    """Paces rendering of one or more surfaces by frame callbacks
+
+    Each iteration requests frame callbacks for `ready` surfaces, which must
+    be drawn and committed before the next iteration, and then waits until
+    the compositor asks for the next frame of at least one of them.
+    Callbacks that complete together result in a single wake-up, and
+    callback proxies are reused once the server has deleted them.
+    Yields timestamp of the last frame in milliseconds, `0` at the start.
+    """
+
+    __slots__ = [
+        "_connection",
+        "_surfaces",
+        "_handlers",
+        "_pending",
+        "_presented",
+        "_pool",
+        "_waiter",
+        "_started",
+        "ready",
+        "timestamp",
+        "interval",
+        "frames",
+        "missed",
+    ]
+
+    def __init__(self, *surfaces: WlSurface) -> None:
+        if not surfaces:
+            raise ValueError("at least one surface is required")
+        self._connection: Connection = surfaces[0]._connection
+        self._surfaces: list[WlSurface] = []
+        self._handlers: dict[WlSurface, Callable[[int], bool]] = {}
+        # frame callbacks that have been requested and not yet done
+        self._pending: dict[WlSurface, WlCallback] = {}
+        # surfaces with done callbacks since the last iteration
+        self._presented: list[WlSurface] = []
+        # done callbacks, reused once deleted by the server
+        self._pool: deque[WlCallback] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._started = False
+        self.ready: list[WlSurface] = []  # surfaces to be drawn this iteration
+        self.timestamp: int = 0  # timestamp of the latest frame
+        self.interval: float = 0.0  # estimated frame interval in milliseconds
+        self.frames: int = 0  # number of received frame callbacks
+        self.missed: int = 0  # number of frames skipped according to interval
+        for surface in surfaces:
+            self.add(surface)
+
+    def add(self, surface: WlSurface) -> None:
+        """Add surface, which is going to be ready on the next iteration"""
+        if surface._connection is not self._connection:
+            raise ValueError(f"[{surface}] belongs to a different connection")
+        if surface in self._handlers:
+            return
+        self._surfaces.append(surface)
+        self._handlers[surface] = self._done_handler(surface)
+        if self._started:
+            self._presented.append(surface)
+            self._wakeup()
+
+    def remove(self, surface: WlSurface) -> None:
+        """Stop pacing the surface"""
+        if self._handlers.pop(surface, None) is None:
+            return
+        self._surfaces.remove(surface)
+        if surface in self._presented:
+            self._presented.remove(surface)
+
+    def __aiter__(self) -> FrameScheduler:
+        return self
+
+    async def __anext__(self) -> int:
+        if not self._started:
+            self._started = True
+            self._presented.extend(self._surfaces)
+        while not self._presented:
+            self._surfaces = [surf for surf in self._surfaces if not surf._is_detached]
+            if self._connection.is_terminated or not self._surfaces:
+                raise StopAsyncIteration
+            waiter = self._waiter = asyncio.get_running_loop().create_future()
+            for surface in self._surfaces:
+                # detach of the surface or termination cancels the waiter
+                surface._future_add(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is None or task.cancelling():
+                    raise
+            finally:
+                self._waiter = None
+
+        self.ready, self._presented = self._presented, self.ready
+        self._presented.clear()
+        for surface in self.ready:
+            if surface not in self._pending and not surface._is_detached:
+                self._request(surface)
+        return self.timestamp
+
+    def _request(self, surface: WlSurface) -> None:
+        """Request frame callback for the surface"""
+        conn = self._connection
+        pool = self._pool
+        with conn._request_scope():
+            if pool and pool[0]._is_detached:
+                callback = pool.popleft()
+                conn._proxy_reuse(callback)
+                callback._queue = surface._queue
+                if conn._debug:
+                    surface._call(_FRAME_OPCODE, (callback,))
+                else:
+                    callback._is_attached = True
+                    conn._message_submit_packed(
+                        surface._id,
+                        _FRAME.pack(
+                            surface._id, _FRAME_OPCODE, _FRAME.size, callback._id
+                        ),
+                    )
+            else:
+                callback = surface.frame()
+        callback._handler_set(_DONE_OPCODE, self._handlers[surface])
+        self._pending[surface] = callback
+
+    def _done_handler(self, surface: WlSurface) -> Callable[[int], bool]:
+        """Create handler of frame callback done event for the surface"""
+
+        def on_done(timestamp: int) -> bool:
+            callback = self._pending.pop(surface, None)
+            if callback is not None:
+                self._pool.append(callback)
+            if surface in self._handlers:
+                self._presented.append(surface)
+            self._on_frame(timestamp)
+            self._wakeup()
+            return False
+
+        return on_done
+
+    def _on_frame(self, timestamp: int) -> None:
+        """Update frame statistics"""
+        self.frames += 1
+        if not self.timestamp:
+            self.timestamp = timestamp
+            return
+        delta = (timestamp - self.timestamp) & _TIMESTAMP_MASK
+        if not delta or delta > _TIMESTAMP_MASK // 2:
+            return  # same frame presented on another surface, or older frame
+        self.timestamp = timestamp
+        if not self.interval:
+            self.interval = float(delta)
+            return
+        frames = max(1, round(delta / self.interval))
+        self.missed += frames - 1
+        self.interval += (delta / frames - self.interval) / 8
+
+    def _wakeup(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
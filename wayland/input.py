@@ -0,0 +1,351 @@
+"""Input events coalesced by frame
+
+High polling rate devices send many motion and axis events between frame
+events, coalescers accumulate them and call a single handler per frame.
+>>> PointerCoalescer(wl_seat.get_pointer(), on_pointer_frame)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from .protocol.wayland import WlPointer, WlSurface, WlTouch
+
+__all__ = [
+    "PointerFrame",
+    "PointerCoalescer",
+    "TouchPoint",
+    "TouchFrame",
+    "TouchCoalescer",
+]
+
+
+class PointerFrame:
+    """Pointer events accumulated until `wl_pointer.frame`
+
+    Axis related lists are indexed by `WlPointer.Axis` value.
+    """
+
+    __slots__ = [
+        "surface",
+        "entered",
+        "left",
+        "serial",
+        "time",
+        "x",
+        "y",
+        "motions",
+        "buttons",
+        "axis",
+        "axis_discrete",
+        "axis_value120",
+        "axis_stop",
+        "axis_inverted",
+        "axis_source",
+    ]
+
+    def __init__(self, surface: WlSurface | None, x: float, y: float) -> None:
+        # surface with pointer focus at the end of the frame
+        self.surface: WlSurface | None = surface
+        # focus has been changed during the frame
+        self.entered: WlSurface | None = None
+        self.left: WlSurface | None = None
+        self.serial: int | None = None  # last serial of enter/leave/button
+        self.time: int | None = None  # last event timestamp
+        # last surface local position, number of coalesced motion events
+        self.x: float = x
+        self.y: float = y
+        self.motions: int = 0
+        # button changes in the order they happened
+        self.buttons: list[tuple[int, WlPointer.ButtonState]] = []
+        # summed scroll values
+        self.axis: list[float] = [0.0, 0.0]
+        self.axis_discrete: list[int] = [0, 0]
+        self.axis_value120: list[int] = [0, 0]
+        self.axis_stop: list[bool] = [False, False]
+        self.axis_inverted: list[bool] = [False, False]
+        self.axis_source: WlPointer.AxisSource | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"PointerFrame(surface={self.surface}, x={self.x}, y={self.y}, "
+            f"motions={self.motions}, buttons={self.buttons}, axis={self.axis})"
+        )
+
+
+class PointerCoalescer:
+    """Delivers accumulated pointer events once per `wl_pointer.frame`
+
+    Handler follows the usual convention, returning `False` unregisters it
+    together with all pointer handlers. Requires `wl_pointer` version 5 or
+    above, as older versions never send frame events.
+    """
+
+    __slots__ = ["_pointer", "_handler", "_frame"]
+
+    def __init__(
+        self,
+        pointer: WlPointer,
+        handler: Callable[[PointerFrame], bool],
+    ) -> None:
+        self._pointer = pointer
+        self._handler = handler
+        self._frame = PointerFrame(None, 0.0, 0.0)
+        pointer.on_enter(self._on_enter)
+        pointer.on_leave(self._on_leave)
+        pointer.on_motion(self._on_motion)
+        pointer.on_button(self._on_button)
+        pointer.on_axis(self._on_axis)
+        pointer.on_frame(self._on_frame)
+        pointer.on_axis_source(self._on_axis_source)
+        pointer.on_axis_stop(self._on_axis_stop)
+        pointer.on_axis_discrete(self._on_axis_discrete)
+        pointer.on_axis_value120(self._on_axis_value120)
+        pointer.on_axis_relative_direction(self._on_axis_relative_direction)
+
+    @property
+    def pending(self) -> PointerFrame:
+        """Frame which is being accumulated"""
+        return self._frame
+
+    def _on_enter(self, serial: int, surface: WlSurface, x: float, y: float) -> bool:
+        frame = self._frame
+        frame.surface = frame.entered = surface
+        frame.serial = serial
+        frame.x, frame.y = x, y
+        return True
+
+    def _on_leave(self, serial: int, surface: WlSurface) -> bool:
+        frame = self._frame
+        frame.left = surface
+        frame.surface = None
+        frame.serial = serial
+        return True
+
+    def _on_motion(self, time: int, x: float, y: float) -> bool:
+        frame = self._frame
+        frame.time, frame.x, frame.y = time, x, y
+        frame.motions += 1
+        return True
+
+    def _on_button(
+        self,
+        serial: int,
+        time: int,
+        button: int,
+        state: WlPointer.ButtonState,
+    ) -> bool:
+        frame = self._frame
+        frame.serial, frame.time = serial, time
+        frame.buttons.append((button, state))
+        return True
+
+    def _on_axis(self, time: int, axis: WlPointer.Axis, value: float) -> bool:
+        frame = self._frame
+        frame.time = time
+        frame.axis[axis.value] += value
+        return True
+
+    def _on_axis_source(self, source: WlPointer.AxisSource) -> bool:
+        self._frame.axis_source = source
+        return True
+
+    def _on_axis_stop(self, time: int, axis: WlPointer.Axis) -> bool:
+        frame = self._frame
+        frame.time = time
+        frame.axis_stop[axis.value] = True
+        return True
+
+    def _on_axis_discrete(self, axis: WlPointer.Axis, discrete: int) -> bool:
+        self._frame.axis_discrete[axis.value] += discrete
+        return True
+
+    def _on_axis_value120(self, axis: WlPointer.Axis, value120: int) -> bool:
+        self._frame.axis_value120[axis.value] += value120
+        return True
+
+    def _on_axis_relative_direction(
+        self,
+        axis: WlPointer.Axis,
+        direction: WlPointer.AxisRelativeDirection,
+    ) -> bool:
+        inverted = direction == WlPointer.AxisRelativeDirection.INVERTED
+        self._frame.axis_inverted[axis.value] = inverted
+        return True
+
+    def _on_frame(self) -> bool:
+        frame = self._frame
+        self._frame = PointerFrame(frame.surface, frame.x, frame.y)
+        if self._handler(frame):
+            return True
+        for name in self._pointer.interface.events_by_name:
+            self._pointer.on(name, _ignore)
+        return False
+
+
+class TouchPoint:
+    """State of a single touch point within a frame"""
+
+    __slots__ = [
+        "id",
+        "surface",
+        "x",
+        "y",
+        "down",
+        "up",
+        "motions",
+        "major",
+        "minor",
+        "orientation",
+    ]
+
+    def __init__(self, id: int, surface: WlSurface, x: float, y: float) -> None:
+        self.id: int = id
+        self.surface: WlSurface = surface
+        self.x: float = x
+        self.y: float = y
+        self.down: bool = False  # touch point has appeared in this frame
+        self.up: bool = False  # touch point has disappeared in this frame
+        self.motions: int = 0  # number of coalesced motion events
+        self.major: float | None = None
+        self.minor: float | None = None
+        self.orientation: float | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"TouchPoint(id={self.id}, x={self.x}, y={self.y}, "
+            f"down={self.down}, up={self.up}, motions={self.motions})"
+        )
+
+
+class TouchFrame:
+    """Touch events accumulated until `wl_touch.frame`"""
+
+    __slots__ = ["points", "serial", "time", "cancelled"]
+
+    def __init__(self) -> None:
+        # touch points changed during the frame by id
+        self.points: dict[int, TouchPoint] = {}
+        self.serial: int | None = None  # last serial of down/up
+        self.time: int | None = None  # last event timestamp
+        # compositor has taken over the touch sequence, all points are gone
+        self.cancelled: bool = False
+
+    def __repr__(self) -> str:
+        points = list(self.points.values())
+        return f"TouchFrame(points={points}, cancelled={self.cancelled})"
+
+
+class TouchCoalescer:
+    """Delivers accumulated touch events once per `wl_touch.frame`
+
+    Handler follows the usual convention, returning `False` unregisters it
+    together with all touch handlers.
+    """
+
+    __slots__ = ["_touch", "_handler", "_frame", "_points"]
+
+    def __init__(
+        self,
+        touch: WlTouch,
+        handler: Callable[[TouchFrame], bool],
+    ) -> None:
+        self._touch = touch
+        self._handler = handler
+        self._frame = TouchFrame()
+        self._points: dict[int, TouchPoint] = {}  # active touch points
+        touch.on_down(self._on_down)
+        touch.on_up(self._on_up)
+        touch.on_motion(self._on_motion)
+        touch.on_frame(self._on_frame)
+        touch.on_cancel(self._on_cancel)
+        touch.on_shape(self._on_shape)
+        touch.on_orientation(self._on_orientation)
+
+    @property
+    def pending(self) -> TouchFrame:
+        """Frame which is being accumulated"""
+        return self._frame
+
+    def _point(self, id: int) -> TouchPoint | None:
+        """Touch point changed in the current frame"""
+        point = self._frame.points.get(id)
+        if point is not None:
+            return point
+        active = self._points.get(id)
+        if active is None:
+            return None
+        point = TouchPoint(id, active.surface, active.x, active.y)
+        point.major, point.minor = active.major, active.minor
+        point.orientation = active.orientation
+        self._frame.points[id] = point
+        return point
+
+    def _on_down(
+        self,
+        serial: int,
+        time: int,
+        surface: WlSurface,
+        id: int,
+        x: float,
+        y: float,
+    ) -> bool:
+        frame = self._frame
+        frame.serial, frame.time = serial, time
+        point = TouchPoint(id, surface, x, y)
+        point.down = True
+        frame.points[id] = point
+        return True
+
+    def _on_up(self, serial: int, time: int, id: int) -> bool:
+        frame = self._frame
+        frame.serial, frame.time = serial, time
+        point = self._point(id)
+        if point is not None:
+            point.up = True
+        return True
+
+    def _on_motion(self, time: int, id: int, x: float, y: float) -> bool:
+        self._frame.time = time
+        point = self._point(id)
+        if point is not None:
+            point.x, point.y = x, y
+            point.motions += 1
+        return True
+
+    def _on_shape(self, id: int, major: float, minor: float) -> bool:
+        point = self._point(id)
+        if point is not None:
+            point.major, point.minor = major, minor
+        return True
+
+    def _on_orientation(self, id: int, orientation: float) -> bool:
+        point = self._point(id)
+        if point is not None:
+            point.orientation = orientation
+        return True
+
+    def _on_cancel(self) -> bool:
+        frame = self._frame
+        frame.cancelled = True
+        self._points.clear()
+        frame.points.clear()
+        return self._on_frame()
+
+    def _on_frame(self) -> bool:
+        frame = self._frame
+        self._frame = TouchFrame()
+        for id, point in frame.points.items():
+            if point.up:
+                self._points.pop(id, None)
+            else:
+                self._points[id] = point
+        if self._handler(frame):
+            return True
+        for name in self._touch.interface.events_by_name:
+            self._touch.on(name, _ignore)
+        return False
+
+
+def _ignore(*_: object) -> bool:
+    return True
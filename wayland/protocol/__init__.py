@@ -0,0 +1,37 @@
+# Auto generated do not edit manually
+# fmt: off
+"""Generated protocols, proxy classes are imported on first use"""
+from ..base import PROXIES
+
+PROXIES.register_modules(__name__, {
+    "wl_display": ".wayland.wl_display",
+    "wl_registry": ".wayland.wl_registry",
+    "wl_callback": ".wayland.wl_callback",
+    "wl_compositor": ".wayland.wl_compositor",
+    "wl_shm_pool": ".wayland.wl_shm_pool",
+    "wl_shm": ".wayland.wl_shm",
+    "wl_buffer": ".wayland.wl_buffer",
+    "wl_data_offer": ".wayland.wl_data_offer",
+    "wl_data_source": ".wayland.wl_data_source",
+    "wl_data_device": ".wayland.wl_data_device",
+    "wl_data_device_manager": ".wayland.wl_data_device_manager",
+    "wl_shell": ".wayland.wl_shell",
+    "wl_shell_surface": ".wayland.wl_shell_surface",
+    "wl_surface": ".wayland.wl_surface",
+    "wl_seat": ".wayland.wl_seat",
+    "wl_pointer": ".wayland.wl_pointer",
+    "wl_keyboard": ".wayland.wl_keyboard",
+    "wl_touch": ".wayland.wl_touch",
+    "wl_output": ".wayland.wl_output",
+    "wl_region": ".wayland.wl_region",
+    "wl_subcompositor": ".wayland.wl_subcompositor",
+    "wl_subsurface": ".wayland.wl_subsurface",
+    "zwlr_layer_shell_v1": ".wlr_layer_shell_unstable_v1.zwlr_layer_shell_v1",
+    "zwlr_layer_surface_v1": ".wlr_layer_shell_unstable_v1.zwlr_layer_surface_v1",
+    "xdg_wm_base": ".xdg_shell.xdg_wm_base",
+    "xdg_positioner": ".xdg_shell.xdg_positioner",
+    "xdg_surface": ".xdg_shell.xdg_surface",
+    "xdg_toplevel": ".xdg_shell.xdg_toplevel",
+    "xdg_popup": ".xdg_shell.xdg_popup",
+})
+# fmt: on
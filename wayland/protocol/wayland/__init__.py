@@ -0,0 +1,95 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportUnusedImport=false
+"""Proxies of `wayland` protocol, loaded on first access"""
+from __future__ import annotations
+import typing
+from importlib import import_module
+
+if typing.TYPE_CHECKING:
+    from .wl_display import WlDisplay
+    from .wl_registry import WlRegistry
+    from .wl_callback import WlCallback
+    from .wl_compositor import WlCompositor
+    from .wl_shm_pool import WlShmPool
+    from .wl_shm import WlShm
+    from .wl_buffer import WlBuffer
+    from .wl_data_offer import WlDataOffer
+    from .wl_data_source import WlDataSource
+    from .wl_data_device import WlDataDevice
+    from .wl_data_device_manager import WlDataDeviceManager
+    from .wl_shell import WlShell
+    from .wl_shell_surface import WlShellSurface
+    from .wl_surface import WlSurface
+    from .wl_seat import WlSeat
+    from .wl_pointer import WlPointer
+    from .wl_keyboard import WlKeyboard
+    from .wl_touch import WlTouch
+    from .wl_output import WlOutput
+    from .wl_region import WlRegion
+    from .wl_subcompositor import WlSubcompositor
+    from .wl_subsurface import WlSubsurface
+
+__all__ = [
+    "WlDisplay",
+    "WlRegistry",
+    "WlCallback",
+    "WlCompositor",
+    "WlShmPool",
+    "WlShm",
+    "WlBuffer",
+    "WlDataOffer",
+    "WlDataSource",
+    "WlDataDevice",
+    "WlDataDeviceManager",
+    "WlShell",
+    "WlShellSurface",
+    "WlSurface",
+    "WlSeat",
+    "WlPointer",
+    "WlKeyboard",
+    "WlTouch",
+    "WlOutput",
+    "WlRegion",
+    "WlSubcompositor",
+    "WlSubsurface",
+]
+
+_MODULES = {
+    "WlDisplay": ".wl_display",
+    "WlRegistry": ".wl_registry",
+    "WlCallback": ".wl_callback",
+    "WlCompositor": ".wl_compositor",
+    "WlShmPool": ".wl_shm_pool",
+    "WlShm": ".wl_shm",
+    "WlBuffer": ".wl_buffer",
+    "WlDataOffer": ".wl_data_offer",
+    "WlDataSource": ".wl_data_source",
+    "WlDataDevice": ".wl_data_device",
+    "WlDataDeviceManager": ".wl_data_device_manager",
+    "WlShell": ".wl_shell",
+    "WlShellSurface": ".wl_shell_surface",
+    "WlSurface": ".wl_surface",
+    "WlSeat": ".wl_seat",
+    "WlPointer": ".wl_pointer",
+    "WlKeyboard": ".wl_keyboard",
+    "WlTouch": ".wl_touch",
+    "WlOutput": ".wl_output",
+    "WlRegion": ".wl_region",
+    "WlSubcompositor": ".wl_subcompositor",
+    "WlSubsurface": ".wl_subsurface",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+# fmt: on
@@ -0,0 +1,65 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+
+__all__ = ["WlBuffer"]
+
+_pack_wl_buffer_destroy = Struct("IHH").pack
+
+class WlBuffer(Proxy):
+    """content for a wl_surface"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_buffer",
+        version=1,
+        requests=[
+            WRequest("destroy", []),
+        ],
+        events=[
+            WEvent("release", []),
+        ],
+        enums=[
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """destroy a buffer"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_buffer_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlBuffer:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_release(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """compositor releases buffer"""
+        return self._handler_set(OpCode(0), handler)
+
+PROXIES["wl_buffer"] = WlBuffer
+
+# fmt: on
@@ -0,0 +1,48 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+
+__all__ = ["WlCallback"]
+
+class WlCallback(Proxy):
+    """callback object"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_callback",
+        version=1,
+        requests=[
+        ],
+        events=[
+            WEvent("done", [ArgUInt("callback_data")]),
+        ],
+        enums=[
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def on_done(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """done event"""
+        return self._handler_set(OpCode(0), handler)
+
+    def __await__(self) -> typing.Generator[Any, None, int]:
+        import asyncio
+        def callback_done_handler(value: int) -> bool:
+            future.set_result(value)
+            return False
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self.on_done(callback_done_handler)
+        self._future_add(future)
+        return future.__await__()
+
+PROXIES["wl_callback"] = WlCallback
+
+# fmt: on
@@ -0,0 +1,72 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_region import WlRegion
+from .wl_surface import WlSurface
+
+__all__ = ["WlCompositor"]
+
+_pack_wl_compositor_create_surface = Struct("IHHI").pack
+_pack_wl_compositor_create_region = Struct("IHHI").pack
+
+class WlCompositor(Proxy):
+    """the compositor singleton"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_compositor",
+        version=6,
+        requests=[
+            WRequest("create_surface", [ArgNewId("id", "wl_surface")]),
+            WRequest("create_region", [ArgNewId("id", "wl_region")]),
+        ],
+        events=[
+        ],
+        enums=[
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def create_surface(self) -> WlSurface:
+        """create new surface"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlSurface)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_compositor_create_surface(self._id, 0, 12, id._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(0), (id,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def create_region(self) -> WlRegion:
+        """create new region"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlRegion)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_compositor_create_region(self._id, 1, 12, id._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(1), (id,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+PROXIES["wl_compositor"] = WlCompositor
+
+# fmt: on
@@ -0,0 +1,137 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from .wl_data_offer import WlDataOffer
+    from .wl_data_source import WlDataSource
+    from .wl_surface import WlSurface
+
+__all__ = ["WlDataDevice"]
+
+_pack_wl_data_device_start_drag = Struct("IHHIIII").pack
+_pack_wl_data_device_set_selection = Struct("IHHII").pack
+_pack_wl_data_device_release = Struct("IHH").pack
+
+class WlDataDevice(Proxy):
+    """data transfer device"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_data_device",
+        version=3,
+        requests=[
+            WRequest("start_drag", [ArgObject("source", "wl_data_source", True), ArgObject("origin", "wl_surface"), ArgObject("icon", "wl_surface", True), ArgUInt("serial")]),
+            WRequest("set_selection", [ArgObject("source", "wl_data_source", True), ArgUInt("serial")]),
+            WRequest("release", []),
+        ],
+        events=[
+            WEvent("data_offer", [ArgNewId("id", "wl_data_offer")]),
+            WEvent("enter", [ArgUInt("serial"), ArgObject("surface", "wl_surface"), ArgFixed("x"), ArgFixed("y"), ArgObject("id", "wl_data_offer", True)]),
+            WEvent("leave", []),
+            WEvent("motion", [ArgUInt("time"), ArgFixed("x"), ArgFixed("y")]),
+            WEvent("drop", []),
+            WEvent("selection", [ArgObject("id", "wl_data_offer", True)]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "role": 0,
+                    "used_source": 1,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def start_drag(self, source: WlDataSource | None, origin: WlSurface, icon: WlSurface | None, serial: int) -> None:
+        """start drag-and-drop operation"""
+        try:
+            _message = _pack_wl_data_device_start_drag(self._id, 0, 24, 0 if source is None else source._id, origin._id, 0 if icon is None else icon._id, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (source is not None and source._interface.name != "wl_data_source") or origin._interface.name != "wl_surface" or (icon is not None and icon._interface.name != "wl_surface"):
+            self._call(OpCode(0), (source, origin, icon, serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_selection(self, source: WlDataSource | None, serial: int) -> None:
+        """copy data to the selection"""
+        try:
+            _message = _pack_wl_data_device_set_selection(self._id, 1, 16, 0 if source is None else source._id, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (source is not None and source._interface.name != "wl_data_source"):
+            self._call(OpCode(1), (source, serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def release(self) -> None:
+        """destroy data device"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_data_device_release(self._id, 2, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(2), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlDataDevice:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        self.release()
+
+    def on_data_offer(self, handler: Callable[[WlDataOffer], bool]) -> Callable[[WlDataOffer], bool] | None:
+        """introduce a new wl_data_offer"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_enter(self, handler: Callable[[int, WlSurface, float, float, WlDataOffer | None], bool]) -> Callable[[int, WlSurface, float, float, WlDataOffer | None], bool] | None:
+        """initiate drag-and-drop session"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_leave(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """end drag-and-drop session"""
+        return self._handler_set(OpCode(2), handler)
+
+    def on_motion(self, handler: Callable[[int, float, float], bool]) -> Callable[[int, float, float], bool] | None:
+        """drag-and-drop session motion"""
+        return self._handler_set(OpCode(3), handler)
+
+    def on_drop(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """end drag-and-drop session successfully"""
+        return self._handler_set(OpCode(4), handler)
+
+    def on_selection(self, handler: Callable[[WlDataOffer | None], bool]) -> Callable[[WlDataOffer | None], bool] | None:
+        """advertise new selection"""
+        return self._handler_set(OpCode(5), handler)
+
+    class Error(Enum):
+        ROLE = 0
+        USED_SOURCE = 1
+
+WlDataDevice.interface.enum_types = {
+    "error": WlDataDevice.Error,
+}
+
+PROXIES["wl_data_device"] = WlDataDevice
+
+# fmt: on
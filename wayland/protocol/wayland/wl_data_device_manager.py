@@ -0,0 +1,94 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_data_device import WlDataDevice
+from .wl_data_source import WlDataSource
+if typing.TYPE_CHECKING:
+    from .wl_seat import WlSeat
+
+__all__ = ["WlDataDeviceManager"]
+
+_pack_wl_data_device_manager_create_data_source = Struct("IHHI").pack
+_pack_wl_data_device_manager_get_data_device = Struct("IHHII").pack
+
+class WlDataDeviceManager(Proxy):
+    """data transfer interface"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_data_device_manager",
+        version=3,
+        requests=[
+            WRequest("create_data_source", [ArgNewId("id", "wl_data_source")]),
+            WRequest("get_data_device", [ArgNewId("id", "wl_data_device"), ArgObject("seat", "wl_seat")]),
+        ],
+        events=[
+        ],
+        enums=[
+            WEnum(
+                name="dnd_action",
+                values={
+                    "none": 0,
+                    "copy": 1,
+                    "move": 2,
+                    "ask": 4,
+                },
+                flag=True,
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def create_data_source(self) -> WlDataSource:
+        """create a new data source"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlDataSource)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_data_device_manager_create_data_source(self._id, 0, 12, id._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(0), (id,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def get_data_device(self, seat: WlSeat) -> WlDataDevice:
+        """create a new data device"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlDataDevice)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_data_device_manager_get_data_device(self._id, 1, 16, id._id, seat._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug or seat._interface.name != "wl_seat":
+                self._call(OpCode(1), (id, seat,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    class DndAction(Flag):
+        NONE = 0
+        COPY = 1
+        MOVE = 2
+        ASK = 4
+
+WlDataDeviceManager.interface.enum_types = {
+    "dnd_action": WlDataDeviceManager.DndAction,
+}
+
+PROXIES["wl_data_device_manager"] = WlDataDeviceManager
+
+# fmt: on
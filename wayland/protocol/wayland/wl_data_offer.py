@@ -0,0 +1,136 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from .wl_data_device_manager import WlDataDeviceManager
+
+__all__ = ["WlDataOffer"]
+
+_pack_wl_data_offer_destroy = Struct("IHH").pack
+_pack_wl_data_offer_finish = Struct("IHH").pack
+_pack_wl_data_offer_set_actions = Struct("IHHII").pack
+
+class WlDataOffer(Proxy):
+    """offer to transfer data"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_data_offer",
+        version=3,
+        requests=[
+            WRequest("accept", [ArgUInt("serial"), ArgStr("mime_type", True)]),
+            WRequest("receive", [ArgStr("mime_type"), ArgFd("fd")]),
+            WRequest("destroy", []),
+            WRequest("finish", []),
+            WRequest("set_actions", [ArgUInt("dnd_actions", "wl_data_device_manager.dnd_action"), ArgUInt("preferred_action", "wl_data_device_manager.dnd_action")]),
+        ],
+        events=[
+            WEvent("offer", [ArgStr("mime_type")]),
+            WEvent("source_actions", [ArgUInt("source_actions", "wl_data_device_manager.dnd_action")]),
+            WEvent("action", [ArgUInt("dnd_action", "wl_data_device_manager.dnd_action")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "invalid_finish": 0,
+                    "invalid_action_mask": 1,
+                    "invalid_action": 2,
+                    "invalid_offer": 3,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def accept(self, serial: int, mime_type: str | None) -> None:
+        """accept one of the offered mime types"""
+        self._call(OpCode(0), (serial, mime_type,))
+        return None
+
+    def receive(self, mime_type: str, fd: Fd) -> None:
+        """request that the data is transferred"""
+        self._call(OpCode(1), (mime_type, fd,))
+        return None
+
+    def destroy(self) -> None:
+        """destroy data offer"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_data_offer_destroy(self._id, 2, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(2), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def finish(self) -> None:
+        """the offer will no longer be used"""
+        try:
+            _message = _pack_wl_data_offer_finish(self._id, 3, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(3), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_actions(self, dnd_actions: WlDataDeviceManager.DndAction, preferred_action: WlDataDeviceManager.DndAction) -> None:
+        """set the available/preferred drag-and-drop actions"""
+        try:
+            _message = _pack_wl_data_offer_set_actions(self._id, 4, 16, dnd_actions.value if isinstance(dnd_actions, Enum) else dnd_actions, preferred_action.value if isinstance(preferred_action, Enum) else preferred_action)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(4), (dnd_actions, preferred_action,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlDataOffer:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_offer(self, handler: Callable[[str], bool]) -> Callable[[str], bool] | None:
+        """advertise offered mime type"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_source_actions(self, handler: Callable[[WlDataDeviceManager.DndAction], bool]) -> Callable[[WlDataDeviceManager.DndAction], bool] | None:
+        """notify the source-side available actions"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_action(self, handler: Callable[[WlDataDeviceManager.DndAction], bool]) -> Callable[[WlDataDeviceManager.DndAction], bool] | None:
+        """notify the selected action"""
+        return self._handler_set(OpCode(2), handler)
+
+    class Error(Enum):
+        INVALID_FINISH = 0
+        INVALID_ACTION_MASK = 1
+        INVALID_ACTION = 2
+        INVALID_OFFER = 3
+
+WlDataOffer.interface.enum_types = {
+    "error": WlDataOffer.Error,
+}
+
+PROXIES["wl_data_offer"] = WlDataOffer
+
+# fmt: on
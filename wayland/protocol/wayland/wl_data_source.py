@@ -0,0 +1,127 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from .wl_data_device_manager import WlDataDeviceManager
+
+__all__ = ["WlDataSource"]
+
+_pack_wl_data_source_destroy = Struct("IHH").pack
+_pack_wl_data_source_set_actions = Struct("IHHI").pack
+
+class WlDataSource(Proxy):
+    """offer to transfer data"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_data_source",
+        version=3,
+        requests=[
+            WRequest("offer", [ArgStr("mime_type")]),
+            WRequest("destroy", []),
+            WRequest("set_actions", [ArgUInt("dnd_actions", "wl_data_device_manager.dnd_action")]),
+        ],
+        events=[
+            WEvent("target", [ArgStr("mime_type", True)]),
+            WEvent("send", [ArgStr("mime_type"), ArgFd("fd")]),
+            WEvent("cancelled", []),
+            WEvent("dnd_drop_performed", []),
+            WEvent("dnd_finished", []),
+            WEvent("action", [ArgUInt("dnd_action", "wl_data_device_manager.dnd_action")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "invalid_action_mask": 0,
+                    "invalid_source": 1,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def offer(self, mime_type: str) -> None:
+        """add an offered mime type"""
+        self._call(OpCode(0), (mime_type,))
+        return None
+
+    def destroy(self) -> None:
+        """destroy the data source"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_data_source_destroy(self._id, 1, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_actions(self, dnd_actions: WlDataDeviceManager.DndAction) -> None:
+        """set the available drag-and-drop actions"""
+        try:
+            _message = _pack_wl_data_source_set_actions(self._id, 2, 12, dnd_actions.value if isinstance(dnd_actions, Enum) else dnd_actions)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(2), (dnd_actions,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlDataSource:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_target(self, handler: Callable[[str | None], bool]) -> Callable[[str | None], bool] | None:
+        """a target accepts an offered mime type"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_send(self, handler: Callable[[str, Fd], bool]) -> Callable[[str, Fd], bool] | None:
+        """send the data"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_cancelled(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """selection was cancelled"""
+        return self._handler_set(OpCode(2), handler)
+
+    def on_dnd_drop_performed(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """the drag-and-drop operation physically finished"""
+        return self._handler_set(OpCode(3), handler)
+
+    def on_dnd_finished(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """the drag-and-drop operation concluded"""
+        return self._handler_set(OpCode(4), handler)
+
+    def on_action(self, handler: Callable[[WlDataDeviceManager.DndAction], bool]) -> Callable[[WlDataDeviceManager.DndAction], bool] | None:
+        """notify the selected action"""
+        return self._handler_set(OpCode(5), handler)
+
+    class Error(Enum):
+        INVALID_ACTION_MASK = 0
+        INVALID_SOURCE = 1
+
+WlDataSource.interface.enum_types = {
+    "error": WlDataSource.Error,
+}
+
+PROXIES["wl_data_source"] = WlDataSource
+
+# fmt: on
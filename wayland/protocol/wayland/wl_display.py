@@ -0,0 +1,101 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_callback import WlCallback
+from .wl_registry import WlRegistry
+
+__all__ = ["WlDisplay"]
+
+_pack_wl_display_sync = Struct("IHHI").pack
+_pack_wl_display_get_registry = Struct("IHHI").pack
+
+class WlDisplay(Proxy):
+    """core global object"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_display",
+        version=1,
+        requests=[
+            WRequest("sync", [ArgNewId("callback", "wl_callback")]),
+            WRequest("get_registry", [ArgNewId("registry", "wl_registry")]),
+        ],
+        events=[
+            WEvent("error", [ArgObject("object_id", None), ArgUInt("code"), ArgStr("message")]),
+            WEvent("delete_id", [ArgUInt("id")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "invalid_object": 0,
+                    "invalid_method": 1,
+                    "no_memory": 2,
+                    "implementation": 3,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def sync(self) -> WlCallback:
+        """asynchronous roundtrip"""
+        with self._connection._request_scope():
+            callback = self._connection.create_proxy(WlCallback)
+            callback._queue = self._queue
+            try:
+                _message = _pack_wl_display_sync(self._id, 0, 12, callback._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(0), (callback,))
+                return callback
+            callback._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return callback
+
+    def get_registry(self) -> WlRegistry:
+        """get global registry object"""
+        with self._connection._request_scope():
+            registry = self._connection.create_proxy(WlRegistry)
+            registry._queue = self._queue
+            try:
+                _message = _pack_wl_display_get_registry(self._id, 1, 12, registry._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(1), (registry,))
+                return registry
+            registry._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return registry
+
+    def on_error(self, handler: Callable[[Proxy, int, str], bool]) -> Callable[[Proxy, int, str], bool] | None:
+        """fatal error event"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_delete_id(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """acknowledge object ID deletion"""
+        return self._handler_set(OpCode(1), handler)
+
+    class Error(Enum):
+        INVALID_OBJECT = 0
+        INVALID_METHOD = 1
+        NO_MEMORY = 2
+        IMPLEMENTATION = 3
+
+WlDisplay.interface.enum_types = {
+    "error": WlDisplay.Error,
+}
+
+PROXIES["wl_display"] = WlDisplay
+
+# fmt: on
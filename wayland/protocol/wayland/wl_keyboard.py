@@ -0,0 +1,119 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from .wl_surface import WlSurface
+
+__all__ = ["WlKeyboard"]
+
+_pack_wl_keyboard_release = Struct("IHH").pack
+
+class WlKeyboard(Proxy):
+    """keyboard input device"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_keyboard",
+        version=9,
+        requests=[
+            WRequest("release", []),
+        ],
+        events=[
+            WEvent("keymap", [ArgUInt("format", "keymap_format"), ArgFd("fd"), ArgUInt("size")]),
+            WEvent("enter", [ArgUInt("serial"), ArgObject("surface", "wl_surface"), ArgArray("keys")]),
+            WEvent("leave", [ArgUInt("serial"), ArgObject("surface", "wl_surface")]),
+            WEvent("key", [ArgUInt("serial"), ArgUInt("time"), ArgUInt("key"), ArgUInt("state", "key_state")]),
+            WEvent("modifiers", [ArgUInt("serial"), ArgUInt("mods_depressed"), ArgUInt("mods_latched"), ArgUInt("mods_locked"), ArgUInt("group")]),
+            WEvent("repeat_info", [ArgInt("rate"), ArgInt("delay")]),
+        ],
+        enums=[
+            WEnum(
+                name="keymap_format",
+                values={
+                    "no_keymap": 0,
+                    "xkb_v1": 1,
+                },
+            ),
+            WEnum(
+                name="key_state",
+                values={
+                    "released": 0,
+                    "pressed": 1,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def release(self) -> None:
+        """release the keyboard object"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_keyboard_release(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlKeyboard:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        self.release()
+
+    def on_keymap(self, handler: Callable[[KeymapFormat, Fd, int], bool]) -> Callable[[KeymapFormat, Fd, int], bool] | None:
+        """keyboard mapping"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_enter(self, handler: Callable[[int, WlSurface, bytes], bool]) -> Callable[[int, WlSurface, bytes], bool] | None:
+        """enter event"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_leave(self, handler: Callable[[int, WlSurface], bool]) -> Callable[[int, WlSurface], bool] | None:
+        """leave event"""
+        return self._handler_set(OpCode(2), handler)
+
+    def on_key(self, handler: Callable[[int, int, int, KeyState], bool]) -> Callable[[int, int, int, KeyState], bool] | None:
+        """key event"""
+        return self._handler_set(OpCode(3), handler)
+
+    def on_modifiers(self, handler: Callable[[int, int, int, int, int], bool]) -> Callable[[int, int, int, int, int], bool] | None:
+        """modifier and group state"""
+        return self._handler_set(OpCode(4), handler)
+
+    def on_repeat_info(self, handler: Callable[[int, int], bool]) -> Callable[[int, int], bool] | None:
+        """repeat rate and delay"""
+        return self._handler_set(OpCode(5), handler)
+
+    class KeymapFormat(Enum):
+        NO_KEYMAP = 0
+        XKB_V1 = 1
+
+    class KeyState(Enum):
+        RELEASED = 0
+        PRESSED = 1
+
+WlKeyboard.interface.enum_types = {
+    "keymap_format": WlKeyboard.KeymapFormat,
+    "key_state": WlKeyboard.KeyState,
+}
+
+PROXIES["wl_keyboard"] = WlKeyboard
+
+# fmt: on
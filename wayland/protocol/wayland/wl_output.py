@@ -0,0 +1,150 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+
+__all__ = ["WlOutput"]
+
+_pack_wl_output_release = Struct("IHH").pack
+
+class WlOutput(Proxy):
+    """compositor output region"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_output",
+        version=4,
+        requests=[
+            WRequest("release", []),
+        ],
+        events=[
+            WEvent("geometry", [ArgInt("x"), ArgInt("y"), ArgInt("physical_width"), ArgInt("physical_height"), ArgInt("subpixel", "subpixel"), ArgStr("make"), ArgStr("model"), ArgInt("transform", "transform")]),
+            WEvent("mode", [ArgUInt("flags", "mode"), ArgInt("width"), ArgInt("height"), ArgInt("refresh")]),
+            WEvent("done", []),
+            WEvent("scale", [ArgInt("factor")]),
+            WEvent("name", [ArgStr("name")]),
+            WEvent("description", [ArgStr("description")]),
+        ],
+        enums=[
+            WEnum(
+                name="subpixel",
+                values={
+                    "unknown": 0,
+                    "none": 1,
+                    "horizontal_rgb": 2,
+                    "horizontal_bgr": 3,
+                    "vertical_rgb": 4,
+                    "vertical_bgr": 5,
+                },
+            ),
+            WEnum(
+                name="transform",
+                values={
+                    "normal": 0,
+                    "90": 1,
+                    "180": 2,
+                    "270": 3,
+                    "flipped": 4,
+                    "flipped_90": 5,
+                    "flipped_180": 6,
+                    "flipped_270": 7,
+                },
+            ),
+            WEnum(
+                name="mode",
+                values={
+                    "current": 1,
+                    "preferred": 2,
+                },
+                flag=True,
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def release(self) -> None:
+        """release the output object"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_output_release(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlOutput:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        self.release()
+
+    def on_geometry(self, handler: Callable[[int, int, int, int, Subpixel, str, str, Transform], bool]) -> Callable[[int, int, int, int, Subpixel, str, str, Transform], bool] | None:
+        """properties of the output"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_mode(self, handler: Callable[[Mode, int, int, int], bool]) -> Callable[[Mode, int, int, int], bool] | None:
+        """advertise available modes for the output"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_done(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """sent all information about output"""
+        return self._handler_set(OpCode(2), handler)
+
+    def on_scale(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """output scaling properties"""
+        return self._handler_set(OpCode(3), handler)
+
+    def on_name(self, handler: Callable[[str], bool]) -> Callable[[str], bool] | None:
+        """name of this output"""
+        return self._handler_set(OpCode(4), handler)
+
+    def on_description(self, handler: Callable[[str], bool]) -> Callable[[str], bool] | None:
+        """human-readable description of this output"""
+        return self._handler_set(OpCode(5), handler)
+
+    class Subpixel(Enum):
+        UNKNOWN = 0
+        NONE = 1
+        HORIZONTAL_RGB = 2
+        HORIZONTAL_BGR = 3
+        VERTICAL_RGB = 4
+        VERTICAL_BGR = 5
+
+    class Transform(Enum):
+        NORMAL = 0
+        U90 = 1
+        U180 = 2
+        U270 = 3
+        FLIPPED = 4
+        FLIPPED_90 = 5
+        FLIPPED_180 = 6
+        FLIPPED_270 = 7
+
+    class Mode(Flag):
+        CURRENT = 1
+        PREFERRED = 2
+
+WlOutput.interface.enum_types = {
+    "subpixel": WlOutput.Subpixel,
+    "transform": WlOutput.Transform,
+    "mode": WlOutput.Mode,
+}
+
+PROXIES["wl_output"] = WlOutput
+
+# fmt: on
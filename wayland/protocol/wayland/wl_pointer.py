@@ -0,0 +1,196 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from .wl_surface import WlSurface
+
+__all__ = ["WlPointer"]
+
+_pack_wl_pointer_set_cursor = Struct("IHHIIii").pack
+_pack_wl_pointer_release = Struct("IHH").pack
+
+class WlPointer(Proxy):
+    """pointer input device"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_pointer",
+        version=9,
+        requests=[
+            WRequest("set_cursor", [ArgUInt("serial"), ArgObject("surface", "wl_surface", True), ArgInt("hotspot_x"), ArgInt("hotspot_y")]),
+            WRequest("release", []),
+        ],
+        events=[
+            WEvent("enter", [ArgUInt("serial"), ArgObject("surface", "wl_surface"), ArgFixed("surface_x"), ArgFixed("surface_y")]),
+            WEvent("leave", [ArgUInt("serial"), ArgObject("surface", "wl_surface")]),
+            WEvent("motion", [ArgUInt("time"), ArgFixed("surface_x"), ArgFixed("surface_y")]),
+            WEvent("button", [ArgUInt("serial"), ArgUInt("time"), ArgUInt("button"), ArgUInt("state", "button_state")]),
+            WEvent("axis", [ArgUInt("time"), ArgUInt("axis", "axis"), ArgFixed("value")]),
+            WEvent("frame", []),
+            WEvent("axis_source", [ArgUInt("axis_source", "axis_source")]),
+            WEvent("axis_stop", [ArgUInt("time"), ArgUInt("axis", "axis")]),
+            WEvent("axis_discrete", [ArgUInt("axis", "axis"), ArgInt("discrete")]),
+            WEvent("axis_value120", [ArgUInt("axis", "axis"), ArgInt("value120")]),
+            WEvent("axis_relative_direction", [ArgUInt("axis", "axis"), ArgUInt("direction", "axis_relative_direction")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "role": 0,
+                },
+            ),
+            WEnum(
+                name="button_state",
+                values={
+                    "released": 0,
+                    "pressed": 1,
+                },
+            ),
+            WEnum(
+                name="axis",
+                values={
+                    "vertical_scroll": 0,
+                    "horizontal_scroll": 1,
+                },
+            ),
+            WEnum(
+                name="axis_source",
+                values={
+                    "wheel": 0,
+                    "finger": 1,
+                    "continuous": 2,
+                    "wheel_tilt": 3,
+                },
+            ),
+            WEnum(
+                name="axis_relative_direction",
+                values={
+                    "identical": 0,
+                    "inverted": 1,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def set_cursor(self, serial: int, surface: WlSurface | None, hotspot_x: int, hotspot_y: int) -> None:
+        """set the pointer surface"""
+        try:
+            _message = _pack_wl_pointer_set_cursor(self._id, 0, 24, serial, 0 if surface is None else surface._id, hotspot_x, hotspot_y)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (surface is not None and surface._interface.name != "wl_surface"):
+            self._call(OpCode(0), (serial, surface, hotspot_x, hotspot_y,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def release(self) -> None:
+        """release the pointer object"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_pointer_release(self._id, 1, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlPointer:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        self.release()
+
+    def on_enter(self, handler: Callable[[int, WlSurface, float, float], bool]) -> Callable[[int, WlSurface, float, float], bool] | None:
+        """enter event"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_leave(self, handler: Callable[[int, WlSurface], bool]) -> Callable[[int, WlSurface], bool] | None:
+        """leave event"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_motion(self, handler: Callable[[int, float, float], bool]) -> Callable[[int, float, float], bool] | None:
+        """pointer motion event"""
+        return self._handler_set(OpCode(2), handler)
+
+    def on_button(self, handler: Callable[[int, int, int, ButtonState], bool]) -> Callable[[int, int, int, ButtonState], bool] | None:
+        """pointer button event"""
+        return self._handler_set(OpCode(3), handler)
+
+    def on_axis(self, handler: Callable[[int, Axis, float], bool]) -> Callable[[int, Axis, float], bool] | None:
+        """axis event"""
+        return self._handler_set(OpCode(4), handler)
+
+    def on_frame(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """end of a pointer event sequence"""
+        return self._handler_set(OpCode(5), handler)
+
+    def on_axis_source(self, handler: Callable[[AxisSource], bool]) -> Callable[[AxisSource], bool] | None:
+        """axis source event"""
+        return self._handler_set(OpCode(6), handler)
+
+    def on_axis_stop(self, handler: Callable[[int, Axis], bool]) -> Callable[[int, Axis], bool] | None:
+        """axis stop event"""
+        return self._handler_set(OpCode(7), handler)
+
+    def on_axis_discrete(self, handler: Callable[[Axis, int], bool]) -> Callable[[Axis, int], bool] | None:
+        """axis click event"""
+        return self._handler_set(OpCode(8), handler)
+
+    def on_axis_value120(self, handler: Callable[[Axis, int], bool]) -> Callable[[Axis, int], bool] | None:
+        """axis high-resolution scroll event"""
+        return self._handler_set(OpCode(9), handler)
+
+    def on_axis_relative_direction(self, handler: Callable[[Axis, AxisRelativeDirection], bool]) -> Callable[[Axis, AxisRelativeDirection], bool] | None:
+        """axis relative physical direction event"""
+        return self._handler_set(OpCode(10), handler)
+
+    class Error(Enum):
+        ROLE = 0
+
+    class ButtonState(Enum):
+        RELEASED = 0
+        PRESSED = 1
+
+    class Axis(Enum):
+        VERTICAL_SCROLL = 0
+        HORIZONTAL_SCROLL = 1
+
+    class AxisSource(Enum):
+        WHEEL = 0
+        FINGER = 1
+        CONTINUOUS = 2
+        WHEEL_TILT = 3
+
+    class AxisRelativeDirection(Enum):
+        IDENTICAL = 0
+        INVERTED = 1
+
+WlPointer.interface.enum_types = {
+    "error": WlPointer.Error,
+    "button_state": WlPointer.ButtonState,
+    "axis": WlPointer.Axis,
+    "axis_source": WlPointer.AxisSource,
+    "axis_relative_direction": WlPointer.AxisRelativeDirection,
+}
+
+PROXIES["wl_pointer"] = WlPointer
+
+# fmt: on
@@ -0,0 +1,88 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+
+__all__ = ["WlRegion"]
+
+_pack_wl_region_destroy = Struct("IHH").pack
+_pack_wl_region_add = Struct("IHHiiii").pack
+_pack_wl_region_subtract = Struct("IHHiiii").pack
+
+class WlRegion(Proxy):
+    """region interface"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_region",
+        version=1,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("add", [ArgInt("x"), ArgInt("y"), ArgInt("width"), ArgInt("height")]),
+            WRequest("subtract", [ArgInt("x"), ArgInt("y"), ArgInt("width"), ArgInt("height")]),
+        ],
+        events=[
+        ],
+        enums=[
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """destroy region"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_region_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def add(self, x: int, y: int, width: int, height: int) -> None:
+        """add rectangle to region"""
+        try:
+            _message = _pack_wl_region_add(self._id, 1, 24, x, y, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), (x, y, width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def subtract(self, x: int, y: int, width: int, height: int) -> None:
+        """subtract rectangle from region"""
+        try:
+            _message = _pack_wl_region_subtract(self._id, 2, 24, x, y, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(2), (x, y, width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlRegion:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+PROXIES["wl_region"] = WlRegion
+
+# fmt: on
@@ -0,0 +1,52 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+
+__all__ = ["WlRegistry"]
+
+class WlRegistry(Proxy):
+    """global registry object"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_registry",
+        version=1,
+        requests=[
+            WRequest("bind", [ArgUInt("name"), ArgStr("id_interface"), ArgUInt("id_version"), ArgNewId("id", None)]),
+        ],
+        events=[
+            WEvent("global", [ArgUInt("name"), ArgStr("interface"), ArgUInt("version")]),
+            WEvent("global_remove", [ArgUInt("name")]),
+        ],
+        enums=[
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def bind(self, name: int, id_interface: str, id_version: int, id: Proxy) -> None:
+        """bind an object to the display"""
+        _proxy_iface = id._interface.name
+        if _proxy_iface != id_interface:
+            raise TypeError("[{self}(id)] expected {id_interface} (got {_proxy_iface})")
+        self._call(OpCode(0), (name, id_interface, id_version, id,))
+        return None
+
+    def on_global(self, handler: Callable[[int, str, int], bool]) -> Callable[[int, str, int], bool] | None:
+        """announce global object"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_global_remove(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """announce removal of global object"""
+        return self._handler_set(OpCode(1), handler)
+
+PROXIES["wl_registry"] = WlRegistry
+
+# fmt: on
@@ -0,0 +1,155 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_keyboard import WlKeyboard
+from .wl_pointer import WlPointer
+from .wl_touch import WlTouch
+
+__all__ = ["WlSeat"]
+
+_pack_wl_seat_get_pointer = Struct("IHHI").pack
+_pack_wl_seat_get_keyboard = Struct("IHHI").pack
+_pack_wl_seat_get_touch = Struct("IHHI").pack
+_pack_wl_seat_release = Struct("IHH").pack
+
+class WlSeat(Proxy):
+    """group of input devices"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_seat",
+        version=9,
+        requests=[
+            WRequest("get_pointer", [ArgNewId("id", "wl_pointer")]),
+            WRequest("get_keyboard", [ArgNewId("id", "wl_keyboard")]),
+            WRequest("get_touch", [ArgNewId("id", "wl_touch")]),
+            WRequest("release", []),
+        ],
+        events=[
+            WEvent("capabilities", [ArgUInt("capabilities", "capability")]),
+            WEvent("name", [ArgStr("name")]),
+        ],
+        enums=[
+            WEnum(
+                name="capability",
+                values={
+                    "pointer": 1,
+                    "keyboard": 2,
+                    "touch": 4,
+                },
+                flag=True,
+            ),
+            WEnum(
+                name="error",
+                values={
+                    "missing_capability": 0,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def get_pointer(self) -> WlPointer:
+        """return pointer object"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlPointer)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_seat_get_pointer(self._id, 0, 12, id._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(0), (id,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def get_keyboard(self) -> WlKeyboard:
+        """return keyboard object"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlKeyboard)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_seat_get_keyboard(self._id, 1, 12, id._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(1), (id,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def get_touch(self) -> WlTouch:
+        """return touch object"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlTouch)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_seat_get_touch(self._id, 2, 12, id._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(2), (id,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def release(self) -> None:
+        """release the seat object"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_seat_release(self._id, 3, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(3), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlSeat:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        self.release()
+
+    def on_capabilities(self, handler: Callable[[Capability], bool]) -> Callable[[Capability], bool] | None:
+        """seat capabilities changed"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_name(self, handler: Callable[[str], bool]) -> Callable[[str], bool] | None:
+        """unique identifier for this seat"""
+        return self._handler_set(OpCode(1), handler)
+
+    class Capability(Flag):
+        POINTER = 1
+        KEYBOARD = 2
+        TOUCH = 4
+
+    class Error(Enum):
+        MISSING_CAPABILITY = 0
+
+WlSeat.interface.enum_types = {
+    "capability": WlSeat.Capability,
+    "error": WlSeat.Error,
+}
+
+PROXIES["wl_seat"] = WlSeat
+
+# fmt: on
@@ -0,0 +1,68 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_shell_surface import WlShellSurface
+if typing.TYPE_CHECKING:
+    from .wl_surface import WlSurface
+
+__all__ = ["WlShell"]
+
+_pack_wl_shell_get_shell_surface = Struct("IHHII").pack
+
+class WlShell(Proxy):
+    """create desktop-style surfaces"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_shell",
+        version=1,
+        requests=[
+            WRequest("get_shell_surface", [ArgNewId("id", "wl_shell_surface"), ArgObject("surface", "wl_surface")]),
+        ],
+        events=[
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "role": 0,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def get_shell_surface(self, surface: WlSurface) -> WlShellSurface:
+        """create a shell surface from a surface"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlShellSurface)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_shell_get_shell_surface(self._id, 0, 16, id._id, surface._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug or surface._interface.name != "wl_surface":
+                self._call(OpCode(0), (id, surface,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    class Error(Enum):
+        ROLE = 0
+
+WlShell.interface.enum_types = {
+    "error": WlShell.Error,
+}
+
+PROXIES["wl_shell"] = WlShell
+
+# fmt: on
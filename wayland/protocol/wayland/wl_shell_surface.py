@@ -0,0 +1,234 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from .wl_output import WlOutput
+    from .wl_seat import WlSeat
+    from .wl_surface import WlSurface
+
+__all__ = ["WlShellSurface"]
+
+_pack_wl_shell_surface_pong = Struct("IHHI").pack
+_pack_wl_shell_surface_move = Struct("IHHII").pack
+_pack_wl_shell_surface_resize = Struct("IHHIII").pack
+_pack_wl_shell_surface_set_toplevel = Struct("IHH").pack
+_pack_wl_shell_surface_set_transient = Struct("IHHIiiI").pack
+_pack_wl_shell_surface_set_fullscreen = Struct("IHHIII").pack
+_pack_wl_shell_surface_set_popup = Struct("IHHIIIiiI").pack
+_pack_wl_shell_surface_set_maximized = Struct("IHHI").pack
+
+class WlShellSurface(Proxy):
+    """desktop-style metadata interface"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_shell_surface",
+        version=1,
+        requests=[
+            WRequest("pong", [ArgUInt("serial")]),
+            WRequest("move", [ArgObject("seat", "wl_seat"), ArgUInt("serial")]),
+            WRequest("resize", [ArgObject("seat", "wl_seat"), ArgUInt("serial"), ArgUInt("edges", "resize")]),
+            WRequest("set_toplevel", []),
+            WRequest("set_transient", [ArgObject("parent", "wl_surface"), ArgInt("x"), ArgInt("y"), ArgUInt("flags", "transient")]),
+            WRequest("set_fullscreen", [ArgUInt("method", "fullscreen_method"), ArgUInt("framerate"), ArgObject("output", "wl_output", True)]),
+            WRequest("set_popup", [ArgObject("seat", "wl_seat"), ArgUInt("serial"), ArgObject("parent", "wl_surface"), ArgInt("x"), ArgInt("y"), ArgUInt("flags", "transient")]),
+            WRequest("set_maximized", [ArgObject("output", "wl_output", True)]),
+            WRequest("set_title", [ArgStr("title")]),
+            WRequest("set_class", [ArgStr("class_")]),
+        ],
+        events=[
+            WEvent("ping", [ArgUInt("serial")]),
+            WEvent("configure", [ArgUInt("edges", "resize"), ArgInt("width"), ArgInt("height")]),
+            WEvent("popup_done", []),
+        ],
+        enums=[
+            WEnum(
+                name="resize",
+                values={
+                    "none": 0,
+                    "top": 1,
+                    "bottom": 2,
+                    "left": 4,
+                    "top_left": 5,
+                    "bottom_left": 6,
+                    "right": 8,
+                    "top_right": 9,
+                    "bottom_right": 10,
+                },
+                flag=True,
+            ),
+            WEnum(
+                name="transient",
+                values={
+                    "inactive": 1,
+                },
+                flag=True,
+            ),
+            WEnum(
+                name="fullscreen_method",
+                values={
+                    "default": 0,
+                    "scale": 1,
+                    "driver": 2,
+                    "fill": 3,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def pong(self, serial: int) -> None:
+        """respond to a ping event"""
+        try:
+            _message = _pack_wl_shell_surface_pong(self._id, 0, 12, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), (serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def move(self, seat: WlSeat, serial: int) -> None:
+        """start an interactive move"""
+        try:
+            _message = _pack_wl_shell_surface_move(self._id, 1, 16, seat._id, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or seat._interface.name != "wl_seat":
+            self._call(OpCode(1), (seat, serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def resize(self, seat: WlSeat, serial: int, edges: Resize) -> None:
+        """start an interactive resize"""
+        try:
+            _message = _pack_wl_shell_surface_resize(self._id, 2, 20, seat._id, serial, edges.value if isinstance(edges, Enum) else edges)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or seat._interface.name != "wl_seat":
+            self._call(OpCode(2), (seat, serial, edges,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_toplevel(self) -> None:
+        """make the surface a toplevel surface"""
+        try:
+            _message = _pack_wl_shell_surface_set_toplevel(self._id, 3, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(3), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_transient(self, parent: WlSurface, x: int, y: int, flags: Transient) -> None:
+        """make the surface a transient surface"""
+        try:
+            _message = _pack_wl_shell_surface_set_transient(self._id, 4, 24, parent._id, x, y, flags.value if isinstance(flags, Enum) else flags)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or parent._interface.name != "wl_surface":
+            self._call(OpCode(4), (parent, x, y, flags,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_fullscreen(self, method: FullscreenMethod, framerate: int, output: WlOutput | None) -> None:
+        """make the surface a fullscreen surface"""
+        try:
+            _message = _pack_wl_shell_surface_set_fullscreen(self._id, 5, 20, method.value if isinstance(method, Enum) else method, framerate, 0 if output is None else output._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (output is not None and output._interface.name != "wl_output"):
+            self._call(OpCode(5), (method, framerate, output,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_popup(self, seat: WlSeat, serial: int, parent: WlSurface, x: int, y: int, flags: Transient) -> None:
+        """make the surface a popup surface"""
+        try:
+            _message = _pack_wl_shell_surface_set_popup(self._id, 6, 32, seat._id, serial, parent._id, x, y, flags.value if isinstance(flags, Enum) else flags)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or seat._interface.name != "wl_seat" or parent._interface.name != "wl_surface":
+            self._call(OpCode(6), (seat, serial, parent, x, y, flags,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_maximized(self, output: WlOutput | None) -> None:
+        """make the surface a maximized surface"""
+        try:
+            _message = _pack_wl_shell_surface_set_maximized(self._id, 7, 12, 0 if output is None else output._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (output is not None and output._interface.name != "wl_output"):
+            self._call(OpCode(7), (output,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_title(self, title: str) -> None:
+        """set surface title"""
+        self._call(OpCode(8), (title,))
+        return None
+
+    def set_class(self, class_: str) -> None:
+        """set surface class"""
+        self._call(OpCode(9), (class_,))
+        return None
+
+    def on_ping(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """ping client"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_configure(self, handler: Callable[[Resize, int, int], bool]) -> Callable[[Resize, int, int], bool] | None:
+        """suggest resize"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_popup_done(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """popup interaction is done"""
+        return self._handler_set(OpCode(2), handler)
+
+    class Resize(Flag):
+        NONE = 0
+        TOP = 1
+        BOTTOM = 2
+        LEFT = 4
+        TOP_LEFT = 5
+        BOTTOM_LEFT = 6
+        RIGHT = 8
+        TOP_RIGHT = 9
+        BOTTOM_RIGHT = 10
+
+    class Transient(Flag):
+        INACTIVE = 1
+
+    class FullscreenMethod(Enum):
+        DEFAULT = 0
+        SCALE = 1
+        DRIVER = 2
+        FILL = 3
+
+WlShellSurface.interface.enum_types = {
+    "resize": WlShellSurface.Resize,
+    "transient": WlShellSurface.Transient,
+    "fullscreen_method": WlShellSurface.FullscreenMethod,
+}
+
+PROXIES["wl_shell_surface"] = WlShellSurface
+
+# fmt: on
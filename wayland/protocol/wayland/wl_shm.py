@@ -0,0 +1,346 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_shm_pool import WlShmPool
+
+__all__ = ["WlShm"]
+
+_pack_wl_shm_release = Struct("IHH").pack
+
+class WlShm(Proxy):
+    """shared memory support"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_shm",
+        version=2,
+        requests=[
+            WRequest("create_pool", [ArgNewId("id", "wl_shm_pool"), ArgFd("fd"), ArgInt("size")]),
+            WRequest("release", []),
+        ],
+        events=[
+            WEvent("format", [ArgUInt("format", "format")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "invalid_format": 0,
+                    "invalid_stride": 1,
+                    "invalid_fd": 2,
+                },
+            ),
+            WEnum(
+                name="format",
+                values={
+                    "argb8888": 0,
+                    "xrgb8888": 1,
+                    "c8": 538982467,
+                    "rgb332": 943867730,
+                    "bgr233": 944916290,
+                    "xrgb4444": 842093144,
+                    "xbgr4444": 842089048,
+                    "rgbx4444": 842094674,
+                    "bgrx4444": 842094658,
+                    "argb4444": 842093121,
+                    "abgr4444": 842089025,
+                    "rgba4444": 842088786,
+                    "bgra4444": 842088770,
+                    "xrgb1555": 892424792,
+                    "xbgr1555": 892420696,
+                    "rgbx5551": 892426322,
+                    "bgrx5551": 892426306,
+                    "argb1555": 892424769,
+                    "abgr1555": 892420673,
+                    "rgba5551": 892420434,
+                    "bgra5551": 892420418,
+                    "rgb565": 909199186,
+                    "bgr565": 909199170,
+                    "rgb888": 875710290,
+                    "bgr888": 875710274,
+                    "xbgr8888": 875709016,
+                    "rgbx8888": 875714642,
+                    "bgrx8888": 875714626,
+                    "abgr8888": 875708993,
+                    "rgba8888": 875708754,
+                    "bgra8888": 875708738,
+                    "xrgb2101010": 808669784,
+                    "xbgr2101010": 808665688,
+                    "rgbx1010102": 808671314,
+                    "bgrx1010102": 808671298,
+                    "argb2101010": 808669761,
+                    "abgr2101010": 808665665,
+                    "rgba1010102": 808665426,
+                    "bgra1010102": 808665410,
+                    "yuyv": 1448695129,
+                    "yvyu": 1431918169,
+                    "uyvy": 1498831189,
+                    "vyuy": 1498765654,
+                    "ayuv": 1448433985,
+                    "nv12": 842094158,
+                    "nv21": 825382478,
+                    "nv16": 909203022,
+                    "nv61": 825644622,
+                    "yuv410": 961959257,
+                    "yvu410": 961893977,
+                    "yuv411": 825316697,
+                    "yvu411": 825316953,
+                    "yuv420": 842093913,
+                    "yvu420": 842094169,
+                    "yuv422": 909202777,
+                    "yvu422": 909203033,
+                    "yuv444": 875713881,
+                    "yvu444": 875714137,
+                    "r8": 538982482,
+                    "r16": 540422482,
+                    "rg88": 943212370,
+                    "gr88": 943215175,
+                    "rg1616": 842221394,
+                    "gr1616": 842224199,
+                    "xrgb16161616f": 1211388504,
+                    "xbgr16161616f": 1211384408,
+                    "argb16161616f": 1211388481,
+                    "abgr16161616f": 1211384385,
+                    "xyuv8888": 1448434008,
+                    "vuy888": 875713878,
+                    "vuy101010": 808670550,
+                    "y210": 808530521,
+                    "y212": 842084953,
+                    "y216": 909193817,
+                    "y410": 808531033,
+                    "y412": 842085465,
+                    "y416": 909194329,
+                    "xvyu2101010": 808670808,
+                    "xvyu12_16161616": 909334104,
+                    "xvyu16161616": 942954072,
+                    "y0l0": 810299481,
+                    "x0l0": 810299480,
+                    "y0l2": 843853913,
+                    "x0l2": 843853912,
+                    "yuv420_8bit": 942691673,
+                    "yuv420_10bit": 808539481,
+                    "xrgb8888_a8": 943805016,
+                    "xbgr8888_a8": 943800920,
+                    "rgbx8888_a8": 943806546,
+                    "bgrx8888_a8": 943806530,
+                    "rgb888_a8": 943798354,
+                    "bgr888_a8": 943798338,
+                    "rgb565_a8": 943797586,
+                    "bgr565_a8": 943797570,
+                    "nv24": 875714126,
+                    "nv42": 842290766,
+                    "p210": 808530512,
+                    "p010": 808530000,
+                    "p012": 842084432,
+                    "p016": 909193296,
+                    "axbxgxrx106106106106": 808534593,
+                    "nv15": 892425806,
+                    "q410": 808531025,
+                    "q401": 825242705,
+                    "xrgb16161616": 942953048,
+                    "xbgr16161616": 942948952,
+                    "argb16161616": 942953025,
+                    "abgr16161616": 942948929,
+                    "c1": 538980675,
+                    "c2": 538980931,
+                    "c4": 538981443,
+                    "d1": 538980676,
+                    "d2": 538980932,
+                    "d4": 538981444,
+                    "d8": 538982468,
+                    "r1": 538980690,
+                    "r2": 538980946,
+                    "r4": 538981458,
+                    "r10": 540029266,
+                    "r12": 540160338,
+                    "avuy8888": 1498764865,
+                    "xvuy8888": 1498764888,
+                    "p030": 808661072,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def create_pool(self, fd: Fd, size: int) -> WlShmPool:
+        """create a shm pool"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlShmPool)
+            id._queue = self._queue
+            self._call(OpCode(0), (id, fd, size,))
+            return id
+
+    def release(self) -> None:
+        """release the shm object"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_shm_release(self._id, 1, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlShm:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        self.release()
+
+    def on_format(self, handler: Callable[[Format], bool]) -> Callable[[Format], bool] | None:
+        """pixel format description"""
+        return self._handler_set(OpCode(0), handler)
+
+    class Error(Enum):
+        INVALID_FORMAT = 0
+        INVALID_STRIDE = 1
+        INVALID_FD = 2
+
+    class Format(Enum):
+        ARGB8888 = 0
+        XRGB8888 = 1
+        C8 = 538982467
+        RGB332 = 943867730
+        BGR233 = 944916290
+        XRGB4444 = 842093144
+        XBGR4444 = 842089048
+        RGBX4444 = 842094674
+        BGRX4444 = 842094658
+        ARGB4444 = 842093121
+        ABGR4444 = 842089025
+        RGBA4444 = 842088786
+        BGRA4444 = 842088770
+        XRGB1555 = 892424792
+        XBGR1555 = 892420696
+        RGBX5551 = 892426322
+        BGRX5551 = 892426306
+        ARGB1555 = 892424769
+        ABGR1555 = 892420673
+        RGBA5551 = 892420434
+        BGRA5551 = 892420418
+        RGB565 = 909199186
+        BGR565 = 909199170
+        RGB888 = 875710290
+        BGR888 = 875710274
+        XBGR8888 = 875709016
+        RGBX8888 = 875714642
+        BGRX8888 = 875714626
+        ABGR8888 = 875708993
+        RGBA8888 = 875708754
+        BGRA8888 = 875708738
+        XRGB2101010 = 808669784
+        XBGR2101010 = 808665688
+        RGBX1010102 = 808671314
+        BGRX1010102 = 808671298
+        ARGB2101010 = 808669761
+        ABGR2101010 = 808665665
+        RGBA1010102 = 808665426
+        BGRA1010102 = 808665410
+        YUYV = 1448695129
+        YVYU = 1431918169
+        UYVY = 1498831189
+        VYUY = 1498765654
+        AYUV = 1448433985
+        NV12 = 842094158
+        NV21 = 825382478
+        NV16 = 909203022
+        NV61 = 825644622
+        YUV410 = 961959257
+        YVU410 = 961893977
+        YUV411 = 825316697
+        YVU411 = 825316953
+        YUV420 = 842093913
+        YVU420 = 842094169
+        YUV422 = 909202777
+        YVU422 = 909203033
+        YUV444 = 875713881
+        YVU444 = 875714137
+        R8 = 538982482
+        R16 = 540422482
+        RG88 = 943212370
+        GR88 = 943215175
+        RG1616 = 842221394
+        GR1616 = 842224199
+        XRGB16161616F = 1211388504
+        XBGR16161616F = 1211384408
+        ARGB16161616F = 1211388481
+        ABGR16161616F = 1211384385
+        XYUV8888 = 1448434008
+        VUY888 = 875713878
+        VUY101010 = 808670550
+        Y210 = 808530521
+        Y212 = 842084953
+        Y216 = 909193817
+        Y410 = 808531033
+        Y412 = 842085465
+        Y416 = 909194329
+        XVYU2101010 = 808670808
+        XVYU12_16161616 = 909334104
+        XVYU16161616 = 942954072
+        Y0L0 = 810299481
+        X0L0 = 810299480
+        Y0L2 = 843853913
+        X0L2 = 843853912
+        YUV420_8BIT = 942691673
+        YUV420_10BIT = 808539481
+        XRGB8888_A8 = 943805016
+        XBGR8888_A8 = 943800920
+        RGBX8888_A8 = 943806546
+        BGRX8888_A8 = 943806530
+        RGB888_A8 = 943798354
+        BGR888_A8 = 943798338
+        RGB565_A8 = 943797586
+        BGR565_A8 = 943797570
+        NV24 = 875714126
+        NV42 = 842290766
+        P210 = 808530512
+        P010 = 808530000
+        P012 = 842084432
+        P016 = 909193296
+        AXBXGXRX106106106106 = 808534593
+        NV15 = 892425806
+        Q410 = 808531025
+        Q401 = 825242705
+        XRGB16161616 = 942953048
+        XBGR16161616 = 942948952
+        ARGB16161616 = 942953025
+        ABGR16161616 = 942948929
+        C1 = 538980675
+        C2 = 538980931
+        C4 = 538981443
+        D1 = 538980676
+        D2 = 538980932
+        D4 = 538981444
+        D8 = 538982468
+        R1 = 538980690
+        R2 = 538980946
+        R4 = 538981458
+        R10 = 540029266
+        R12 = 540160338
+        AVUY8888 = 1498764865
+        XVUY8888 = 1498764888
+        P030 = 808661072
+
+WlShm.interface.enum_types = {
+    "error": WlShm.Error,
+    "format": WlShm.Format,
+}
+
+PROXIES["wl_shm"] = WlShm
+
+# fmt: on
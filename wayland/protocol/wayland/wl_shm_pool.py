@@ -0,0 +1,95 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_buffer import WlBuffer
+if typing.TYPE_CHECKING:
+    from .wl_shm import WlShm
+
+__all__ = ["WlShmPool"]
+
+_pack_wl_shm_pool_create_buffer = Struct("IHHIiiiiI").pack
+_pack_wl_shm_pool_destroy = Struct("IHH").pack
+_pack_wl_shm_pool_resize = Struct("IHHi").pack
+
+class WlShmPool(Proxy):
+    """a shared memory pool"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_shm_pool",
+        version=2,
+        requests=[
+            WRequest("create_buffer", [ArgNewId("id", "wl_buffer"), ArgInt("offset"), ArgInt("width"), ArgInt("height"), ArgInt("stride"), ArgUInt("format", "wl_shm.format")]),
+            WRequest("destroy", []),
+            WRequest("resize", [ArgInt("size")]),
+        ],
+        events=[
+        ],
+        enums=[
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def create_buffer(self, offset: int, width: int, height: int, stride: int, format: WlShm.Format) -> WlBuffer:
+        """create a buffer from the pool"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlBuffer)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_shm_pool_create_buffer(self._id, 0, 32, id._id, offset, width, height, stride, format.value if isinstance(format, Enum) else format)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(0), (id, offset, width, height, stride, format,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def destroy(self) -> None:
+        """destroy the pool"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_shm_pool_destroy(self._id, 1, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def resize(self, size: int) -> None:
+        """change the size of the pool mapping"""
+        try:
+            _message = _pack_wl_shm_pool_resize(self._id, 2, 12, size)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(2), (size,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlShmPool:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+PROXIES["wl_shm_pool"] = WlShmPool
+
+# fmt: on
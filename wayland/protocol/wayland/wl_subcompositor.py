@@ -0,0 +1,96 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_subsurface import WlSubsurface
+if typing.TYPE_CHECKING:
+    from .wl_surface import WlSurface
+
+__all__ = ["WlSubcompositor"]
+
+_pack_wl_subcompositor_destroy = Struct("IHH").pack
+_pack_wl_subcompositor_get_subsurface = Struct("IHHIII").pack
+
+class WlSubcompositor(Proxy):
+    """sub-surface compositing"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_subcompositor",
+        version=1,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("get_subsurface", [ArgNewId("id", "wl_subsurface"), ArgObject("surface", "wl_surface"), ArgObject("parent", "wl_surface")]),
+        ],
+        events=[
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "bad_surface": 0,
+                    "bad_parent": 1,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """unbind from the subcompositor interface"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_subcompositor_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def get_subsurface(self, surface: WlSurface, parent: WlSurface) -> WlSubsurface:
+        """give a surface the role sub-surface"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(WlSubsurface)
+            id._queue = self._queue
+            try:
+                _message = _pack_wl_subcompositor_get_subsurface(self._id, 1, 20, id._id, surface._id, parent._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug or surface._interface.name != "wl_surface" or parent._interface.name != "wl_surface":
+                self._call(OpCode(1), (id, surface, parent,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def __enter__(self) -> WlSubcompositor:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    class Error(Enum):
+        BAD_SURFACE = 0
+        BAD_PARENT = 1
+
+WlSubcompositor.interface.enum_types = {
+    "error": WlSubcompositor.Error,
+}
+
+PROXIES["wl_subcompositor"] = WlSubcompositor
+
+# fmt: on
@@ -0,0 +1,145 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from .wl_surface import WlSurface
+
+__all__ = ["WlSubsurface"]
+
+_pack_wl_subsurface_destroy = Struct("IHH").pack
+_pack_wl_subsurface_set_position = Struct("IHHii").pack
+_pack_wl_subsurface_place_above = Struct("IHHI").pack
+_pack_wl_subsurface_place_below = Struct("IHHI").pack
+_pack_wl_subsurface_set_sync = Struct("IHH").pack
+_pack_wl_subsurface_set_desync = Struct("IHH").pack
+
+class WlSubsurface(Proxy):
+    """sub-surface interface to a wl_surface"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_subsurface",
+        version=1,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("set_position", [ArgInt("x"), ArgInt("y")]),
+            WRequest("place_above", [ArgObject("sibling", "wl_surface")]),
+            WRequest("place_below", [ArgObject("sibling", "wl_surface")]),
+            WRequest("set_sync", []),
+            WRequest("set_desync", []),
+        ],
+        events=[
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "bad_surface": 0,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """remove sub-surface interface"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_subsurface_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_position(self, x: int, y: int) -> None:
+        """reposition the sub-surface"""
+        try:
+            _message = _pack_wl_subsurface_set_position(self._id, 1, 16, x, y)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), (x, y,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def place_above(self, sibling: WlSurface) -> None:
+        """restack the sub-surface"""
+        try:
+            _message = _pack_wl_subsurface_place_above(self._id, 2, 12, sibling._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or sibling._interface.name != "wl_surface":
+            self._call(OpCode(2), (sibling,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def place_below(self, sibling: WlSurface) -> None:
+        """restack the sub-surface"""
+        try:
+            _message = _pack_wl_subsurface_place_below(self._id, 3, 12, sibling._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or sibling._interface.name != "wl_surface":
+            self._call(OpCode(3), (sibling,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_sync(self) -> None:
+        """set sub-surface to synchronized mode"""
+        try:
+            _message = _pack_wl_subsurface_set_sync(self._id, 4, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(4), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_desync(self) -> None:
+        """set sub-surface to desynchronized mode"""
+        try:
+            _message = _pack_wl_subsurface_set_desync(self._id, 5, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(5), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlSubsurface:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    class Error(Enum):
+        BAD_SURFACE = 0
+
+WlSubsurface.interface.enum_types = {
+    "error": WlSubsurface.Error,
+}
+
+PROXIES["wl_subsurface"] = WlSubsurface
+
+# fmt: on
@@ -0,0 +1,250 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .wl_callback import WlCallback
+if typing.TYPE_CHECKING:
+    from .wl_buffer import WlBuffer
+    from .wl_output import WlOutput
+    from .wl_region import WlRegion
+
+__all__ = ["WlSurface"]
+
+_pack_wl_surface_destroy = Struct("IHH").pack
+_pack_wl_surface_attach = Struct("IHHIii").pack
+_pack_wl_surface_damage = Struct("IHHiiii").pack
+_pack_wl_surface_frame = Struct("IHHI").pack
+_pack_wl_surface_set_opaque_region = Struct("IHHI").pack
+_pack_wl_surface_set_input_region = Struct("IHHI").pack
+_pack_wl_surface_commit = Struct("IHH").pack
+_pack_wl_surface_set_buffer_transform = Struct("IHHi").pack
+_pack_wl_surface_set_buffer_scale = Struct("IHHi").pack
+_pack_wl_surface_damage_buffer = Struct("IHHiiii").pack
+_pack_wl_surface_offset = Struct("IHHii").pack
+
+class WlSurface(Proxy):
+    """an onscreen surface"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_surface",
+        version=6,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("attach", [ArgObject("buffer", "wl_buffer", True), ArgInt("x"), ArgInt("y")]),
+            WRequest("damage", [ArgInt("x"), ArgInt("y"), ArgInt("width"), ArgInt("height")]),
+            WRequest("frame", [ArgNewId("callback", "wl_callback")]),
+            WRequest("set_opaque_region", [ArgObject("region", "wl_region", True)]),
+            WRequest("set_input_region", [ArgObject("region", "wl_region", True)]),
+            WRequest("commit", []),
+            WRequest("set_buffer_transform", [ArgInt("transform", "wl_output.transform")]),
+            WRequest("set_buffer_scale", [ArgInt("scale")]),
+            WRequest("damage_buffer", [ArgInt("x"), ArgInt("y"), ArgInt("width"), ArgInt("height")]),
+            WRequest("offset", [ArgInt("x"), ArgInt("y")]),
+        ],
+        events=[
+            WEvent("enter", [ArgObject("output", "wl_output")]),
+            WEvent("leave", [ArgObject("output", "wl_output")]),
+            WEvent("preferred_buffer_scale", [ArgInt("factor")]),
+            WEvent("preferred_buffer_transform", [ArgUInt("transform", "wl_output.transform")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "invalid_scale": 0,
+                    "invalid_transform": 1,
+                    "invalid_size": 2,
+                    "invalid_offset": 3,
+                    "defunct_role_object": 4,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """delete surface"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_surface_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def attach(self, buffer: WlBuffer | None, x: int, y: int) -> None:
+        """set the surface contents"""
+        try:
+            _message = _pack_wl_surface_attach(self._id, 1, 20, 0 if buffer is None else buffer._id, x, y)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (buffer is not None and buffer._interface.name != "wl_buffer"):
+            self._call(OpCode(1), (buffer, x, y,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def damage(self, x: int, y: int, width: int, height: int) -> None:
+        """mark part of the surface damaged"""
+        try:
+            _message = _pack_wl_surface_damage(self._id, 2, 24, x, y, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(2), (x, y, width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def frame(self) -> WlCallback:
+        """request a frame throttling hint"""
+        with self._connection._request_scope():
+            callback = self._connection.create_proxy(WlCallback)
+            callback._queue = self._queue
+            try:
+                _message = _pack_wl_surface_frame(self._id, 3, 12, callback._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(3), (callback,))
+                return callback
+            callback._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return callback
+
+    def set_opaque_region(self, region: WlRegion | None) -> None:
+        """set opaque region"""
+        try:
+            _message = _pack_wl_surface_set_opaque_region(self._id, 4, 12, 0 if region is None else region._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (region is not None and region._interface.name != "wl_region"):
+            self._call(OpCode(4), (region,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_input_region(self, region: WlRegion | None) -> None:
+        """set input region"""
+        try:
+            _message = _pack_wl_surface_set_input_region(self._id, 5, 12, 0 if region is None else region._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (region is not None and region._interface.name != "wl_region"):
+            self._call(OpCode(5), (region,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def commit(self) -> None:
+        """commit pending surface state"""
+        try:
+            _message = _pack_wl_surface_commit(self._id, 6, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(6), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_buffer_transform(self, transform: WlOutput.Transform) -> None:
+        """sets the buffer transformation"""
+        try:
+            _message = _pack_wl_surface_set_buffer_transform(self._id, 7, 12, transform.value if isinstance(transform, Enum) else transform)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(7), (transform,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_buffer_scale(self, scale: int) -> None:
+        """sets the buffer scaling factor"""
+        try:
+            _message = _pack_wl_surface_set_buffer_scale(self._id, 8, 12, scale)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(8), (scale,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def damage_buffer(self, x: int, y: int, width: int, height: int) -> None:
+        """mark part of the surface damaged using buffer coordinates"""
+        try:
+            _message = _pack_wl_surface_damage_buffer(self._id, 9, 24, x, y, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(9), (x, y, width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def offset(self, x: int, y: int) -> None:
+        """set the surface contents offset"""
+        try:
+            _message = _pack_wl_surface_offset(self._id, 10, 16, x, y)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(10), (x, y,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlSurface:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_enter(self, handler: Callable[[WlOutput], bool]) -> Callable[[WlOutput], bool] | None:
+        """surface enters an output"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_leave(self, handler: Callable[[WlOutput], bool]) -> Callable[[WlOutput], bool] | None:
+        """surface leaves an output"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_preferred_buffer_scale(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """preferred buffer scale for the surface"""
+        return self._handler_set(OpCode(2), handler)
+
+    def on_preferred_buffer_transform(self, handler: Callable[[WlOutput.Transform], bool]) -> Callable[[WlOutput.Transform], bool] | None:
+        """preferred buffer transform for the surface"""
+        return self._handler_set(OpCode(3), handler)
+
+    class Error(Enum):
+        INVALID_SCALE = 0
+        INVALID_TRANSFORM = 1
+        INVALID_SIZE = 2
+        INVALID_OFFSET = 3
+        DEFUNCT_ROLE_OBJECT = 4
+
+WlSurface.interface.enum_types = {
+    "error": WlSurface.Error,
+}
+
+PROXIES["wl_surface"] = WlSurface
+
+# fmt: on
@@ -0,0 +1,97 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from .wl_surface import WlSurface
+
+__all__ = ["WlTouch"]
+
+_pack_wl_touch_release = Struct("IHH").pack
+
+class WlTouch(Proxy):
+    """touchscreen input device"""
+    interface: ClassVar[Interface] = Interface(
+        name="wl_touch",
+        version=9,
+        requests=[
+            WRequest("release", []),
+        ],
+        events=[
+            WEvent("down", [ArgUInt("serial"), ArgUInt("time"), ArgObject("surface", "wl_surface"), ArgInt("id"), ArgFixed("x"), ArgFixed("y")]),
+            WEvent("up", [ArgUInt("serial"), ArgUInt("time"), ArgInt("id")]),
+            WEvent("motion", [ArgUInt("time"), ArgInt("id"), ArgFixed("x"), ArgFixed("y")]),
+            WEvent("frame", []),
+            WEvent("cancel", []),
+            WEvent("shape", [ArgInt("id"), ArgFixed("major"), ArgFixed("minor")]),
+            WEvent("orientation", [ArgInt("id"), ArgFixed("orientation")]),
+        ],
+        enums=[
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def release(self) -> None:
+        """release the touch object"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_wl_touch_release(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> WlTouch:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        self.release()
+
+    def on_down(self, handler: Callable[[int, int, WlSurface, int, float, float], bool]) -> Callable[[int, int, WlSurface, int, float, float], bool] | None:
+        """touch down event and beginning of a touch sequence"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_up(self, handler: Callable[[int, int, int], bool]) -> Callable[[int, int, int], bool] | None:
+        """end of a touch event sequence"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_motion(self, handler: Callable[[int, int, float, float], bool]) -> Callable[[int, int, float, float], bool] | None:
+        """update of touch point coordinates"""
+        return self._handler_set(OpCode(2), handler)
+
+    def on_frame(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """end of touch frame event"""
+        return self._handler_set(OpCode(3), handler)
+
+    def on_cancel(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """touch session cancelled"""
+        return self._handler_set(OpCode(4), handler)
+
+    def on_shape(self, handler: Callable[[int, float, float], bool]) -> Callable[[int, float, float], bool] | None:
+        """update shape of touch point"""
+        return self._handler_set(OpCode(5), handler)
+
+    def on_orientation(self, handler: Callable[[int, float], bool]) -> Callable[[int, float], bool] | None:
+        """update orientation of touch point"""
+        return self._handler_set(OpCode(6), handler)
+
+PROXIES["wl_touch"] = WlTouch
+
+# fmt: on
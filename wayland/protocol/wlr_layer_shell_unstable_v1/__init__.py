@@ -0,0 +1,35 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportUnusedImport=false
+"""Proxies of `wlr_layer_shell_unstable_v1` protocol, loaded on first access"""
+from __future__ import annotations
+import typing
+from importlib import import_module
+
+if typing.TYPE_CHECKING:
+    from .zwlr_layer_shell_v1 import ZwlrLayerShellV1
+    from .zwlr_layer_surface_v1 import ZwlrLayerSurfaceV1
+
+__all__ = [
+    "ZwlrLayerShellV1",
+    "ZwlrLayerSurfaceV1",
+]
+
+_MODULES = {
+    "ZwlrLayerShellV1": ".zwlr_layer_shell_v1",
+    "ZwlrLayerSurfaceV1": ".zwlr_layer_surface_v1",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+# fmt: on
@@ -0,0 +1,106 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .zwlr_layer_surface_v1 import ZwlrLayerSurfaceV1
+if typing.TYPE_CHECKING:
+    from ..wayland.wl_output import WlOutput
+    from ..wayland.wl_surface import WlSurface
+
+__all__ = ["ZwlrLayerShellV1"]
+
+_pack_zwlr_layer_shell_v1_destroy = Struct("IHH").pack
+
+class ZwlrLayerShellV1(Proxy):
+    """create surfaces that are layers of the desktop"""
+    interface: ClassVar[Interface] = Interface(
+        name="zwlr_layer_shell_v1",
+        version=5,
+        requests=[
+            WRequest("get_layer_surface", [ArgNewId("id", "zwlr_layer_surface_v1"), ArgObject("surface", "wl_surface"), ArgObject("output", "wl_output", True), ArgUInt("layer", "layer"), ArgStr("namespace")]),
+            WRequest("destroy", []),
+        ],
+        events=[
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "role": 0,
+                    "invalid_layer": 1,
+                    "already_constructed": 2,
+                },
+            ),
+            WEnum(
+                name="layer",
+                values={
+                    "background": 0,
+                    "bottom": 1,
+                    "top": 2,
+                    "overlay": 3,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def get_layer_surface(self, surface: WlSurface, output: WlOutput | None, layer: Layer, namespace: str) -> ZwlrLayerSurfaceV1:
+        """create a layer_surface from a surface"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(ZwlrLayerSurfaceV1)
+            id._queue = self._queue
+            self._call(OpCode(0), (id, surface, output, layer, namespace,))
+            return id
+
+    def destroy(self) -> None:
+        """destroy the layer_shell object"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_zwlr_layer_shell_v1_destroy(self._id, 1, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> ZwlrLayerShellV1:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    class Error(Enum):
+        ROLE = 0
+        INVALID_LAYER = 1
+        ALREADY_CONSTRUCTED = 2
+
+    class Layer(Enum):
+        BACKGROUND = 0
+        BOTTOM = 1
+        TOP = 2
+        OVERLAY = 3
+
+ZwlrLayerShellV1.interface.enum_types = {
+    "error": ZwlrLayerShellV1.Error,
+    "layer": ZwlrLayerShellV1.Layer,
+}
+
+PROXIES["zwlr_layer_shell_v1"] = ZwlrLayerShellV1
+
+# fmt: on
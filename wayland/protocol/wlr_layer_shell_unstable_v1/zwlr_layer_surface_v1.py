@@ -0,0 +1,251 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from ..xdg_shell.xdg_popup import XdgPopup
+    from .zwlr_layer_shell_v1 import ZwlrLayerShellV1
+
+__all__ = ["ZwlrLayerSurfaceV1"]
+
+_pack_zwlr_layer_surface_v1_set_size = Struct("IHHII").pack
+_pack_zwlr_layer_surface_v1_set_anchor = Struct("IHHI").pack
+_pack_zwlr_layer_surface_v1_set_exclusive_zone = Struct("IHHi").pack
+_pack_zwlr_layer_surface_v1_set_margin = Struct("IHHiiii").pack
+_pack_zwlr_layer_surface_v1_set_keyboard_interactivity = Struct("IHHI").pack
+_pack_zwlr_layer_surface_v1_get_popup = Struct("IHHI").pack
+_pack_zwlr_layer_surface_v1_ack_configure = Struct("IHHI").pack
+_pack_zwlr_layer_surface_v1_destroy = Struct("IHH").pack
+_pack_zwlr_layer_surface_v1_set_layer = Struct("IHHI").pack
+_pack_zwlr_layer_surface_v1_set_exclusive_edge = Struct("IHHI").pack
+
+class ZwlrLayerSurfaceV1(Proxy):
+    """layer metadata interface"""
+    interface: ClassVar[Interface] = Interface(
+        name="zwlr_layer_surface_v1",
+        version=5,
+        requests=[
+            WRequest("set_size", [ArgUInt("width"), ArgUInt("height")]),
+            WRequest("set_anchor", [ArgUInt("anchor", "anchor")]),
+            WRequest("set_exclusive_zone", [ArgInt("zone")]),
+            WRequest("set_margin", [ArgInt("top"), ArgInt("right"), ArgInt("bottom"), ArgInt("left")]),
+            WRequest("set_keyboard_interactivity", [ArgUInt("keyboard_interactivity", "keyboard_interactivity")]),
+            WRequest("get_popup", [ArgObject("popup", "xdg_popup")]),
+            WRequest("ack_configure", [ArgUInt("serial")]),
+            WRequest("destroy", []),
+            WRequest("set_layer", [ArgUInt("layer", "zwlr_layer_shell_v1.layer")]),
+            WRequest("set_exclusive_edge", [ArgUInt("edge", "anchor")]),
+        ],
+        events=[
+            WEvent("configure", [ArgUInt("serial"), ArgUInt("width"), ArgUInt("height")]),
+            WEvent("closed", []),
+        ],
+        enums=[
+            WEnum(
+                name="keyboard_interactivity",
+                values={
+                    "none": 0,
+                    "exclusive": 1,
+                    "on_demand": 2,
+                },
+            ),
+            WEnum(
+                name="error",
+                values={
+                    "invalid_surface_state": 0,
+                    "invalid_size": 1,
+                    "invalid_anchor": 2,
+                    "invalid_keyboard_interactivity": 3,
+                    "invalid_exclusive_edge": 4,
+                },
+            ),
+            WEnum(
+                name="anchor",
+                values={
+                    "top": 1,
+                    "bottom": 2,
+                    "left": 4,
+                    "right": 8,
+                },
+                flag=True,
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def set_size(self, width: int, height: int) -> None:
+        """sets the size of the surface"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_set_size(self._id, 0, 16, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), (width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_anchor(self, anchor: Anchor) -> None:
+        """configures the anchor point of the surface"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_set_anchor(self._id, 1, 12, anchor.value if isinstance(anchor, Enum) else anchor)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), (anchor,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_exclusive_zone(self, zone: int) -> None:
+        """configures the exclusive geometry of this surface"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_set_exclusive_zone(self._id, 2, 12, zone)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(2), (zone,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_margin(self, top: int, right: int, bottom: int, left: int) -> None:
+        """sets a margin from the anchor point"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_set_margin(self._id, 3, 24, top, right, bottom, left)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(3), (top, right, bottom, left,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_keyboard_interactivity(self, keyboard_interactivity: KeyboardInteractivity) -> None:
+        """requests keyboard events"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_set_keyboard_interactivity(self._id, 4, 12, keyboard_interactivity.value if isinstance(keyboard_interactivity, Enum) else keyboard_interactivity)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(4), (keyboard_interactivity,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def get_popup(self, popup: XdgPopup) -> None:
+        """assign this layer_surface as an xdg_popup parent"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_get_popup(self._id, 5, 12, popup._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or popup._interface.name != "xdg_popup":
+            self._call(OpCode(5), (popup,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def ack_configure(self, serial: int) -> None:
+        """ack a configure event"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_ack_configure(self._id, 6, 12, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(6), (serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def destroy(self) -> None:
+        """destroy the layer_surface"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_zwlr_layer_surface_v1_destroy(self._id, 7, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(7), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_layer(self, layer: ZwlrLayerShellV1.Layer) -> None:
+        """change the layer of the surface"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_set_layer(self._id, 8, 12, layer.value if isinstance(layer, Enum) else layer)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(8), (layer,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_exclusive_edge(self, edge: Anchor) -> None:
+        """set the edge the exclusive zone will be applied to"""
+        try:
+            _message = _pack_zwlr_layer_surface_v1_set_exclusive_edge(self._id, 9, 12, edge.value if isinstance(edge, Enum) else edge)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(9), (edge,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> ZwlrLayerSurfaceV1:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_configure(self, handler: Callable[[int, int, int], bool]) -> Callable[[int, int, int], bool] | None:
+        """suggest a surface change"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_closed(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """surface should be closed"""
+        return self._handler_set(OpCode(1), handler)
+
+    class KeyboardInteractivity(Enum):
+        NONE = 0
+        EXCLUSIVE = 1
+        ON_DEMAND = 2
+
+    class Error(Enum):
+        INVALID_SURFACE_STATE = 0
+        INVALID_SIZE = 1
+        INVALID_ANCHOR = 2
+        INVALID_KEYBOARD_INTERACTIVITY = 3
+        INVALID_EXCLUSIVE_EDGE = 4
+
+    class Anchor(Flag):
+        TOP = 1
+        BOTTOM = 2
+        LEFT = 4
+        RIGHT = 8
+
+ZwlrLayerSurfaceV1.interface.enum_types = {
+    "keyboard_interactivity": ZwlrLayerSurfaceV1.KeyboardInteractivity,
+    "error": ZwlrLayerSurfaceV1.Error,
+    "anchor": ZwlrLayerSurfaceV1.Anchor,
+}
+
+PROXIES["zwlr_layer_surface_v1"] = ZwlrLayerSurfaceV1
+
+# fmt: on
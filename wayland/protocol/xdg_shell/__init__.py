@@ -0,0 +1,44 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportUnusedImport=false
+"""Proxies of `xdg_shell` protocol, loaded on first access"""
+from __future__ import annotations
+import typing
+from importlib import import_module
+
+if typing.TYPE_CHECKING:
+    from .xdg_wm_base import XdgWmBase
+    from .xdg_positioner import XdgPositioner
+    from .xdg_surface import XdgSurface
+    from .xdg_toplevel import XdgToplevel
+    from .xdg_popup import XdgPopup
+
+__all__ = [
+    "XdgWmBase",
+    "XdgPositioner",
+    "XdgSurface",
+    "XdgToplevel",
+    "XdgPopup",
+]
+
+_MODULES = {
+    "XdgWmBase": ".xdg_wm_base",
+    "XdgPositioner": ".xdg_positioner",
+    "XdgSurface": ".xdg_surface",
+    "XdgToplevel": ".xdg_toplevel",
+    "XdgPopup": ".xdg_popup",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+# fmt: on
@@ -0,0 +1,119 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from ..wayland.wl_seat import WlSeat
+    from .xdg_positioner import XdgPositioner
+
+__all__ = ["XdgPopup"]
+
+_pack_xdg_popup_destroy = Struct("IHH").pack
+_pack_xdg_popup_grab = Struct("IHHII").pack
+_pack_xdg_popup_reposition = Struct("IHHII").pack
+
+class XdgPopup(Proxy):
+    """short-lived, popup surfaces for menus"""
+    interface: ClassVar[Interface] = Interface(
+        name="xdg_popup",
+        version=6,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("grab", [ArgObject("seat", "wl_seat"), ArgUInt("serial")]),
+            WRequest("reposition", [ArgObject("positioner", "xdg_positioner"), ArgUInt("token")]),
+        ],
+        events=[
+            WEvent("configure", [ArgInt("x"), ArgInt("y"), ArgInt("width"), ArgInt("height")]),
+            WEvent("popup_done", []),
+            WEvent("repositioned", [ArgUInt("token")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "invalid_grab": 0,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """remove xdg_popup interface"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_xdg_popup_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def grab(self, seat: WlSeat, serial: int) -> None:
+        """make the popup take an explicit grab"""
+        try:
+            _message = _pack_xdg_popup_grab(self._id, 1, 16, seat._id, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or seat._interface.name != "wl_seat":
+            self._call(OpCode(1), (seat, serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def reposition(self, positioner: XdgPositioner, token: int) -> None:
+        """recalculate the popup's location"""
+        try:
+            _message = _pack_xdg_popup_reposition(self._id, 2, 16, positioner._id, token)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or positioner._interface.name != "xdg_positioner":
+            self._call(OpCode(2), (positioner, token,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> XdgPopup:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_configure(self, handler: Callable[[int, int, int, int], bool]) -> Callable[[int, int, int, int], bool] | None:
+        """configure the popup surface"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_popup_done(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """popup interaction is done"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_repositioned(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """signal the completion of a repositioned request"""
+        return self._handler_set(OpCode(2), handler)
+
+    class Error(Enum):
+        INVALID_GRAB = 0
+
+XdgPopup.interface.enum_types = {
+    "error": XdgPopup.Error,
+}
+
+PROXIES["xdg_popup"] = XdgPopup
+
+# fmt: on
@@ -0,0 +1,273 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+
+__all__ = ["XdgPositioner"]
+
+_pack_xdg_positioner_destroy = Struct("IHH").pack
+_pack_xdg_positioner_set_size = Struct("IHHii").pack
+_pack_xdg_positioner_set_anchor_rect = Struct("IHHiiii").pack
+_pack_xdg_positioner_set_anchor = Struct("IHHI").pack
+_pack_xdg_positioner_set_gravity = Struct("IHHI").pack
+_pack_xdg_positioner_set_constraint_adjustment = Struct("IHHI").pack
+_pack_xdg_positioner_set_offset = Struct("IHHii").pack
+_pack_xdg_positioner_set_reactive = Struct("IHH").pack
+_pack_xdg_positioner_set_parent_size = Struct("IHHii").pack
+_pack_xdg_positioner_set_parent_configure = Struct("IHHI").pack
+
+class XdgPositioner(Proxy):
+    """child surface positioner"""
+    interface: ClassVar[Interface] = Interface(
+        name="xdg_positioner",
+        version=6,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("set_size", [ArgInt("width"), ArgInt("height")]),
+            WRequest("set_anchor_rect", [ArgInt("x"), ArgInt("y"), ArgInt("width"), ArgInt("height")]),
+            WRequest("set_anchor", [ArgUInt("anchor", "anchor")]),
+            WRequest("set_gravity", [ArgUInt("gravity", "gravity")]),
+            WRequest("set_constraint_adjustment", [ArgUInt("constraint_adjustment", "constraint_adjustment")]),
+            WRequest("set_offset", [ArgInt("x"), ArgInt("y")]),
+            WRequest("set_reactive", []),
+            WRequest("set_parent_size", [ArgInt("parent_width"), ArgInt("parent_height")]),
+            WRequest("set_parent_configure", [ArgUInt("serial")]),
+        ],
+        events=[
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "invalid_input": 0,
+                },
+            ),
+            WEnum(
+                name="anchor",
+                values={
+                    "none": 0,
+                    "top": 1,
+                    "bottom": 2,
+                    "left": 3,
+                    "right": 4,
+                    "top_left": 5,
+                    "bottom_left": 6,
+                    "top_right": 7,
+                    "bottom_right": 8,
+                },
+            ),
+            WEnum(
+                name="gravity",
+                values={
+                    "none": 0,
+                    "top": 1,
+                    "bottom": 2,
+                    "left": 3,
+                    "right": 4,
+                    "top_left": 5,
+                    "bottom_left": 6,
+                    "top_right": 7,
+                    "bottom_right": 8,
+                },
+            ),
+            WEnum(
+                name="constraint_adjustment",
+                values={
+                    "none": 0,
+                    "slide_x": 1,
+                    "slide_y": 2,
+                    "flip_x": 4,
+                    "flip_y": 8,
+                    "resize_x": 16,
+                    "resize_y": 32,
+                },
+                flag=True,
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """destroy the xdg_positioner object"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_xdg_positioner_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_size(self, width: int, height: int) -> None:
+        """set the size of the to-be positioned rectangle"""
+        try:
+            _message = _pack_xdg_positioner_set_size(self._id, 1, 16, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(1), (width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_anchor_rect(self, x: int, y: int, width: int, height: int) -> None:
+        """set the anchor rectangle within the parent surface"""
+        try:
+            _message = _pack_xdg_positioner_set_anchor_rect(self._id, 2, 24, x, y, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(2), (x, y, width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_anchor(self, anchor: Anchor) -> None:
+        """set anchor rectangle anchor"""
+        try:
+            _message = _pack_xdg_positioner_set_anchor(self._id, 3, 12, anchor.value if isinstance(anchor, Enum) else anchor)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(3), (anchor,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_gravity(self, gravity: Gravity) -> None:
+        """set child surface gravity"""
+        try:
+            _message = _pack_xdg_positioner_set_gravity(self._id, 4, 12, gravity.value if isinstance(gravity, Enum) else gravity)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(4), (gravity,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_constraint_adjustment(self, constraint_adjustment: ConstraintAdjustment) -> None:
+        """set the adjustment to be done when constrained"""
+        try:
+            _message = _pack_xdg_positioner_set_constraint_adjustment(self._id, 5, 12, constraint_adjustment.value if isinstance(constraint_adjustment, Enum) else constraint_adjustment)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(5), (constraint_adjustment,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_offset(self, x: int, y: int) -> None:
+        """set surface position offset"""
+        try:
+            _message = _pack_xdg_positioner_set_offset(self._id, 6, 16, x, y)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(6), (x, y,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_reactive(self) -> None:
+        """continuously reconstrain the surface"""
+        try:
+            _message = _pack_xdg_positioner_set_reactive(self._id, 7, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(7), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_parent_size(self, parent_width: int, parent_height: int) -> None:
+        try:
+            _message = _pack_xdg_positioner_set_parent_size(self._id, 8, 16, parent_width, parent_height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(8), (parent_width, parent_height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_parent_configure(self, serial: int) -> None:
+        """set parent configure this is a response to"""
+        try:
+            _message = _pack_xdg_positioner_set_parent_configure(self._id, 9, 12, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(9), (serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> XdgPositioner:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    class Error(Enum):
+        INVALID_INPUT = 0
+
+    class Anchor(Enum):
+        NONE = 0
+        TOP = 1
+        BOTTOM = 2
+        LEFT = 3
+        RIGHT = 4
+        TOP_LEFT = 5
+        BOTTOM_LEFT = 6
+        TOP_RIGHT = 7
+        BOTTOM_RIGHT = 8
+
+    class Gravity(Enum):
+        NONE = 0
+        TOP = 1
+        BOTTOM = 2
+        LEFT = 3
+        RIGHT = 4
+        TOP_LEFT = 5
+        BOTTOM_LEFT = 6
+        TOP_RIGHT = 7
+        BOTTOM_RIGHT = 8
+
+    class ConstraintAdjustment(Flag):
+        NONE = 0
+        SLIDE_X = 1
+        SLIDE_Y = 2
+        FLIP_X = 4
+        FLIP_Y = 8
+        RESIZE_X = 16
+        RESIZE_Y = 32
+
+XdgPositioner.interface.enum_types = {
+    "error": XdgPositioner.Error,
+    "anchor": XdgPositioner.Anchor,
+    "gravity": XdgPositioner.Gravity,
+    "constraint_adjustment": XdgPositioner.ConstraintAdjustment,
+}
+
+PROXIES["xdg_positioner"] = XdgPositioner
+
+# fmt: on
@@ -0,0 +1,156 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .xdg_popup import XdgPopup
+from .xdg_toplevel import XdgToplevel
+if typing.TYPE_CHECKING:
+    from .xdg_positioner import XdgPositioner
+
+__all__ = ["XdgSurface"]
+
+_pack_xdg_surface_destroy = Struct("IHH").pack
+_pack_xdg_surface_get_toplevel = Struct("IHHI").pack
+_pack_xdg_surface_get_popup = Struct("IHHIII").pack
+_pack_xdg_surface_set_window_geometry = Struct("IHHiiii").pack
+_pack_xdg_surface_ack_configure = Struct("IHHI").pack
+
+class XdgSurface(Proxy):
+    """desktop user interface surface base interface"""
+    interface: ClassVar[Interface] = Interface(
+        name="xdg_surface",
+        version=6,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("get_toplevel", [ArgNewId("id", "xdg_toplevel")]),
+            WRequest("get_popup", [ArgNewId("id", "xdg_popup"), ArgObject("parent", "xdg_surface", True), ArgObject("positioner", "xdg_positioner")]),
+            WRequest("set_window_geometry", [ArgInt("x"), ArgInt("y"), ArgInt("width"), ArgInt("height")]),
+            WRequest("ack_configure", [ArgUInt("serial")]),
+        ],
+        events=[
+            WEvent("configure", [ArgUInt("serial")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "not_constructed": 1,
+                    "already_constructed": 2,
+                    "unconfigured_buffer": 3,
+                    "invalid_serial": 4,
+                    "invalid_size": 5,
+                    "defunct_role_object": 6,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """destroy the xdg_surface"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_xdg_surface_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def get_toplevel(self) -> XdgToplevel:
+        """assign the xdg_toplevel surface role"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(XdgToplevel)
+            id._queue = self._queue
+            try:
+                _message = _pack_xdg_surface_get_toplevel(self._id, 1, 12, id._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(1), (id,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def get_popup(self, parent: XdgSurface | None, positioner: XdgPositioner) -> XdgPopup:
+        """assign the xdg_popup surface role"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(XdgPopup)
+            id._queue = self._queue
+            try:
+                _message = _pack_xdg_surface_get_popup(self._id, 2, 20, id._id, 0 if parent is None else parent._id, positioner._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug or (parent is not None and parent._interface.name != "xdg_surface") or positioner._interface.name != "xdg_positioner":
+                self._call(OpCode(2), (id, parent, positioner,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def set_window_geometry(self, x: int, y: int, width: int, height: int) -> None:
+        """set the new window geometry"""
+        try:
+            _message = _pack_xdg_surface_set_window_geometry(self._id, 3, 24, x, y, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(3), (x, y, width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def ack_configure(self, serial: int) -> None:
+        """ack a configure event"""
+        try:
+            _message = _pack_xdg_surface_ack_configure(self._id, 4, 12, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(4), (serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> XdgSurface:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_configure(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """suggest a surface change"""
+        return self._handler_set(OpCode(0), handler)
+
+    class Error(Enum):
+        NOT_CONSTRUCTED = 1
+        ALREADY_CONSTRUCTED = 2
+        UNCONFIGURED_BUFFER = 3
+        INVALID_SERIAL = 4
+        INVALID_SIZE = 5
+        DEFUNCT_ROLE_OBJECT = 6
+
+XdgSurface.interface.enum_types = {
+    "error": XdgSurface.Error,
+}
+
+PROXIES["xdg_surface"] = XdgSurface
+
+# fmt: on
@@ -0,0 +1,334 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+if typing.TYPE_CHECKING:
+    from ..wayland.wl_output import WlOutput
+    from ..wayland.wl_seat import WlSeat
+
+__all__ = ["XdgToplevel"]
+
+_pack_xdg_toplevel_destroy = Struct("IHH").pack
+_pack_xdg_toplevel_set_parent = Struct("IHHI").pack
+_pack_xdg_toplevel_show_window_menu = Struct("IHHIIii").pack
+_pack_xdg_toplevel_move = Struct("IHHII").pack
+_pack_xdg_toplevel_resize = Struct("IHHIII").pack
+_pack_xdg_toplevel_set_max_size = Struct("IHHii").pack
+_pack_xdg_toplevel_set_min_size = Struct("IHHii").pack
+_pack_xdg_toplevel_set_maximized = Struct("IHH").pack
+_pack_xdg_toplevel_unset_maximized = Struct("IHH").pack
+_pack_xdg_toplevel_set_fullscreen = Struct("IHHI").pack
+_pack_xdg_toplevel_unset_fullscreen = Struct("IHH").pack
+_pack_xdg_toplevel_set_minimized = Struct("IHH").pack
+
+class XdgToplevel(Proxy):
+    """toplevel surface"""
+    interface: ClassVar[Interface] = Interface(
+        name="xdg_toplevel",
+        version=6,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("set_parent", [ArgObject("parent", "xdg_toplevel", True)]),
+            WRequest("set_title", [ArgStr("title")]),
+            WRequest("set_app_id", [ArgStr("app_id")]),
+            WRequest("show_window_menu", [ArgObject("seat", "wl_seat"), ArgUInt("serial"), ArgInt("x"), ArgInt("y")]),
+            WRequest("move", [ArgObject("seat", "wl_seat"), ArgUInt("serial")]),
+            WRequest("resize", [ArgObject("seat", "wl_seat"), ArgUInt("serial"), ArgUInt("edges", "resize_edge")]),
+            WRequest("set_max_size", [ArgInt("width"), ArgInt("height")]),
+            WRequest("set_min_size", [ArgInt("width"), ArgInt("height")]),
+            WRequest("set_maximized", []),
+            WRequest("unset_maximized", []),
+            WRequest("set_fullscreen", [ArgObject("output", "wl_output", True)]),
+            WRequest("unset_fullscreen", []),
+            WRequest("set_minimized", []),
+        ],
+        events=[
+            WEvent("configure", [ArgInt("width"), ArgInt("height"), ArgArray("states")]),
+            WEvent("close", []),
+            WEvent("configure_bounds", [ArgInt("width"), ArgInt("height")]),
+            WEvent("wm_capabilities", [ArgArray("capabilities")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "invalid_resize_edge": 0,
+                    "invalid_parent": 1,
+                    "invalid_size": 2,
+                },
+            ),
+            WEnum(
+                name="resize_edge",
+                values={
+                    "none": 0,
+                    "top": 1,
+                    "bottom": 2,
+                    "left": 4,
+                    "top_left": 5,
+                    "bottom_left": 6,
+                    "right": 8,
+                    "top_right": 9,
+                    "bottom_right": 10,
+                },
+            ),
+            WEnum(
+                name="state",
+                values={
+                    "maximized": 1,
+                    "fullscreen": 2,
+                    "resizing": 3,
+                    "activated": 4,
+                    "tiled_left": 5,
+                    "tiled_right": 6,
+                    "tiled_top": 7,
+                    "tiled_bottom": 8,
+                    "suspended": 9,
+                },
+            ),
+            WEnum(
+                name="wm_capabilities",
+                values={
+                    "window_menu": 1,
+                    "maximize": 2,
+                    "fullscreen": 3,
+                    "minimize": 4,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """destroy the xdg_toplevel"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_xdg_toplevel_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_parent(self, parent: XdgToplevel | None) -> None:
+        """set the parent of this surface"""
+        try:
+            _message = _pack_xdg_toplevel_set_parent(self._id, 1, 12, 0 if parent is None else parent._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (parent is not None and parent._interface.name != "xdg_toplevel"):
+            self._call(OpCode(1), (parent,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_title(self, title: str) -> None:
+        """set surface title"""
+        self._call(OpCode(2), (title,))
+        return None
+
+    def set_app_id(self, app_id: str) -> None:
+        """set application ID"""
+        self._call(OpCode(3), (app_id,))
+        return None
+
+    def show_window_menu(self, seat: WlSeat, serial: int, x: int, y: int) -> None:
+        """show the window menu"""
+        try:
+            _message = _pack_xdg_toplevel_show_window_menu(self._id, 4, 24, seat._id, serial, x, y)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or seat._interface.name != "wl_seat":
+            self._call(OpCode(4), (seat, serial, x, y,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def move(self, seat: WlSeat, serial: int) -> None:
+        """start an interactive move"""
+        try:
+            _message = _pack_xdg_toplevel_move(self._id, 5, 16, seat._id, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or seat._interface.name != "wl_seat":
+            self._call(OpCode(5), (seat, serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def resize(self, seat: WlSeat, serial: int, edges: ResizeEdge) -> None:
+        """start an interactive resize"""
+        try:
+            _message = _pack_xdg_toplevel_resize(self._id, 6, 20, seat._id, serial, edges.value if isinstance(edges, Enum) else edges)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or seat._interface.name != "wl_seat":
+            self._call(OpCode(6), (seat, serial, edges,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_max_size(self, width: int, height: int) -> None:
+        """set the maximum size"""
+        try:
+            _message = _pack_xdg_toplevel_set_max_size(self._id, 7, 16, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(7), (width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_min_size(self, width: int, height: int) -> None:
+        """set the minimum size"""
+        try:
+            _message = _pack_xdg_toplevel_set_min_size(self._id, 8, 16, width, height)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(8), (width, height,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_maximized(self) -> None:
+        """maximize the window"""
+        try:
+            _message = _pack_xdg_toplevel_set_maximized(self._id, 9, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(9), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def unset_maximized(self) -> None:
+        """unmaximize the window"""
+        try:
+            _message = _pack_xdg_toplevel_unset_maximized(self._id, 10, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(10), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_fullscreen(self, output: WlOutput | None) -> None:
+        """set the window as fullscreen on an output"""
+        try:
+            _message = _pack_xdg_toplevel_set_fullscreen(self._id, 11, 12, 0 if output is None else output._id)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug or (output is not None and output._interface.name != "wl_output"):
+            self._call(OpCode(11), (output,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def unset_fullscreen(self) -> None:
+        """unset the window as fullscreen"""
+        try:
+            _message = _pack_xdg_toplevel_unset_fullscreen(self._id, 12, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(12), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def set_minimized(self) -> None:
+        """set the window as minimized"""
+        try:
+            _message = _pack_xdg_toplevel_set_minimized(self._id, 13, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(13), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> XdgToplevel:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_configure(self, handler: Callable[[int, int, bytes], bool]) -> Callable[[int, int, bytes], bool] | None:
+        """suggest a surface change"""
+        return self._handler_set(OpCode(0), handler)
+
+    def on_close(self, handler: Callable[[], bool]) -> Callable[[], bool] | None:
+        """surface wants to be closed"""
+        return self._handler_set(OpCode(1), handler)
+
+    def on_configure_bounds(self, handler: Callable[[int, int], bool]) -> Callable[[int, int], bool] | None:
+        """recommended window geometry bounds"""
+        return self._handler_set(OpCode(2), handler)
+
+    def on_wm_capabilities(self, handler: Callable[[bytes], bool]) -> Callable[[bytes], bool] | None:
+        """compositor capabilities"""
+        return self._handler_set(OpCode(3), handler)
+
+    class Error(Enum):
+        INVALID_RESIZE_EDGE = 0
+        INVALID_PARENT = 1
+        INVALID_SIZE = 2
+
+    class ResizeEdge(Enum):
+        NONE = 0
+        TOP = 1
+        BOTTOM = 2
+        LEFT = 4
+        TOP_LEFT = 5
+        BOTTOM_LEFT = 6
+        RIGHT = 8
+        TOP_RIGHT = 9
+        BOTTOM_RIGHT = 10
+
+    class State(Enum):
+        MAXIMIZED = 1
+        FULLSCREEN = 2
+        RESIZING = 3
+        ACTIVATED = 4
+        TILED_LEFT = 5
+        TILED_RIGHT = 6
+        TILED_TOP = 7
+        TILED_BOTTOM = 8
+        SUSPENDED = 9
+
+    class WmCapabilities(Enum):
+        WINDOW_MENU = 1
+        MAXIMIZE = 2
+        FULLSCREEN = 3
+        MINIMIZE = 4
+
+XdgToplevel.interface.enum_types = {
+    "error": XdgToplevel.Error,
+    "resize_edge": XdgToplevel.ResizeEdge,
+    "state": XdgToplevel.State,
+    "wm_capabilities": XdgToplevel.WmCapabilities,
+}
+
+PROXIES["xdg_toplevel"] = XdgToplevel
+
+# fmt: on
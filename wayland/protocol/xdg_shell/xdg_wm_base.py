@@ -0,0 +1,144 @@
+# Auto generated do not edit manually
+# fmt: off
+# pyright: reportPrivateUsage=false,reportUnusedImport=false
+from __future__ import annotations
+from enum import Enum, Flag
+import typing
+from typing import Any, ClassVar
+from collections.abc import Callable
+from struct import Struct
+from struct import error as struct_error
+from ...base import *
+from .xdg_positioner import XdgPositioner
+from .xdg_surface import XdgSurface
+if typing.TYPE_CHECKING:
+    from ..wayland.wl_surface import WlSurface
+
+__all__ = ["XdgWmBase"]
+
+_pack_xdg_wm_base_destroy = Struct("IHH").pack
+_pack_xdg_wm_base_create_positioner = Struct("IHHI").pack
+_pack_xdg_wm_base_get_xdg_surface = Struct("IHHII").pack
+_pack_xdg_wm_base_pong = Struct("IHHI").pack
+
+class XdgWmBase(Proxy):
+    """create desktop-style surfaces"""
+    interface: ClassVar[Interface] = Interface(
+        name="xdg_wm_base",
+        version=6,
+        requests=[
+            WRequest("destroy", []),
+            WRequest("create_positioner", [ArgNewId("id", "xdg_positioner")]),
+            WRequest("get_xdg_surface", [ArgNewId("id", "xdg_surface"), ArgObject("surface", "wl_surface")]),
+            WRequest("pong", [ArgUInt("serial")]),
+        ],
+        events=[
+            WEvent("ping", [ArgUInt("serial")]),
+        ],
+        enums=[
+            WEnum(
+                name="error",
+                values={
+                    "role": 0,
+                    "defunct_surfaces": 1,
+                    "not_the_topmost_popup": 2,
+                    "invalid_popup_parent": 3,
+                    "invalid_surface_state": 4,
+                    "invalid_positioner": 5,
+                    "unresponsive": 6,
+                },
+            ),
+        ],
+    )
+
+    def __init__(self, id: Id, connection: Connection) -> None:
+        super().__init__(id, connection, self.interface)
+
+    def destroy(self) -> None:
+        """destroy xdg_wm_base"""
+        if self._is_destroyed or not self._is_attached or self._is_detached or self._connection.is_terminated:
+            return None
+        self._is_destroyed = True
+        try:
+            _message = _pack_xdg_wm_base_destroy(self._id, 0, 8)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(0), ())
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def create_positioner(self) -> XdgPositioner:
+        """create a positioner object"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(XdgPositioner)
+            id._queue = self._queue
+            try:
+                _message = _pack_xdg_wm_base_create_positioner(self._id, 1, 12, id._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug:
+                self._call(OpCode(1), (id,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def get_xdg_surface(self, surface: WlSurface) -> XdgSurface:
+        """create a shell surface from a surface"""
+        with self._connection._request_scope():
+            id = self._connection.create_proxy(XdgSurface)
+            id._queue = self._queue
+            try:
+                _message = _pack_xdg_wm_base_get_xdg_surface(self._id, 2, 16, id._id, surface._id)
+            except (AttributeError, TypeError, ValueError, struct_error):
+                _message = None
+            if _message is None or self._connection._debug or surface._interface.name != "wl_surface":
+                self._call(OpCode(2), (id, surface,))
+                return id
+            id._is_attached = True
+            self._connection._message_submit_packed(self._id, _message)
+            return id
+
+    def pong(self, serial: int) -> None:
+        """respond to a ping event"""
+        try:
+            _message = _pack_xdg_wm_base_pong(self._id, 3, 12, serial)
+        except (AttributeError, TypeError, ValueError, struct_error):
+            _message = None
+        if _message is None or self._connection._debug:
+            self._call(OpCode(3), (serial,))
+            return None
+        self._connection._message_submit_packed(self._id, _message)
+        return None
+
+    def __enter__(self) -> XdgWmBase:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.destroy()
+
+    def __del__(self) -> None:
+        self.destroy()
+
+    def on_ping(self, handler: Callable[[int], bool]) -> Callable[[int], bool] | None:
+        """check if the client is alive"""
+        return self._handler_set(OpCode(0), handler)
+
+    class Error(Enum):
+        ROLE = 0
+        DEFUNCT_SURFACES = 1
+        NOT_THE_TOPMOST_POPUP = 2
+        INVALID_POPUP_PARENT = 3
+        INVALID_SURFACE_STATE = 4
+        INVALID_POSITIONER = 5
+        UNRESPONSIVE = 6
+
+XdgWmBase.interface.enum_types = {
+    "error": XdgWmBase.Error,
+}
+
+PROXIES["xdg_wm_base"] = XdgWmBase
+
+# fmt: on
@@ -0,0 +1,304 @@
+"""Buffers for software rendering backed by shared memory
+
+>>> swapchain = ShmSwapchain(wl_shm, width, height)
+>>> buffer = swapchain.acquire()
+>>> if buffer is not None:
+...     draw(buffer.data, buffer.age)
+...     swapchain.attach(wl_surf, buffer)
+...     wl_surf.commit()
+"""
+
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Self
+
+from .base import SharedMemory
+from .protocol.wayland import WlBuffer, WlShm, WlShmPool, WlSurface
+
+__all__ = ["ShmPool", "ShmBuffer", "ShmSwapchain"]
+
+
+class ShmPool:
+    """Shared memory pool which grows in place
+
+    Memory is grown geometrically by truncating and remapping the same file,
+    and the compositor is notified with `wl_shm_pool.resize`, so the file
+    descriptor is reused for the lifetime of the pool. Pool never shrinks,
+    and memory is sealed against shrinking so the compositor can map it safely.
+    """
+
+    __slots__ = ["_memory", "_pool"]
+
+    def __init__(self, wl_shm: WlShm, size: int) -> None:
+        if size <= 0:
+            raise ValueError(f"pool size must be positive: {size}")
+        self._memory: SharedMemory | None = SharedMemory(size, seal=True)
+        self._pool: WlShmPool = wl_shm.create_pool(self._memory, size)
+
+    @property
+    def size(self) -> int:
+        return 0 if self._memory is None else len(self._memory)
+
+    @property
+    def memory(self) -> SharedMemory:
+        if self._memory is None:
+            raise RuntimeError("pool is closed")
+        return self._memory
+
+    def reserve(self, size: int) -> bool:
+        """Grow pool to at least `size` bytes, returns `True` if it has grown
+
+        Views of the memory must be released before the pool grows.
+        """
+        memory = self.memory
+        if size <= len(memory):
+            return False
+        size = max(size, 2 * len(memory))
+        memory.resize(size)
+        self._pool.resize(size)
+        return True
+
+    def create_buffer(
+        self,
+        offset: int,
+        width: int,
+        height: int,
+        stride: int,
+        format: WlShm.Format,
+    ) -> WlBuffer:
+        """Create buffer growing the pool if it does not fit"""
+        self.reserve(offset + stride * height)
+        return self._pool.create_buffer(offset, width, height, stride, format)
+
+    def close(self) -> None:
+        """Destroy the pool, memory is unmapped by the compositor once
+        all buffers created from it are destroyed"""
+        memory, self._memory = self._memory, None
+        if memory is None:
+            return
+        self._pool.destroy()
+        memory.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ShmPool({self._pool}, size={self.size})"
+
+
+class ShmBuffer:
+    """Buffer of the swapchain
+
+    Buffer is `busy` from the moment it is attached until the compositor
+    releases it, and must not be drawn into while busy. `age` is the number
+    of frames since the content of the buffer has been attached, `0` means
+    that the content is undefined (same as `EGL_EXT_buffer_age`), so only
+    the area damaged during the last `age - 1` frames has to be redrawn.
+    """
+
+    __slots__ = ["_swapchain", "wl_buffer", "offset", "size", "busy", "age"]
+
+    def __init__(
+        self,
+        swapchain: ShmSwapchain,
+        wl_buffer: WlBuffer,
+        offset: int,
+        size: int,
+    ) -> None:
+        self._swapchain = swapchain
+        self.wl_buffer = wl_buffer
+        self.offset = offset
+        self.size = size
+        self.busy = False
+        self.age = 0
+        wl_buffer.on_release(self._on_release)
+
+    @property
+    def data(self) -> memoryview:
+        """Content of the buffer
+
+        View must be released before the swapchain is resized or closed.
+        """
+        pool = self._swapchain._pool
+        if pool is None or self not in self._swapchain._buffers:
+            raise RuntimeError(f"[{self.wl_buffer}] buffer has been retired")
+        view = memoryview(pool.memory.buf)
+        return view[self.offset : self.offset + self.size]
+
+    def _on_release(self) -> bool:
+        self.busy = False
+        if self in self._swapchain._buffers:
+            return True
+        # retired by resize while compositor was still reading it
+        self._swapchain._retired.remove(self)
+        self.wl_buffer.destroy()
+        return False
+
+    def __repr__(self) -> str:
+        return f"ShmBuffer({self.wl_buffer}, busy={self.busy}, age={self.age})"
+
+
+class ShmSwapchain:
+    """Buffers of the same size allocated from a single shared memory pool
+
+    At most `max_count` buffers are created, only once all existing buffers
+    are busy. When all of them are busy nothing can be drawn until the
+    compositor releases one of them. Pool grows in place on resize, and new
+    buffers are placed after the retired buffers still used by the compositor.
+    """
+
+    __slots__ = [
+        "_wl_shm",
+        "_pool",
+        "_buffers",
+        "_retired",
+        "_base",
+        "width",
+        "height",
+        "stride",
+        "format",
+        "max_count",
+        "_bytes_per_pixel",
+    ]
+
+    def __init__(
+        self,
+        wl_shm: WlShm,
+        width: int,
+        height: int,
+        format: WlShm.Format = WlShm.Format.XRGB8888,
+        bytes_per_pixel: int = 4,
+        max_count: int = 3,
+    ) -> None:
+        if max_count < 1:
+            raise ValueError(f"max_count must be positive: {max_count}")
+        self._wl_shm = wl_shm
+        self._pool: ShmPool | None = None
+        self._buffers: list[ShmBuffer] = []
+        self._retired: list[ShmBuffer] = []  # busy buffers of previous sizes
+        self._base = 0  # offset of the first buffer in the pool
+        self.width = 0
+        self.height = 0
+        self.stride = 0
+        self.format = format
+        self.max_count = max_count
+        self._bytes_per_pixel = bytes_per_pixel
+        self.resize(width, height)
+
+    @property
+    def size(self) -> int:
+        """Size of a single buffer in bytes"""
+        return self.stride * self.height
+
+    @property
+    def buffers(self) -> Sequence[ShmBuffer]:
+        return self._buffers
+
+    def acquire(self) -> ShmBuffer | None:
+        """Get free buffer to draw into, `None` if all buffers are busy
+
+        Free buffer with the most recent content is preferred, so the least
+        amount of it has to be redrawn.
+        """
+        if self._pool is None:
+            raise RuntimeError("swapchain is closed")
+        free = [buffer for buffer in self._buffers if not buffer.busy]
+        if free:
+            return min(free, key=lambda buffer: buffer.age or self.max_count + 1)
+        if len(self._buffers) >= self.max_count:
+            return None
+        offset = self._base + self.size * len(self._buffers)
+        wl_buffer = self._pool.create_buffer(
+            offset, self.width, self.height, self.stride, self.format
+        )
+        buffer = ShmBuffer(self, wl_buffer, offset, self.size)
+        self._buffers.append(buffer)
+        return buffer
+
+    def attach(
+        self,
+        wl_surf: WlSurface,
+        buffer: ShmBuffer,
+        damage: Sequence[tuple[int, int, int, int]] | None = None,
+    ) -> None:
+        """Attach buffer to the surface and damage it, surface is not committed
+
+        `damage` is a list of `(x, y, width, height)` rectangles in buffer
+        coordinates, whole buffer is damaged by default.
+        """
+        if buffer not in self._buffers:
+            raise ValueError(f"[{buffer.wl_buffer}] does not belong to the swapchain")
+        if buffer.busy:
+            raise ValueError(f"[{buffer.wl_buffer}] buffer is busy")
+        wl_surf.attach(buffer.wl_buffer, 0, 0)
+        if damage is None:
+            wl_surf.damage_buffer(0, 0, self.width, self.height)
+        else:
+            for x, y, width, height in damage:
+                wl_surf.damage_buffer(x, y, width, height)
+        for other in self._buffers:
+            if other.age:
+                other.age += 1
+        buffer.busy = True
+        buffer.age = 1
+
+    def resize(self, width: int, height: int) -> bool:
+        """Recreate buffers for the new size, returns `False` if unchanged
+
+        Busy buffers are destroyed once released by the compositor. Pool is
+        reused, and only grows if new buffers do not fit.
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError(f"invalid swapchain size {width}x{height}")
+        if (width, height) == (self.width, self.height) and self._pool is not None:
+            return False
+        self._retire()
+        self.width, self.height = width, height
+        self.stride = width * self._bytes_per_pixel
+        self._base = self._base_find()
+        if self._pool is None:
+            # double buffering is the most common case
+            self._pool = ShmPool(self._wl_shm, self.size * min(2, self.max_count))
+        return True
+
+    def close(self) -> None:
+        """Destroy all buffers and the pool"""
+        self._retire()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _base_find(self) -> int:
+        """Lowest offset at which buffers do not overlap retired buffers"""
+        span = self.size * self.max_count
+        retired = [(buf.offset, buf.offset + buf.size) for buf in self._retired]
+        for base in sorted([0, *(end for _, end in retired)]):
+            if all(base + span <= start or base >= end for start, end in retired):
+                return base
+        return 0  # unreachable, offset after the last retired buffer always fits
+
+    def _retire(self) -> None:
+        """Destroy idle buffers, busy ones are destroyed once released"""
+        buffers, self._buffers = self._buffers, []
+        for buffer in buffers:
+            if buffer.busy:
+                self._retired.append(buffer)
+            else:
+                buffer.wl_buffer.destroy()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"ShmSwapchain({self.width}x{self.height}, "
+            f"buffers={len(self._buffers)}/{self.max_count})"
+        )
@@ -2,27 +2,65 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import io
 import os
 import socket
+import subprocess
+import sys
 import tempfile
+import threading
 import unittest
+from pathlib import Path
+from struct import Struct
 from typing import Any
 from collections.abc import Callable
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from .base import (
+    MSG_HEADER,
+    EventOverflow,
+    EventStream,
+    READ_BUFF_MAX,
     ArgArray,
     ArgFixed,
     ArgInt,
     ArgStr,
     Connection,
     FdFile,
+    HUGE_PAGE_SIZE,
     Id,
+    OpCode,
+    OwnedFd,
+    PROXIES,
+    Protocol,
     Proxy,
+    ProxyTable,
+    SERVER_ID_MIN,
     SharedMemory,
+    _EventFanout,
+)
+from .client import (
+    BlockingClientConnection,
+    ClientConnection,
+    ThreadedClientConnection,
+)
+from .bench import main as bench_main
+from .codegen import (
+    _compile_key,
+    _protocol_code,
+    compile_protocol,
+    generate_client_package,
+    generate_index,
+)
+from .frame import FrameScheduler
+from .shm import ShmBuffer, ShmSwapchain
+from .input import (
+    PointerCoalescer,
+    PointerFrame,
+    TouchCoalescer,
+    TouchFrame,
 )
-from .client import ClientConnection
 from .protocol.wayland import *
 
 
@@ -71,6 +109,464 @@ class TestArgs(unittest.TestCase):
         file.seek(0)
         self.assertEqual(arg.unpack(file, self.conn), b"string")
 
+    def test_owned_fd(self) -> None:
+        read, write = os.pipe()
+        fd = OwnedFd(write)
+        self.assertIsInstance(fd, FdFile)
+        os.write(fd.fileno(), b"data")
+        del fd  # closed on collection
+        self.assertEqual(os.read(read, 16), b"data")
+        self.assertEqual(os.read(read, 16), b"")  # writer is closed
+
+        fd = OwnedFd(read)
+        raw = fd.detach()
+        self.assertTrue(fd.closed)
+        with self.assertRaises(ValueError):
+            fd.fileno()
+        with OwnedFd(raw) as fd:
+            self.assertEqual(fd.fileno(), raw)
+        self.assertTrue(fd.closed)
+
+
+class TestPack(unittest.TestCase):
+    def test_packed_requests(self) -> None:
+        conn = Mock(spec=Connection)
+        conn._debug = False
+        surf = WlSurface(Id(3), conn)
+        buff = WlBuffer(Id(4), conn)
+
+        def generic(opcode: int, *args: Any) -> bytes:
+            data, _ = surf.interface.pack(OpCode(opcode), args)
+            return MSG_HEADER.pack(surf._id, opcode, MSG_HEADER.size + len(data)) + data
+
+        surf.attach(buff, -1, 2)
+        surf.attach(None, 0, 0)
+        surf.damage_buffer(0, 0, 640, 480)
+        surf.set_buffer_transform(WlOutput.Transform.FLIPPED_90)
+        surf.commit()
+        packed = [call.args for call in conn._message_submit_packed.call_args_list]
+        self.assertEqual(
+            packed,
+            [
+                (surf._id, generic(1, buff, -1, 2)),
+                (surf._id, generic(1, None, 0, 0)),
+                (surf._id, generic(9, 0, 0, 640, 480)),
+                (surf._id, generic(7, WlOutput.Transform.FLIPPED_90)),
+                (surf._id, generic(6)),
+            ],
+        )
+
+    def test_packed_requests_invalid(self) -> None:
+        conn = Mock(spec=Connection)
+        conn._debug = False
+        surf = WlSurface(Id(3), conn)
+        region = WlRegion(Id(4), conn)
+
+        # invalid arguments are reported by the generic path
+        invalid: list[Any] = [region, 4, 1.5]
+        with self.assertRaisesRegex(TypeError, "must implement 'wl_buffer'"):
+            surf.attach(invalid[0], 0, 0)
+        with self.assertRaisesRegex(TypeError, "proxy object expected"):
+            surf.attach(invalid[1], 0, 0)
+        with self.assertRaisesRegex(TypeError, "integer expected"):
+            surf.damage(0, 0, invalid[2], 2)
+        conn._message_submit_packed.assert_not_called()
+        conn._message_submit.assert_not_called()
+
+    def test_unpack_events(self) -> None:
+        conn = Mock(spec=Connection)
+        conn._proxies = ProxyTable()
+        pointer = WlPointer.interface
+        motion = pointer.unpack(conn, OpCode(2), Struct("Iii").pack(7, -384, 32591))
+        self.assertEqual(motion, [7, -1.5, 32591 / 256.0])
+        button = pointer.unpack(conn, OpCode(3), Struct("IIII").pack(1, 2, 272, 1))
+        self.assertEqual(button, [1, 2, 272, WlPointer.ButtonState.PRESSED])
+        self.assertEqual(pointer.unpack(conn, OpCode(5), b""), [])
+
+        # enum qualified with interface name, and flags combination
+        offer = WlDataOffer.interface
+        actions = offer.unpack(conn, OpCode(1), Struct("I").pack(3))
+        flags = WlDataDeviceManager.DndAction.COPY | WlDataDeviceManager.DndAction.MOVE
+        self.assertEqual(actions, [flags])
+
+        registry = WlRegistry.interface
+        data = Struct("II8sI").pack(1, 7, b"wl_shm\x00", 2)
+        self.assertEqual(registry.unpack(conn, OpCode(0), data), [1, "wl_shm", 2])
+        with self.assertRaises(ValueError):
+            registry.unpack(conn, OpCode(0), data[:-4])
+
+
+class TestProtocol(unittest.TestCase):
+    def test_proxy_types(self) -> None:
+        self.assertIs(PROXIES.get("wl_surface"), WlSurface)
+        self.assertIn("xdg_toplevel", PROXIES)
+        proxy_type = PROXIES["xdg_toplevel"]
+        self.assertEqual(proxy_type.__name__, "XdgToplevel")
+        self.assertEqual(proxy_type.interface.name, "xdg_toplevel")
+        self.assertIsNone(PROXIES.get("wl_unknown"))
+        self.assertNotIn("wl_unknown", PROXIES)
+        with self.assertRaises(KeyError):
+            PROXIES["wl_unknown"]
+
+        # qualified enums of interfaces that are not loaded yet
+        interface = PROXIES["zwlr_layer_surface_v1"].interface
+        layer = interface._enum_type("zwlr_layer_shell_v1.layer")
+        self.assertIs(
+            layer, PROXIES["zwlr_layer_shell_v1"].interface.enum_types["layer"]
+        )
+
+    def test_lazy_import(self) -> None:
+        script = (
+            "import sys, wayland.client;"
+            "from wayland.protocol.xdg_shell import XdgWmBase;"
+            "print(' '.join(sorted(sys.modules)))"
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).parent.parent,
+            text=True,
+        )
+        modules = set(output.split())
+        for name in ["wl_display", "wl_registry", "wl_shm", "xdg_wm_base"]:
+            self.assertTrue(any(module.endswith(f".{name}") for module in modules))
+        for name in ["wl_surface", "wl_seat", "wl_data_device", "zwlr_layer_shell_v1"]:
+            self.assertFalse(any(module.endswith(f".{name}") for module in modules))
+
+        from .protocol import xdg_shell
+
+        self.assertIn("XdgPopup", dir(xdg_shell))
+        with self.assertRaises(AttributeError):
+            xdg_shell.WlSurface  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_codegen_package(self) -> None:
+        """Generated modules are up to date"""
+        root = Path(__file__).parent
+        protocols = [
+            Protocol.load(str(path))
+            for path in sorted((root.parent / "protocol").glob("*.xml"))
+        ]
+        owners = {
+            iface_name: proto.name
+            for proto in protocols
+            for iface_name in proto.interfaces
+        }
+        for proto in protocols:
+            package = root / "protocol" / proto.name
+            files = generate_client_package(proto, owners)
+            self.assertEqual(set(files), {path.name for path in package.glob("*.py")})
+            for name, source in files.items():
+                self.assertEqual((package / name).read_text(), source, name)
+        index = (root / "protocol" / "__init__.py").read_text()
+        self.assertEqual(index, generate_index(protocols))
+
+    def test_compile_protocol(self) -> None:
+        xml = (
+            '<protocol name="test_vendor">'
+            '<interface name="test_vendor_v1" version="2">'
+            '<request name="get_item">'
+            '<arg name="id" type="new_id" interface="test_vendor_item_v1"/>'
+            '<arg name="surface" type="object" interface="wl_surface"/>'
+            "</request>"
+            '<request name="sync">'
+            '<arg name="callback" type="new_id" interface="wl_callback"/>'
+            "</request>"
+            "</interface>"
+            '<interface name="test_vendor_item_v1" version="1">'
+            '<request name="destroy" type="destructor"/>'
+            '<event name="state"><arg name="state" type="uint" enum="state"/></event>'
+            '<enum name="state"><entry name="idle" value="0"/>'
+            '<entry name="busy" value="1"/></enum>'
+            "</interface>"
+            "</protocol>"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "test-vendor.xml"
+            path.write_text(xml)
+            cache_dir = Path(tmp) / "cache"
+            module = compile_protocol(path, cache_dir)
+            self.assertIs(compile_protocol(path, cache_dir), module)
+            self.assertEqual(len(list(cache_dir.glob("*.bin"))), 1)
+
+            vendor_type = module.TestVendorV1
+            item_type = module.TestVendorItemV1
+            self.assertIs(PROXIES["test_vendor_v1"], vendor_type)
+            self.assertEqual(vendor_type.interface.version, 2)
+
+            def create_proxy(proxy_type: type[Proxy]) -> Proxy:
+                return proxy_type(Id(5), conn)
+
+            conn = Mock(spec=Connection)
+            conn._debug = False
+            conn._request_scope.return_value = contextlib.nullcontext()
+            conn.create_proxy.side_effect = create_proxy
+            vendor = vendor_type(Id(3), conn)
+            surface = WlSurface(Id(4), conn)
+            item = vendor.get_item(surface)
+            self.assertIsInstance(item, item_type)
+            self.assertIsInstance(vendor.sync(), WlCallback)
+            self.assertEqual(
+                conn._message_submit_packed.call_args_list[0].args,
+                (vendor._id, Struct("IHHII").pack(3, 0, 16, 5, 4)),
+            )
+            state = item_type.interface.unpack(conn, OpCode(0), Struct("I").pack(1))
+            self.assertEqual(state, [item_type.State.BUSY])
+
+            # warm start loads code from the cache without parsing XML
+            name, interfaces, extern, _ = _protocol_code(
+                path, _compile_key(path.read_bytes()), cache_dir
+            )
+            with patch.object(Protocol, "load", side_effect=AssertionError):
+                cached = _protocol_code(
+                    path, _compile_key(path.read_bytes()), cache_dir
+                )
+            self.assertEqual(cached[:3], (name, interfaces, extern))
+            self.assertEqual(name, "test_vendor")
+            self.assertEqual(extern, ["wl_callback", "wl_surface"])
+
+            # corrupted cache entry is compiled again
+            (cache_file,) = cache_dir.glob("*.bin")
+            cache_file.write_bytes(b"corrupted")
+            _protocol_code(path, _compile_key(path.read_bytes()), cache_dir)
+            self.assertNotEqual(cache_file.read_bytes(), b"corrupted")
+
+        # generated protocols can not be compiled again
+        xdg_shell = Path(__file__).parent.parent / "protocol" / "xdg-shell.xml"
+        with tempfile.TemporaryDirectory() as tempdir:
+            with self.assertRaisesRegex(ValueError, "xdg_wm_base"):
+                compile_protocol(xdg_shell, Path(tempdir))
+
+
+class TestProxy(unittest.IsolatedAsyncioTestCase):
+    def test_subscribe(self) -> None:
+        def dispatch(*args: Any) -> None:
+            opcode, _ = pointer.interface.events_by_name["motion"]
+            pointer._dispatch(opcode, args)
+
+        def once(*args: Any) -> bool:
+            calls.append(("once", args))
+            return False
+
+        def fails(*_: Any) -> bool:
+            raise RuntimeError("subscriber failure")
+
+        calls: list[tuple[str, tuple[Any, ...]]] = []
+        conn = ClientConnection("/nonexistent")
+        pointer = conn.create_proxy(WlPointer)
+
+        def first(*args: Any) -> bool:
+            calls.append(("first", args))
+            return True
+
+        sub_first = pointer.subscribe("motion", first)
+        self.assertIs(
+            pointer._handler_get(OpCode(2)), first
+        )  # single handler is not wrapped
+        sub_once = pointer.subscribe("motion", once)
+        with self.assertLogs(level="ERROR"):
+            pointer.subscribe("motion", fails)
+            dispatch(0, 1.0, 2.0)
+        dispatch(1, 3.0, 4.0)
+        self.assertEqual(
+            calls,
+            [
+                ("first", (0, 1.0, 2.0)),
+                ("once", (0, 1.0, 2.0)),
+                ("first", (1, 3.0, 4.0)),
+            ],
+        )
+        self.assertTrue(sub_first.is_active)
+        self.assertFalse(sub_once.is_active)
+        sub_once.cancel()  # no-op
+
+        sub_first.cancel()
+        self.assertFalse(sub_first.is_active)
+        self.assertIsNone(pointer._handler_get(OpCode(2)))
+
+        # `on` replaces all subscribers
+        with pointer.subscribe("motion", first) as sub:
+            pointer.on_motion(once)
+            self.assertFalse(sub.is_active)
+        self.assertIs(pointer._handler_get(OpCode(2)), once)
+
+    def test_lazy_allocation(self) -> None:
+        conn = ClientConnection("/nonexistent")
+        region = conn.create_proxy(WlRegion)
+        self.assertIsNone(region._handlers)
+        self.assertIsNone(region._futures)
+
+        # dispatch without handlers does not allocate them
+        pointer = conn.create_proxy(WlPointer)
+        opcode, _ = pointer.interface.events_by_name["frame"]
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            pointer._dispatch(opcode, ())
+        self.assertIn("unhandled", err.getvalue())
+        self.assertIsNone(pointer._handlers)
+
+        pointer.on_frame(lambda: False)
+        self.assertEqual(len(pointer._handlers or []), len(pointer.interface.events))
+        pointer._dispatch(opcode, ())
+        self.assertIsNone(pointer._handler_get(opcode))
+        pointer._reset(pointer._id)
+        self.assertIsNone(pointer._handlers)
+
+    def test_proxy_table(self) -> None:
+        conn = ClientConnection("/nonexistent")
+        table = ProxyTable()
+        surf, pointer = WlSurface(Id(5), conn), WlPointer(Id(SERVER_ID_MIN + 1), conn)
+        table[surf._id] = surf
+        table[pointer._id] = pointer
+        self.assertEqual(len(table), 2)
+        self.assertIs(table.get(5), surf)
+        self.assertIs(table._client[5], surf)  # client ids index the list
+        self.assertIs(table.get(SERVER_ID_MIN + 1), pointer)
+        self.assertIsNone(table.get(4))
+        self.assertIsNone(table.get(1000))
+        self.assertIn(5, table)
+        self.assertNotIn(SERVER_ID_MIN, table)
+        self.assertEqual(table.values(), [surf, pointer])
+
+        self.assertIs(table.pop(5), surf)
+        self.assertIsNone(table.pop(5))
+        self.assertIs(table.pop(SERVER_ID_MIN + 1), pointer)
+        self.assertEqual(len(table), 0)
+        table[5] = surf
+        table.clear()
+        self.assertEqual((len(table), table._client), (0, [None]))
+
+    async def test_on_async(self) -> None:
+        def motion(*args: Any) -> bool:
+            calls.append(args)
+            return True
+
+        calls: list[tuple[Any, ...]] = []
+        conn = ClientConnection("/nonexistent")
+        pointer = conn.create_proxy(WlPointer)
+        opcode, _ = pointer.interface.events_by_name["motion"]
+
+        # existing subscriber is kept, and future is unsubscribed once resolved
+        pointer.on_motion(motion)
+        future = pointer.on_async("motion")
+        pointer._dispatch(opcode, (0, 1.0, 2.0))
+        self.assertEqual(await future, (0, 1.0, 2.0))
+        pointer._dispatch(opcode, (1, 3.0, 4.0))
+        self.assertEqual(calls, [(0, 1.0, 2.0), (1, 3.0, 4.0)])
+
+        # cancelled future is unsubscribed as well
+        future = pointer.on_async("motion")
+        future.cancel()
+        await asyncio.sleep(0)
+        fanout = pointer._handler_get(opcode)
+        assert isinstance(fanout, _EventFanout)
+        self.assertEqual(fanout.handlers, [motion])
+        pointer._dispatch(opcode, (2, 5.0, 6.0))
+        self.assertEqual(len(calls), 3)
+
+
+class TestBench(unittest.TestCase):
+    def test_main(self) -> None:
+        # benchmarks themselves are run by `make bench`
+        argv = ["bench", "--count", "4", "lookup"]
+        with (
+            patch.object(sys, "argv", argv),
+            contextlib.redirect_stdout(io.StringIO()) as out,
+        ):
+            bench_main()
+        self.assertIn("lookup (count=4)", out.getvalue())
+        self.assertIn("ns/op", out.getvalue())
+
+        argv = ["bench", "lookup", "nonexistent"]
+        with (
+            patch.object(sys, "argv", argv),
+            contextlib.redirect_stderr(io.StringIO()) as err,
+        ):
+            with self.assertRaises(SystemExit):
+                bench_main()
+        self.assertIn("unknown benchmark: nonexistent", err.getvalue())
+
+
+class TestInput(unittest.TestCase):
+    def test_pointer_coalescer(self) -> None:
+        def on_frame(frame: PointerFrame) -> bool:
+            frames.append(frame)
+            return len(frames) < 2
+
+        def dispatch(name: str, *args: Any) -> None:
+            opcode, _ = pointer.interface.events_by_name[name]
+            pointer._dispatch(opcode, args)
+
+        frames: list[PointerFrame] = []
+        conn = ClientConnection("/nonexistent")
+        pointer = conn.create_proxy(WlPointer)
+        surface = conn.create_proxy(WlSurface)
+        PointerCoalescer(pointer, on_frame)
+
+        dispatch("enter", 1, surface, 1.0, 2.0)
+        for index in range(100):
+            dispatch("motion", index, float(index), 2.0 * index)
+        dispatch("axis", 100, WlPointer.Axis.VERTICAL_SCROLL, 1.5)
+        dispatch("axis", 101, WlPointer.Axis.VERTICAL_SCROLL, 2.5)
+        dispatch("button", 2, 102, 272, WlPointer.ButtonState.PRESSED)
+        self.assertEqual(frames, [])
+        dispatch("frame")
+        self.assertEqual(len(frames), 1)
+        frame = frames[0]
+        self.assertIs(frame.surface, surface)
+        self.assertIs(frame.entered, surface)
+        self.assertEqual((frame.x, frame.y, frame.motions), (99.0, 198.0, 100))
+        self.assertEqual(frame.axis, [4.0, 0.0])
+        self.assertEqual(frame.buttons, [(272, WlPointer.ButtonState.PRESSED)])
+        self.assertEqual((frame.serial, frame.time), (2, 102))
+
+        # position and focus are carried over to the next frame
+        dispatch("leave", 3, surface)
+        dispatch("frame")
+        frame = frames[1]
+        self.assertIsNone(frame.surface)
+        self.assertIs(frame.left, surface)
+        self.assertEqual((frame.x, frame.y, frame.motions), (99.0, 198.0, 0))
+
+        # handler has returned False
+        dispatch("motion", 0, 0.0, 0.0)
+        dispatch("frame")
+        self.assertEqual(len(frames), 2)
+
+    def test_touch_coalescer(self) -> None:
+        def on_frame(frame: TouchFrame) -> bool:
+            frames.append(frame)
+            return True
+
+        def dispatch(name: str, *args: Any) -> None:
+            opcode, _ = touch.interface.events_by_name[name]
+            touch._dispatch(opcode, args)
+
+        frames: list[TouchFrame] = []
+        conn = ClientConnection("/nonexistent")
+        touch = conn.create_proxy(WlTouch)
+        surface = conn.create_proxy(WlSurface)
+        TouchCoalescer(touch, on_frame)
+
+        dispatch("down", 1, 0, surface, 0, 1.0, 1.0)
+        dispatch("down", 2, 0, surface, 1, 5.0, 5.0)
+        dispatch("frame")
+        self.assertEqual(sorted(frames[0].points), [0, 1])
+        self.assertTrue(all(point.down for point in frames[0].points.values()))
+
+        for index in range(10):
+            dispatch("motion", index, 0, 1.0 + index, 1.0)
+        dispatch("up", 3, 10, 1)
+        dispatch("frame")
+        points = frames[1].points
+        self.assertEqual(
+            (points[0].x, points[0].motions, points[0].down), (10.0, 10, False)
+        )
+        self.assertTrue(points[1].up)
+        self.assertEqual(frames[0].points[0].x, 1.0)
+
+        dispatch("motion", 11, 1, 0.0, 0.0)  # point has already gone
+        dispatch("cancel")
+        self.assertTrue(frames[2].cancelled)
+        self.assertEqual(frames[2].points, {})
+
 
 class TestClient(unittest.IsolatedAsyncioTestCase):
     async def test_client_basic(self) -> None:
@@ -161,6 +657,790 @@ class TestClient(unittest.IsolatedAsyncioTestCase):
         client.terminate()
         server.terminate()
 
+    async def test_read_burst(self) -> None:
+        server, client = await create_connection_pair({})
+        registry = server._proxies[Id(2)]
+        long_name = "x" * 8192  # does not fit into initial read buffer
+        for name in range(1000):
+            registry("global", 100 + name, f"burst_{name}", 1)
+        registry("global", 2000, long_name, 1)
+        await client.sync()
+
+        names = {desc.iface_name for desc in client.all_globals()}
+        self.assertEqual(len(names), 1001)
+        self.assertIn(long_name, names)
+        self.assertEqual(client._read_start, client._read_end)
+        self.assertGreater(len(client._read_buff), len(long_name))
+        stats = client.read_stats
+        self.assertGreater(stats.bytes, len(long_name))
+        self.assertGreater(stats.bytes_per_syscall, 0)
+        self.assertEqual(stats.buffer_size, len(client._read_buff))
+
+        client.terminate()
+        server.terminate()
+
+    async def test_globals(self) -> None:
+        def bind(_: Proxy) -> None:
+            pass
+
+        server, client = await create_connection_pair({"wl_compositor": bind})
+        registry = server._proxies[Id(2)]
+
+        # bound proxies are cached
+        wl_compositor = client.get_global(WlCompositor)
+        self.assertIs(client.get_global(WlCompositor), wl_compositor)
+        self.assertIn("wl_compositor", client._registry_cache)
+        self.assertIs(await client.wait_global(WlCompositor), wl_compositor)
+
+        # waiting for hotplugged global
+        wait_seat = asyncio.ensure_future(client.wait_global(WlSeat, 1.0))
+        await client.sync()
+        self.assertFalse(wait_seat.done())
+        server.binds["wl_seat"] = bind
+        registry("global", 5, "wl_seat", 7)
+        wl_seat = await wait_seat
+        self.assertIsInstance(wl_seat, WlSeat)
+        self.assertEqual(client.get_globals(WlSeat), [wl_seat])
+        self.assertFalse(client._registry_waiters)
+
+        registry("global_remove", 5)
+        await client.sync()
+        self.assertEqual(client.get_globals(WlSeat), [])
+        self.assertTrue(wl_seat._is_detached)
+        with self.assertRaises(TimeoutError):
+            await client.wait_global(WlSeat, 0.01)
+
+        # termination ends waiting
+        wait_seat = asyncio.ensure_future(client.wait_global(WlSeat))
+        await asyncio.sleep(0)
+        client.terminate()
+        with self.assertRaises(RuntimeError):
+            await wait_seat
+        await server.on_terminated()
+
+    async def test_write_fds(self) -> None:
+        def wl_shm_bind(proxy: Proxy) -> None:
+            def on_create_pool(pool: Proxy, fd: FdFile, size: int) -> bool:
+                sizes.append((os.fstat(fd.fileno()).st_size, size))
+                fd.close()
+                return True
+
+            proxy.on("create_pool", on_create_pool)
+
+        sizes: list[tuple[int, int]] = []
+        server, client = await create_connection_pair({"wl_shm": wl_shm_bind})
+        wl_shm = client.get_global(WlShm)
+        mems = [SharedMemory(size) for size in range(1, 101)]
+        for mem in mems:
+            wl_shm.create_pool(mem, len(mem.buf))
+        await client.sync()
+
+        self.assertEqual(sizes, [(size, size) for size in range(1, 101)])
+        self.assertFalse(client._write_queue)
+
+        for mem in mems:
+            mem.close()
+        client.terminate()
+        server.terminate()
+
+    async def test_eager_flush(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("commit", on_commit)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        def on_commit() -> bool:
+            commits.append(loop.time())
+            return True
+
+        loop = asyncio.get_running_loop()
+        commits: list[float] = []
+        server, client = await create_connection_pair(
+            {"wl_compositor": wl_compositor_bind},
+            eager_flush=True,
+        )
+        wl_surf = client.get_global(WlCompositor).create_surface()
+        with patch.object(loop, "add_writer") as add_writer:
+            for _ in range(10):
+                wl_surf.commit()
+            self.assertTrue(client._write_queue)
+            await client.flush()
+            self.assertFalse(client._write_queue)
+            add_writer.assert_not_called()
+        await client.sync()
+        self.assertEqual(len(commits), 10)
+
+        client.terminate()
+        server.terminate()
+
+    async def test_batch(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("damage_buffer", ignore)
+                surf.on("commit", on_commit)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        commits = 0
+
+        def on_commit() -> bool:
+            nonlocal commits
+            commits += 1
+            return True
+
+        server, client = await create_connection_pair(
+            {"wl_compositor": wl_compositor_bind}
+        )
+        wl_surf = client.get_global(WlCompositor).create_surface()
+        await client.sync()
+
+        def sendmsg(sock: socket.socket, *args: Any) -> int:
+            if sock is client._socket:
+                client_calls.append(args)
+            return socket_sendmsg(sock, *args)
+
+        client_calls: list[tuple[Any, ...]] = []
+        socket_sendmsg = socket.socket.sendmsg
+        with patch.object(socket.socket, "sendmsg", sendmsg):
+            with client.batch():
+                for index in range(100):
+                    wl_surf.damage_buffer(index, index, 1, 1)
+                    wl_surf.commit()
+                self.assertEqual(len(client._write_queue), 200)
+            self.assertFalse(client._write_queue)
+        self.assertEqual(len(client_calls), 1)
+
+        async with client.batch():
+            wl_surf.commit()
+        self.assertFalse(client._write_queue)
+
+        await client.sync()
+        self.assertEqual(commits, 101)
+
+        client.terminate()
+        server.terminate()
+
+    async def test_drain(self) -> None:
+        server, client = await create_connection_pair({})
+        client.set_write_buffer_limits(high=4096)
+        self.assertEqual(client.get_write_buffer_limits(), (1024, 4096))
+
+        # server stops reading, so client queue grows above high-water mark
+        server._reader_disable()
+        for _ in range(1000):
+            for _ in range(1000):
+                client.display.sync().on_done(lambda _: False)
+            await asyncio.sleep(0.001)
+            if client.get_write_buffer_size() > 4096:
+                break
+        self.assertGreater(client.get_write_buffer_size(), 4096)
+        drain = asyncio.ensure_future(client.drain())
+        await asyncio.sleep(0.01)
+        self.assertFalse(drain.done())
+
+        server._reader_enable()
+        await asyncio.wait_for(drain, 1.0)
+        self.assertLessEqual(client.get_write_buffer_size(), 1024)
+
+        client.terminate()
+        server.terminate()
+
+    async def test_blocking_client(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("commit", on_commit)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        commits = 0
+
+        def on_commit() -> bool:
+            nonlocal commits
+            commits += 1
+            return True
+
+        def client_run(path: str) -> set[str]:
+            async def batch_commit() -> None:
+                # inherited coroutines block instead of waiting on a loop
+                compositor = await client.wait_global(WlCompositor, 1.0)
+                async with client.batch():
+                    compositor.create_surface().commit()
+                await client.sync()
+
+            with BlockingClientConnection(path) as client:
+                wl_surf = client.get_global(WlCompositor).create_surface()
+                for _ in range(10):
+                    wl_surf.commit()
+                client.roundtrip()
+                self.assertFalse(client.dispatch_pending())
+                asyncio.run(batch_commit())
+                return {desc.iface_name for desc in client.all_globals()}
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "wayland-test")
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.bind(path)
+                sock.listen()
+                server = ServerConnection(sock, {"wl_compositor": wl_compositor_bind})
+                server_connect = asyncio.ensure_future(server.connect())
+                globals = await asyncio.to_thread(client_run, path)
+                await server_connect
+
+        self.assertEqual(globals, {"wl_compositor"})
+        self.assertEqual(commits, 11)
+        server.terminate()
+
+    async def test_threaded_client(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("commit", on_commit)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        commits = 0
+
+        def on_commit() -> bool:
+            nonlocal commits
+            commits += 1
+            return True
+
+        def commit_many(surf: WlSurface) -> None:
+            for _ in range(100):
+                surf.commit()
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "wayland-test")
+            client = ThreadedClientConnection(path)
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.bind(path)
+                sock.listen()
+                server = ServerConnection(sock, {"wl_compositor": wl_compositor_bind})
+                await asyncio.gather(client.connect(), server.connect())
+
+        wl_surf = client.get_global(WlCompositor).create_surface()
+        await client.sync()
+        # requests are submitted from multiple threads at once
+        await asyncio.gather(
+            *(asyncio.to_thread(commit_many, wl_surf) for _ in range(4))
+        )
+        await client.flush()
+        await client.sync()
+        self.assertEqual(commits, 400)
+        self.assertGreater(client.read_stats.bytes, 0)
+
+        client.terminate()
+        assert client._io_thread is not None
+        self.assertFalse(client._io_thread.is_alive())
+        await server.on_terminated()
+
+    async def test_thread_safe(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf_ids.append(surf._id)
+                surf.on("commit", on_commit)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        commits = 0
+
+        def on_commit() -> bool:
+            nonlocal commits
+            commits += 1
+            return True
+
+        def hammer(wl_compositor: WlCompositor) -> None:
+            for _ in range(50):
+                wl_surf = wl_compositor.create_surface()
+                wl_surf.on_enter(ignore)
+                wl_surf.commit()
+                wl_surf.commit()
+
+        surf_ids: list[Id] = []
+        server, client = await create_connection_pair(
+            {"wl_compositor": wl_compositor_bind},
+            thread_safe=True,
+        )
+        self.assertTrue(client.is_thread_safe)
+        wl_compositor = client.get_global(WlCompositor)
+        await asyncio.gather(
+            *(asyncio.to_thread(hammer, wl_compositor) for _ in range(8))
+        )
+        await client.sync()
+        self.assertEqual(commits, 800)
+        # new ids must reach the server in allocation order
+        self.assertEqual(len(surf_ids), 400)
+        self.assertEqual(surf_ids, sorted(surf_ids))
+        self.assertEqual(len(set(surf_ids)), 400)
+
+        client.terminate()
+        await server.on_terminated()
+
+    async def test_thread_safe_batch(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("commit", on_commit)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        commits = 0
+
+        def on_commit() -> bool:
+            nonlocal commits
+            commits += 1
+            return True
+
+        def batch_many(wl_surf: WlSurface) -> None:
+            barrier.wait()
+            for _ in range(50):
+                with client.batch():
+                    wl_surf.commit()
+                    with client.batch():
+                        wl_surf.commit()
+
+        def batch_hold(wl_surf: WlSurface) -> None:
+            with client.batch():
+                wl_surf.commit()
+                held.set()
+                release.wait()
+
+        server, client = await create_connection_pair(
+            {"wl_compositor": wl_compositor_bind},
+            thread_safe=True,
+        )
+        wl_compositor = client.get_global(WlCompositor)
+        surfaces = [wl_compositor.create_surface() for _ in range(8)]
+        barrier = threading.Barrier(len(surfaces))
+        await asyncio.gather(*(asyncio.to_thread(batch_many, s) for s in surfaces))
+        await asyncio.wait_for(client.sync(), 1.0)
+        self.assertEqual(commits, 800)
+
+        # batch open in another thread does not hold back requests of the loop
+        held, release = threading.Event(), threading.Event()
+        hold = asyncio.ensure_future(asyncio.to_thread(batch_hold, surfaces[0]))
+        await asyncio.to_thread(held.wait)
+        surfaces[1].commit()
+        await asyncio.wait_for(client.sync(), 1.0)
+        self.assertGreaterEqual(commits, 801)
+        release.set()
+        await hold
+        await asyncio.wait_for(client.sync(), 1.0)
+        self.assertEqual(commits, 802)
+
+        client.terminate()
+        await server.on_terminated()
+
+    async def test_event_queue(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("frame", on_frame)
+                surfaces.append(surf)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        def on_frame(callback: Proxy) -> bool:
+            callback("done", server.serial_next())
+            server.display("delete_id", callback._id)
+            server._delete_proxy(callback)
+            return True
+
+        def on_done(value: int) -> bool:
+            done.append(value)
+            return False
+
+        done: list[int] = []
+        surfaces: list[Proxy] = []
+        server, client = await create_connection_pair(
+            {"wl_compositor": wl_compositor_bind}
+        )
+        queue = client.event_queue("render")
+        self.assertIs(client.event_queue("render"), queue)
+        wl_surf = client.get_global(WlCompositor).create_surface()
+        wl_surf.set_queue(queue)
+
+        # events are held until the queue is drained, together with
+        # deletion of the proxy that has been sent right after them
+        callback = wl_surf.frame()
+        callback.on_done(on_done)
+        await client.sync()
+        self.assertEqual(done, [])
+        self.assertEqual(len(queue), 2)
+        self.assertFalse(callback._is_detached)
+        self.assertEqual(queue.dispatch_pending(), 1)
+        self.assertEqual(len(done), 1)
+        self.assertTrue(callback._is_detached)
+
+        wl_surf.frame().on_done(on_done)
+        self.assertEqual(await queue.dispatch(), 1)
+        self.assertEqual(len(done), 2)
+
+        # events of proxies destroyed by the client are dropped
+        wl_surf.on_preferred_buffer_scale(on_done)
+        surfaces[-1]("preferred_buffer_scale", 2)
+        await client.sync()
+        self.assertEqual(len(queue), 1)
+        wl_surf.destroy()
+        self.assertEqual(queue.dispatch_pending(), 0)
+        self.assertEqual(len(done), 2)
+        wl_surf = client.get_global(WlCompositor).create_surface()
+        wl_surf.set_queue(queue)
+
+        # events of proxies without queue are dispatched immediately
+        wl_surf.set_queue(None)
+        wl_surf.frame().on_done(on_done)
+        await client.sync()
+        self.assertEqual(len(done), 3)
+        self.assertEqual(len(queue), 0)
+
+        client.terminate()
+        with self.assertRaises(RuntimeError):
+            await queue.dispatch()
+        await server.on_terminated()
+
+    async def test_event_stream(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("commit", lambda: on_commit(surf))
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        commits = 0
+
+        def on_commit(surf: Proxy) -> bool:
+            nonlocal commits
+            commits += 1
+            surf("preferred_buffer_scale", commits)
+            return True
+
+        server, client = await create_connection_pair(
+            {"wl_compositor": wl_compositor_bind}
+        )
+        wl_surf = client.get_global(WlCompositor).create_surface()
+
+        async def scales(overflow: EventOverflow) -> tuple[list[int], int]:
+            stream = wl_surf.events("preferred_buffer_scale", 4, overflow)
+            for _ in range(10):
+                wl_surf.commit()
+            await client.sync()
+            stream.close()
+            return [scale async for scale, in stream], stream.dropped
+
+        self.assertEqual(await scales(EventOverflow.DROP_OLDEST), ([7, 8, 9, 10], 6))
+        self.assertEqual(await scales(EventOverflow.COALESCE), ([11, 12, 13, 20], 6))
+
+        # reading is paused until the stream is consumed
+        async with wl_surf.events(
+            "preferred_buffer_scale", 4, EventOverflow.BLOCK
+        ) as stream:
+            for _ in range(10):
+                wl_surf.commit()
+            sync = asyncio.ensure_future(client.sync())
+            while len(stream) < 4:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.01)
+            self.assertEqual(client._read_paused, 1)
+            self.assertFalse(sync.done())
+            received: list[int] = []
+            async for (scale,) in stream:
+                received.append(scale)
+                if len(received) == 10:
+                    break
+            await sync
+        self.assertEqual(received, list(range(21, 31)))
+        self.assertEqual(client._read_paused, 0)
+
+        client.terminate()
+        await server.on_terminated()
+
+    async def test_event_stream_block(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("commit", lambda: on_commit(surf))
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        def on_commit(surf: Proxy) -> bool:
+            for scale in range(count):
+                surf("preferred_buffer_scale", scale)
+            return True
+
+        async def consume(stream: EventStream, size: int) -> list[int]:
+            return [(await stream.__anext__())[0] for _ in range(size)]
+
+        def blocking_run(path: str) -> list[int]:
+            with BlockingClientConnection(path) as client:
+                wl_surf = client.get_global(WlCompositor).create_surface()
+                stream = wl_surf.events(
+                    "preferred_buffer_scale", 4, EventOverflow.BLOCK
+                )
+                wl_surf.commit()
+                client.flush_sync()
+                while not client._read_paused:
+                    client.dispatch_pending(None)
+                # socket is not read while paused, and waiting would never end
+                self.assertFalse(client.dispatch_pending())
+                with self.assertRaises(RuntimeError):
+                    client.dispatch_pending(None)
+                scales = asyncio.run(consume(stream, 4))
+                while len(scales) < count:
+                    client.dispatch_pending(None)
+                    scales.extend(asyncio.run(consume(stream, len(stream))))
+                stream.close()
+                client.roundtrip()
+                return scales
+
+        count = 64
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "wayland-test")
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.bind(path)
+                sock.listen()
+                server = ServerConnection(sock, {"wl_compositor": wl_compositor_bind})
+                server_connect = asyncio.ensure_future(server.connect())
+                scales = await asyncio.to_thread(blocking_run, path)
+                await server_connect
+        self.assertEqual(scales, list(range(count)))
+        server.terminate()
+
+        # I/O thread stops reading while paused
+        count = 4096
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "wayland-test")
+            client = ThreadedClientConnection(path)
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.bind(path)
+                sock.listen()
+                server = ServerConnection(sock, {"wl_compositor": wl_compositor_bind})
+                await asyncio.gather(client.connect(), server.connect())
+        wl_surf = client.get_global(WlCompositor).create_surface()
+        async with wl_surf.events(
+            "preferred_buffer_scale", 4, EventOverflow.BLOCK
+        ) as stream:
+            wl_surf.commit()
+            while not client._io_stalled:
+                await asyncio.sleep(0.01)
+            self.assertEqual(client._read_paused, 1)
+            self.assertLessEqual(len(client._read_buff), 2 * READ_BUFF_MAX)
+            received: list[int] = []
+            async for (scale,) in stream:
+                received.append(scale)
+                if len(received) == count:
+                    break
+        self.assertEqual(received, list(range(count)))
+        self.assertEqual(client._read_paused, 0)
+
+        client.terminate()
+        await server.on_terminated()
+
+    async def test_shm_swapchain(self) -> None:
+        def wl_shm_bind(proxy: Proxy) -> None:
+            def on_create_pool(pool: Proxy, fd: FdFile, size: int) -> bool:
+                def on_resize(size: int) -> bool:
+                    pool_sizes.append(size)
+                    return True
+
+                pool_sizes.append(size)
+                fd.close()
+                pool.on("create_buffer", on_create_buffer)
+                pool.on("resize", on_resize)
+                pool.on("destroy", ignore)
+                return True
+
+            proxy.on("create_pool", on_create_pool)
+
+        def on_create_buffer(buff: Proxy, offset: int, *_: Any) -> bool:
+            def on_destroy() -> bool:
+                destroyed.append(offset)
+                return True
+
+            buffers[buff._id] = buff
+            buff.on("destroy", on_destroy)
+            return True
+
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("attach", ignore)
+                surf.on("damage_buffer", ignore)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        pool_sizes: list[int] = []
+        buffers: dict[Id, Proxy] = {}
+        destroyed: list[int] = []
+        server, client = await create_connection_pair(
+            {"wl_shm": wl_shm_bind, "wl_compositor": wl_compositor_bind}
+        )
+        wl_surf = client.get_global(WlCompositor).create_surface()
+        swapchain = ShmSwapchain(client.get_global(WlShm), 4, 2)
+        self.assertEqual(swapchain.size, 32)
+
+        # buffers are created while all of them are busy, and pool grows
+        acquired: list[ShmBuffer] = []
+        for _ in range(3):
+            buffer = swapchain.acquire()
+            assert buffer is not None
+            self.assertEqual(buffer.age, 0)
+            with buffer.data as data:
+                data[:] = bytes([len(acquired)]) * swapchain.size
+            swapchain.attach(wl_surf, buffer)
+            acquired.append(buffer)
+        self.assertIsNone(swapchain.acquire())
+        self.assertEqual([buffer.age for buffer in acquired], [3, 2, 1])
+        with self.assertRaises(ValueError):
+            swapchain.attach(wl_surf, acquired[0])
+        await client.sync()
+        self.assertEqual(pool_sizes, [64, 128])
+        self.assertEqual(len(buffers), 3)
+        with acquired[0].data as data:
+            self.assertEqual(bytes(data), bytes(swapchain.size))
+
+        # released buffer with the most recent content is reused
+        buffers[acquired[0].wl_buffer._id]("release")
+        buffers[acquired[1].wl_buffer._id]("release")
+        await client.sync()
+        self.assertIs(swapchain.acquire(), acquired[1])
+
+        # busy buffers are destroyed once released, and new buffers are
+        # placed after them in the same pool
+        self.assertTrue(swapchain.resize(8, 2))
+        self.assertFalse(swapchain.resize(8, 2))
+        buffer = swapchain.acquire()
+        assert buffer is not None
+        self.assertEqual((buffer.offset, buffer.size), (96, 64))
+        await client.sync()
+        self.assertEqual(sorted(destroyed), [0, 32])
+        buffers[acquired[2].wl_buffer._id]("release")
+        await client.sync()
+        self.assertEqual(sorted(destroyed), [0, 32, 64])
+        self.assertEqual(pool_sizes, [64, 128, 256])
+        with self.assertRaises(RuntimeError):
+            acquired[2].data
+
+        # space of released buffers is reused
+        self.assertTrue(swapchain.resize(4, 4))
+        buffer = swapchain.acquire()
+        assert buffer is not None
+        self.assertEqual(buffer.offset, 0)
+
+        swapchain.close()
+        with self.assertRaises(RuntimeError):
+            swapchain.acquire()
+        await client.sync()
+        self.assertEqual(pool_sizes, [64, 128, 256])
+        client.terminate()
+        await server.on_terminated()
+
+    def test_shared_memory_resize(self) -> None:
+        memory = SharedMemory(16)
+        memory.buf[:4] = b"\x01\x02\x03\x04"
+        memory.resize(1 << 20)
+        self.assertEqual(len(memory), 1 << 20)
+        self.assertEqual(os.fstat(memory.fileno()).st_size, 1 << 20)
+        self.assertEqual(bytes(memory.buf[:4]), b"\x01\x02\x03\x04")
+        with memoryview(memory.buf), self.assertRaises(BufferError):
+            memory.resize(8)
+        memory.resize(8)
+        self.assertEqual(os.fstat(memory.fileno()).st_size, 8)
+        memory.close()
+        with self.assertRaises(RuntimeError):
+            memory.resize(16)
+
+    @unittest.skipUnless(hasattr(os, "memfd_create"), "memfd_create is required")
+    def test_shared_memory_memfd(self) -> None:
+        import fcntl
+
+        memory = SharedMemory(4096, seal=True)
+        fd = memory.fileno()
+        self.assertTrue(os.readlink(f"/proc/self/fd/{fd}").startswith("/memfd:"))
+        self.assertFalse(os.get_inheritable(fd))
+        seals = fcntl.fcntl(fd, fcntl.F_GET_SEALS)
+        self.assertEqual(seals, fcntl.F_SEAL_SHRINK)
+        memory.resize(8192)
+        self.assertEqual(os.fstat(fd).st_size, 8192)
+        with self.assertRaises(PermissionError):
+            memory.resize(4096)
+        self.assertEqual(len(memory), 8192)
+        memory.close()
+
+        memory = SharedMemory(4096)
+        self.assertEqual(fcntl.fcntl(memory.fileno(), fcntl.F_GET_SEALS), 0)
+        memory.close()
+
+        # huge pages are not available, normal pages are used instead
+        memfd_create = os.memfd_create
+
+        def memfd_create_nohuge(name: str, flags: int) -> int:
+            if flags & os.MFD_HUGETLB:
+                raise OSError(22, "Invalid argument")
+            return memfd_create(name, flags)
+
+        size = HUGE_PAGE_SIZE + 4096
+        with patch("os.memfd_create", memfd_create_nohuge):
+            memory = SharedMemory(size, hugetlb=True)
+        self.assertEqual(len(memory), size)
+        memory.resize(size + 1)
+        self.assertEqual(len(memory), size + 1)
+        memory.close()
+
+    async def test_frame_scheduler(self) -> None:
+        def wl_compositor_bind(proxy: Proxy) -> None:
+            def on_create_surface(surf: Proxy) -> bool:
+                surf.on("frame", on_frame)
+                surf.on("commit", on_commit)
+                return True
+
+            proxy.on("create_surface", on_create_surface)
+
+        def on_frame(callback: Proxy) -> bool:
+            callbacks.append(callback)
+            return True
+
+        def on_commit() -> bool:
+            while callbacks:
+                callback = callbacks.pop()
+                callback("done", timestamps.pop(0))
+                server.display("delete_id", callback._id)
+                server._delete_proxy(callback)
+            return True
+
+        callbacks: list[Proxy] = []
+        timestamps = [16, 32, 48, 96, 112]
+        server, client = await create_connection_pair(
+            {"wl_compositor": wl_compositor_bind}
+        )
+        wl_surf = client.get_global(WlCompositor).create_surface()
+
+        frames: list[int] = []
+        callback_objects: set[int] = set()
+        scheduler = FrameScheduler(wl_surf)
+        async for timestamp in scheduler:
+            self.assertEqual(scheduler.ready, [wl_surf])
+            callback_objects.add(id(scheduler._pending[wl_surf]))
+            frames.append(timestamp)
+            if len(frames) == 5:
+                break
+            wl_surf.commit()
+
+        self.assertEqual(frames, [0, 16, 32, 48, 96])
+        self.assertEqual(len(callback_objects), 1)  # callback proxy is reused
+        self.assertEqual(scheduler.missed, 2)
+        self.assertEqual(scheduler.interval, 16.0)
+
+        client.terminate()
+        with self.assertRaises(StopAsyncIteration):
+            await anext(scheduler)
+        await server.on_terminated()
+
 
 def ignore(*_: Any) -> bool:
     return True
@@ -168,11 +1448,15 @@ def ignore(*_: Any) -> bool:
 
 async def create_connection_pair(
     binds: dict[str, Callable[[Proxy], Any]],
+    eager_flush: bool = False,
+    thread_safe: bool = False,
 ) -> tuple[ServerConnection, ClientConnection]:
     """Create wayland server/client connection pair"""
     with tempfile.TemporaryDirectory() as tempdir:
         path = os.path.join(tempdir, "wayland-test")
-        client = ClientConnection(path)
+        client = ClientConnection(
+            path, eager_flush=eager_flush, thread_safe=thread_safe
+        )
         with socket.socket(socket.AF_UNIX) as sock:
             sock.bind(path)
             sock.listen()